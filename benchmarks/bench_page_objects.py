@@ -0,0 +1,98 @@
+import pytest
+from pages.admin_dashboard_page import AdminDashboardPage
+from pages.admin_login_page import AdminLoginPage
+from pages.admin_order_page import AdminOrderPage
+from pages.admin_product_page import AdminProductPage
+
+
+@pytest.mark.benchmark
+class TestPageObjectBenchmarks:
+    """Times core page-object operations (best run with --standin for stable numbers)."""
+
+    @pytest.fixture()
+    def dashboard(self, driver, admin_auth, admin_url, admin_credentials) -> AdminDashboardPage:
+        """Logged-in dashboard page object (cached session)."""
+        admin_auth.login(driver, admin_url, *admin_credentials)
+        return AdminDashboardPage(driver)
+
+    @pytest.fixture()
+    def products(self, driver, dashboard) -> AdminProductPage:
+        """Products page object on the product list."""
+        dashboard.open_products()
+        return AdminProductPage(driver)
+
+    @pytest.fixture()
+    def orders(self, driver, dashboard) -> AdminOrderPage:
+        """Orders page object on the order list."""
+        dashboard.open_orders()
+        return AdminOrderPage(driver)
+
+    # -------------------------
+    # Login / navigation
+    # -------------------------
+    def test_login_as(self, bench, driver, admin_url, admin_credentials):
+        login = AdminLoginPage(driver)
+
+        def setup():
+            driver.delete_all_cookies()
+            login.open(admin_url)
+
+        def login_as():
+            login.login_as(*admin_credentials)
+            login.wait_for_user_token()
+
+        bench.measure("login.login_as", driver, login_as, setup=setup)
+
+    def test_open_products(self, bench, driver, dashboard):
+        bench.measure("dashboard.open_products", driver, dashboard.open_products)
+
+    # -------------------------
+    # Products
+    # -------------------------
+    def test_search_by_name(self, bench, driver, dashboard, products):
+        name = products.table().rows[0].cell(products.NAME_COLUMN)
+        bench.measure(
+            "products.search_by_name", driver, lambda: products.search_by_name(name), setup=dashboard.open_products
+        )
+
+    def test_open_edit(self, bench, driver, dashboard, products):
+        name = products.table().rows[0].cell(products.NAME_COLUMN)
+
+        def setup():
+            dashboard.open_products()
+            products.invalidate_table()
+
+        bench.measure("products.open_edit", driver, lambda: products.open_edit(name), setup=setup)
+
+    def test_save(self, bench, driver, dashboard, products):
+        name = products.table().rows[0].cell(products.NAME_COLUMN)
+
+        def setup():
+            dashboard.open_products()
+            products.invalidate_table()
+            products.open_edit(name)
+
+        def save():
+            products.save()
+            products.wait_success_message()
+
+        bench.measure("products.save", driver, save, setup=setup)
+
+    # -------------------------
+    # Orders
+    # -------------------------
+    def test_filter_by_order_id(self, bench, driver, dashboard, orders):
+        order_id = orders.get_first_order_id()
+        bench.measure(
+            "orders.filter_by_order_id", driver, lambda: orders.filter_by_order_id(order_id),
+            setup=dashboard.open_orders,
+        )
+
+    def test_open_order(self, bench, driver, dashboard, orders):
+        order_id = orders.get_first_order_id()
+
+        def setup():
+            dashboard.open_orders()
+            orders.invalidate_table()
+
+        bench.measure("orders.open_order", driver, lambda: orders.open_order(order_id), setup=setup)
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from utils.benchmark import Benchmark, BenchmarkBaseline
+
+
+benchmark_key = pytest.StashKey[Benchmark]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks", "Page-object micro-benchmarks")
+    group.addoption("--bench-iterations", type=int, default=10,
+                    help="Timed rounds per page-object operation (after one warm-up round).")
+    group.addoption("--bench-baseline", default=os.path.join("benchmarks", "baseline.json"),
+                    help="Baseline JSON the results are compared against.")
+    group.addoption("--bench-threshold", type=float, default=20.0,
+                    help="Fail when an operation's median time or command count grows more than this percentage.")
+    group.addoption("--bench-update-baseline", action="store_true", default=False,
+                    help="Write the results to the baseline instead of checking for regressions.")
+
+
+def pytest_configure(config):
+    config.stash[benchmark_key] = Benchmark(iterations=config.getoption("--bench-iterations"))
+
+
+@pytest.fixture(scope="session")
+def bench(request) -> Benchmark:
+    """Benchmark recorder shared by all benchmark modules."""
+    return request.config.stash[benchmark_key]
+
+
+def pytest_sessionfinish(session):
+    results = session.config.stash[benchmark_key].results
+    if not results:
+        return
+
+    baseline = BenchmarkBaseline(
+        session.config.getoption("--bench-baseline"),
+        threshold_pct=session.config.getoption("--bench-threshold"),
+    )
+    reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter:
+        reporter.write_sep("-", "page-object benchmarks")
+        reporter.write_line(baseline.format_table(results))
+
+    if session.config.getoption("--bench-update-baseline"):
+        baseline.save(results)
+        return
+
+    regressions = baseline.regressions(results)
+    if regressions:
+        if reporter:
+            reporter.write_sep("-", f"regressions beyond {baseline.threshold_pct:g}%", red=True)
+            for line in regressions:
+                reporter.write_line(line)
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
@@ -1,29 +1,423 @@
-import logging
 import os
+import subprocess
+import tempfile
 import pytest
-from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from pytest_html import extras as pytest_html_extras
+from pages.admin_dashboard_page import AdminDashboardPage
+from pages.admin_product_page import AdminProductPage
+from utils.admin_api import AdminApi
+from utils.admin_state import AdminStateReader
+from utils.auth_cache import AdminAuthCache
+from utils.base_page import BaseAdminPage
+from utils.browser_pool import BrowserPool
+from utils.browser_prewarm import BrowserPrewarmer, browser_prewarmers_key
+from utils.browser_profiles import BROWSERS, PROFILES, BrowserProfile, apply_network_blocking, launch_browser
+from utils.checkpoints import CheckpointLog, StepRunner, checkpoint_log_key, is_transient
+from utils.duration_scheduler import DurationHistory, DurationRecorder, DurationScheduling, PlannedScheduling
+from utils.logger import configure_logging, get_logger, set_test_context, shutdown_logging
+from utils.product_factory import ProductFactory
+from utils.routes import AdminRouter
+from utils.screenshot_pipeline import ScreenshotPipeline, screenshot_pipeline_key
+from utils.sharded_report import ShardedReport
+from utils.standin_server import StandInServer
+from utils.test_data import DataNamespace, purge_leftover_products
+from utils.test_impact import (ImpactMap, ImpactRecorder, changed_lines, fixture_scope, impact_map_key,
+                               impact_recorder_key, select_tests)
+from utils.timeout_history import TimeoutHistory
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("opencart", "OpenCart admin environment")
+    group.addoption("--admin-url", default="http://localhost/opencart/upload/admin/",
+                    help="Base URL of the OpenCart admin panel (ending with /admin/).")
+    group.addoption("--admin-user", default="admin", help="Admin username.")
+    group.addoption("--admin-password", default="admin", help="Admin password.")
+    group.addoption("--browser", default="chrome",
+                    help="Comma-separated browsers (chrome, firefox, edge); with several, every driver test runs once per browser.")
+    group.addoption("--browser-profile", default="default", choices=sorted(PROFILES),
+                    help="Browser launch profile: 'default' (headed, maximized) or 'fast' (headless, CDP request blocking).")
+    group.addoption("--block-urls", default="",
+                    help="Extra comma-separated URL patterns to block via CDP (e.g. '*.mp4,*/analytics/*').")
+    group.addoption("--wait-engine", default=BaseAdminPage.WAIT_CLASSIC,
+                    choices=(BaseAdminPage.WAIT_CLASSIC, BaseAdminPage.WAIT_BROWSER),
+                    help="Page-object wait backend: WebDriverWait polling or in-browser MutationObserver.")
+    group.addoption("--action-engine", default=BaseAdminPage.ACTION_NATIVE,
+                    choices=(BaseAdminPage.ACTION_NATIVE, BaseAdminPage.ACTION_BROWSER),
+                    help="Page-object click/type/checkbox: separate WebDriver calls or one compound in-page script each.")
+    group.addoption("--screenshot-workers", type=int, default=2,
+                    help="Background threads that decode and write screenshots.")
+    group.addoption("--screenshot-max-width", type=int, default=0,
+                    help="Downscale screenshots wider than this many pixels (needs Pillow; 0 keeps full size).")
+    group.addoption("--sharded-report", metavar="DIR", default=None,
+                    help="Write per-test report shards and a lightweight index to DIR instead of the pytest-html report.")
+    group.addoption("--adaptive-timeouts", action="store_true", default=False,
+                    help="Derive wait timeouts from recorded per-locator durations (p99 x safety factor).")
+    group.addoption("--route-separator", default=AdminRouter.separator, choices=("|", "."),
+                    help="Admin route method separator: '|' for OpenCart 4.0.0/4.0.1, '.' from 4.0.2.")
+    group.addoption("--standin", action="store_true", default=False,
+                    help="Run against a local in-memory admin stand-in server instead of --admin-url.")
+    group.addoption("--log-dir", default=os.path.join("reports", "logs"),
+                    help="Directory for per-worker JSON-lines logs (test id, tc_id, page-object waits, assertions).")
+    group.addoption("--no-console-log", action="store_true", default=False,
+                    help="Only write the JSON-lines logs, no human-readable console output.")
+    group.addoption("--log-wait-events", action="store_true", default=False,
+                    help="Also log every page-object wait (method, locator, duration, outcome) as a DEBUG event.")
+    group.addoption("--prewarm-depth", type=int, default=1,
+                    help="Browsers to launch in the background ahead of upcoming fresh_browser tests (0 disables).")
+    group.addoption("--record-impact", action="store_true", default=False,
+                    help="Record which page-object/utils functions each test calls (into the pytest cache).")
+    group.addoption("--impact-base", metavar="REF", default=None,
+                    help="Only run tests whose recorded page-object calls changed since git REF (plus unmapped tests).")
+    group.addoption("--impact-all", action="store_true", default=False,
+                    help="Ignore --impact-base and run the full suite.")
+    group.addoption("--duration-scheduling", action="store_true", default=False,
+                    help="With -n: hand out tests longest-first from recorded durations (keeps xdist_group tests together).")
+
+
+def _build_driver(browser: str, profile: BrowserProfile):
+    """Launches a browser session for a browser profile."""
+    driver = launch_browser(browser, profile)
+    # Every page-object wait is explicit (BaseAdminPage._until); an implicit wait would stretch each poll
+    driver.implicitly_wait(0)
+    apply_network_blocking(driver, profile)
+    return driver
+
+
+def _browsers(config) -> list[str]:
+    """Browsers selected with --browser, in the given order."""
+    browsers = [b.strip().lower() for b in config.getoption("--browser").split(",") if b.strip()]
+    unknown = [b for b in browsers if b not in BROWSERS]
+    if unknown or not browsers:
+        raise pytest.UsageError(f"--browser: unknown browser(s) {', '.join(unknown)}; expected any of: {', '.join(BROWSERS)}")
+    return list(dict.fromkeys(browsers))
+
+
+def _item_browser(item) -> str:
+    """Browser a test runs in: its browser_name parameter, or the only selected browser."""
+    callspec = getattr(item, "callspec", None)
+    if callspec and "browser_name" in callspec.params:
+        return callspec.params["browser_name"]
+    return _browsers(item.config)[0]
+
+
+def _session_profile(config) -> BrowserProfile:
+    """Browser profile selected on the command line, with any extra --block-urls patterns."""
+    profile = PROFILES[config.getoption("--browser-profile")]
+    extra = config.getoption("--block-urls")
+    return profile.with_blocked_urls(extra.split(",")) if extra else profile
+
+
+def _test_profile(item) -> BrowserProfile:
+    """Profile for a test: the browser_profile marker overrides the session profile (e.g. visual tests)."""
+    marker = item.get_closest_marker("browser_profile")
+    if not marker:
+        return _session_profile(item.config)
+    if marker.args[0] not in PROFILES:
+        pytest.fail(f"Unknown browser profile '{marker.args[0]}', expected one of: {', '.join(sorted(PROFILES))}")
+    return PROFILES[marker.args[0]]
+
+
+def pytest_generate_tests(metafunc):
+    browsers = _browsers(metafunc.config)
+    if "driver" in metafunc.fixturenames and len(browsers) > 1:
+        # With -n, pytest_xdist_make_scheduler plans the variants of a test onto different workers
+        metafunc.parametrize("browser_name", browsers, ids=browsers)
+
+
+@pytest.fixture(scope="session")
+def browser_pools():
+    """One pool of long-lived browsers per browser and profile (one set of pools per xdist worker)."""
+    pools: dict[tuple[str, BrowserProfile], BrowserPool] = {}
+    yield pools
+    for pool in pools.values():
+        pool.close_all()
+
+
+def _pool_for(pools: dict, browser: str, profile: BrowserProfile) -> BrowserPool:
+    """Returns (creating on first use) the pool for a browser and profile."""
+    if (browser, profile) not in pools:
+        pools[browser, profile] = BrowserPool(lambda: _build_driver(browser, profile))
+    return pools[browser, profile]
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request, browser_pools) -> BrowserPool:
+    """Pool for the session's browser profile (first --browser; used for logins and HTTP setup)."""
+    return _pool_for(browser_pools, _browsers(request.config)[0], _session_profile(request.config))
+
+
+@pytest.fixture(scope="session")
+def browser_name(request) -> str:
+    """Browser of the test; parametrized per browser when --browser lists several."""
+    return _browsers(request.config)[0]
 
 
 @pytest.fixture(scope="function")
-def driver():
-    from selenium.webdriver.chrome.options import Options
-
-    options = Options()
-    options.add_argument("--start-maximized")
-    prefs = {
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False,
-        "autofill.profile_enabled": False,
-        "autofill.credit_card_enabled": False
-    }
-    options.add_experimental_option("prefs", prefs)
-
-    driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(10)
+def driver(request, browser_pools, browser_name):
+    """A clean browser for the test; pooled unless the test is marked fresh_browser."""
+    profile = _test_profile(request.node)
+    if request.node.get_closest_marker("fresh_browser"):
+        prewarmer = _prewarmer_for(request.config, browser_name, profile)
+        driver = prewarmer.acquire() if prewarmer else _build_driver(browser_name, profile)
+        yield driver
+        driver.quit()
+        return
+
+    pool = _pool_for(browser_pools, browser_name, profile)
+    driver = pool.acquire()
     yield driver
-    driver.quit()
+    pool.release(driver)
+
+
+def _prewarmer_for(config, browser: str, profile: BrowserProfile) -> BrowserPrewarmer | None:
+    """Returns (creating on first use) the background launcher for a browser and profile; None when off."""
+    prewarmers = config.stash.get(browser_prewarmers_key, None)
+    if prewarmers is None:
+        return None
+    if (browser, profile) not in prewarmers:
+        prewarmers[browser, profile] = BrowserPrewarmer(lambda: _build_driver(browser, profile),
+                                                        config.getoption("--prewarm-depth"))
+    return prewarmers[browser, profile]
+
+
+def _fresh_launch(item) -> tuple[str, BrowserProfile] | None:
+    """(browser, profile) a fresh_browser test will launch, or None for pooled tests (and unknown profiles)."""
+    if not item.get_closest_marker("fresh_browser"):
+        return None
+    marker = item.get_closest_marker("browser_profile")
+    if marker and marker.args[0] not in PROFILES:
+        return None
+    return _item_browser(item), _test_profile(item)
+
+
+def _prewarm_upcoming(item, nextitem) -> None:
+    """Starts browsers for the next fresh_browser tests while `item` runs.
+
+    Serial runs look ahead in collection order up to the warm depth; xdist workers only
+    know their next test, so they warm for that one.
+    """
+    if nextitem is None or item.config.stash.get(browser_prewarmers_key, None) is None:
+        return
+    depth = item.config.getoption("--prewarm-depth")
+    if hasattr(item.config, "workerinput"):
+        following = [nextitem]
+    else:
+        items = item.session.items
+        following = items[items.index(nextitem):]
+
+    # The running test's own browser (acquired in its setup) plus up to `depth` ahead
+    demand: dict[tuple[str, BrowserProfile], int] = {}
+    current = _fresh_launch(item)
+    if current:
+        demand[current] = 1
+    ahead = 0
+    for upcoming in following:
+        if ahead >= depth:
+            break
+        launch = _fresh_launch(upcoming)
+        if launch:
+            demand[launch] = demand.get(launch, 0) + 1
+            ahead += 1
+    for (browser, profile), count in demand.items():
+        _prewarmer_for(item.config, browser, profile).warm(count)
+
+
+@pytest.fixture(scope="session")
+def standin_server(request, admin_credentials) -> StandInServer | None:
+    """Local admin stand-in (one per xdist worker) when --standin is given, otherwise None."""
+    if not request.config.getoption("--standin"):
+        yield None
+        return
+
+    server = StandInServer(username=admin_credentials[0], password=admin_credentials[1],
+                           separator=request.config.getoption("--route-separator")).start()
+    get_logger().info(f"[STANDIN] Serving the admin stand-in at {server.url}")
+    yield server
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def _standin_reset(request):
+    """Restores the stand-in's seed data before tests marked standin_reset."""
+    if request.node.get_closest_marker("standin_reset") and request.config.getoption("--standin"):
+        request.getfixturevalue("standin_server").reset()
+
+
+@pytest.fixture(scope="session")
+def admin_url(request, standin_server) -> str:
+    """Base URL of the admin panel under test (the stand-in's URL with --standin)."""
+    if standin_server:
+        return standin_server.url
+    return request.config.getoption("--admin-url")
+
+
+@pytest.fixture(scope="session")
+def admin_credentials(request) -> tuple[str, str]:
+    """(username, password) of the admin account used by the tests."""
+    return request.config.getoption("--admin-user"), request.config.getoption("--admin-password")
+
+
+@pytest.fixture(scope="session")
+def admin_auth(request) -> AdminAuthCache:
+    """Admin login cache shared by all tests and xdist workers of this run (deleted when the run ends).
+
+    Without the pytest cache (-p no:cacheprovider) each worker keeps its own in a temporary directory.
+    """
+    cache_dir = _auth_cache_dir(request.config)
+    if cache_dir:
+        yield AdminAuthCache(cache_dir)
+        return
+    with tempfile.TemporaryDirectory(prefix="admin_auth-") as tmp_dir:
+        yield AdminAuthCache(tmp_dir)
+
+
+def _auth_cache_dir(config) -> str | None:
+    """Directory of the run's shared admin sessions in the pytest cache (None without the cache)."""
+    cache = getattr(config, "cache", None)
+    return str(cache.mkdir("admin_auth")) if cache else None
+
+
+@pytest.fixture(scope="session")
+def data_ns(request, browser_pool, admin_auth, admin_url, admin_credentials) -> DataNamespace:
+    """Per-run, per-worker test-data namespace; purges its own and stale leftover products at session end."""
+    workerinput = getattr(request.config, "workerinput", {})
+    namespace = DataNamespace(
+        run_id=workerinput.get("testrunuid"),
+        worker_id=workerinput.get("workerid", "master"),
+    )
+    yield namespace
+
+    try:
+        driver = browser_pool.acquire()
+    except WebDriverException as e:
+        get_logger().warning(f"[DATA] Leftover cleanup skipped for {namespace.tag}, no browser: {e.msg}")
+        return
+
+    try:
+        admin_auth.login(driver, admin_url, *admin_credentials)
+        AdminDashboardPage(driver).open_products()
+        deleted = purge_leftover_products(AdminProductPage(driver), namespace)
+        get_logger().info(f"[DATA] Purged {deleted} leftover test product(s) for {namespace.tag}")
+    except (AssertionError, WebDriverException) as e:
+        get_logger().warning(f"[DATA] Leftover cleanup failed for {namespace.tag}: {e}")
+    finally:
+        browser_pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def admin_api(browser_pool, admin_auth, admin_url, admin_credentials) -> AdminApi:
+    """HTTP client on the cached admin session (pooled connections, shared by the worker's tests)."""
+    driver = browser_pool.acquire()
+    try:
+        admin_auth.login(driver, admin_url, *admin_credentials)
+        api = AdminApi.from_driver(driver)
+    finally:
+        browser_pool.release(driver)
+    yield api
+    api.close()
+
 
+@pytest.fixture()
+def steps(request, driver) -> StepRunner:
+    """Named workflow steps with checkpoints; a rerun after a transient failure resumes from the last one."""
+    log = request.node.stash.setdefault(checkpoint_log_key, CheckpointLog())
+    return StepRunner(driver, log)
+
+
+@pytest.fixture(scope="session")
+def admin_state(admin_api) -> AdminStateReader:
+    """Reads order/product state over HTTP for post-condition checks (no page render)."""
+    return AdminStateReader(admin_api)
+
+
+@pytest.fixture()
+def product_factory(admin_api, data_ns) -> ProductFactory:
+    """Creates products over HTTP for test setup and deletes them after the test."""
+    factory = ProductFactory(admin_api, data_ns)
+    yield factory
+    factory.cleanup()
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        marker = item.get_closest_marker("tc_id")
+        if marker and marker.args:
+            item.user_properties.append(("tc_id", marker.args[0]))
+        if "driver" in getattr(item, "fixturenames", ()):
+            item.user_properties.append(("browser", _item_browser(item)))
+
+    base = config.getoption("--impact-base")
+    if base and not config.getoption("--impact-all"):
+        _select_impacted(config, items, base)
+
+
+def _select_impacted(config, items, base):
+    """Deselects tests whose recorded page-object calls are untouched by the diff against `base`."""
+    path = _cache_file(config, "impact", "map.json")
+    if path is None:
+        get_logger().warning("[IMPACT] No pytest cache (-p no:cacheprovider), so no impact map: running all tests")
+        return
+    root = str(config.rootpath)
+    impact = ImpactMap(path)
+    try:
+        changes = changed_lines(base, root)
+    except subprocess.CalledProcessError as e:
+        raise pytest.UsageError(f"--impact-base={base}: git diff failed: {e.stderr.strip()}")
+    selected_ids, reason = select_tests([item.nodeid for item in items], impact.tests, changes, root, impact.shared)
+
+    selected_ids = set(selected_ids)
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected_ids]
+    get_logger().info(f"[IMPACT] {len(items)} selected, {len(deselected)} deselected since {base}: {reason}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    _prewarm_upcoming(item, nextitem)
+    impact_map = item.config.stash.get(impact_map_key, None)
+    if impact_map is None:
+        yield
+        return
+
+    recorder = ImpactRecorder(str(item.config.rootpath))
+    item.config.stash[impact_recorder_key] = recorder
+    recorder.start()
+    try:
+        yield
+    finally:
+        impact_map.record(item.nodeid, recorder.stop(), recorder.shared, item.fixturenames)
+        del item.config.stash[impact_recorder_key]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """With --record-impact, records a shared fixture's setup/teardown for every test using it."""
+    config = request.config
+    recorder = config.stash.get(impact_recorder_key, None)
+    if recorder is None or fixturedef.scope == "function":
+        yield
+        return
+
+    scope = fixture_scope(fixturedef.argname)
+
+    def recording(method):
+        def finalizer():
+            current = config.stash.get(impact_recorder_key, None)
+            if current is not None:
+                getattr(current, method)(scope)
+        return finalizer
+
+    # Finalizers run last in, first out: exit after the fixture's own teardown, enter before it
+    fixturedef.addfinalizer(recording("exit"))
+    recorder.enter(scope)
+    try:
+        yield
+    finally:
+        recorder.exit(scope)
+        fixturedef.addfinalizer(recording("enter"))
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -35,21 +429,30 @@ def pytest_runtest_makereport(item, call):
         if not hasattr(report, "extra"):
             report.extra = []
 
+        report.extra.extend(getattr(item, "extra", []))
+
+        stats = BaseAdminPage.action_stats
+        if stats.actions:
+            report.user_properties.append(("round_trips_saved", stats.round_trips_saved))
+            get_logger().info(f"[ACTIONS] {stats.actions} compound action(s) saved {stats.round_trips_saved} round trip(s)")
+
+        checkpoints = item.stash.get(checkpoint_log_key, None)
+        if checkpoints is not None:
+            if report.failed and is_transient(call.excinfo):
+                checkpoints.resumable = True
+            else:
+                checkpoints.clear()
+
         if report.failed and "driver" in item.funcargs:
             driver = item.funcargs["driver"]
-            screenshot_dir = os.path.join("reports", "screenshots")
-            os.makedirs(screenshot_dir, exist_ok=True)
-
             filename = report.nodeid.replace("::", "_").replace("/", "_") + ".png"
-            abs_path = os.path.join(screenshot_dir, filename)
-            driver.save_screenshot(abs_path)
-
-            relative_path = f"screenshots/{filename}".replace("\\", "/")
+            relative_path = item.config.stash[screenshot_pipeline_key].capture(driver, filename)
             report.extra.append(pytest_html_extras.image(relative_path, mime_type="image/png"))
 
 
 def pytest_html_results_table_header(cells):
     cells.insert(2, '<th>Screenshot</th>')
+    cells.insert(2, '<th>Browser</th>')
 
 
 def pytest_html_results_table_row(report, cells):
@@ -60,15 +463,143 @@ def pytest_html_results_table_row(report, cells):
                 screenshot_html = extra["content"]
                 break
     cells.insert(2, screenshot_html)
+    cells.insert(2, f'<td>{dict(report.user_properties).get("browser", "")}</td>')
+
 
 
+def pytest_cmdline_main(config):
+    if config.getoption("--sharded-report"):
+        # Replaces the monolithic pytest-html report (it registers only when htmlpath is set)
+        config.option.htmlpath = None
+
+
+def _cache_file(config, directory: str, name: str) -> str | None:
+    """Path of a file in the pytest cache, or None when the cache is off (-p no:cacheprovider)."""
+    cache = getattr(config, "cache", None)
+    return str(cache.mkdir(directory) / name) if cache else None
+
 
 def pytest_configure(config):
-    logger = logging.getLogger("test_logger")
-    logger.setLevel(logging.INFO)
-    if not getattr(logger, "_handler_set", False):
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s [%(levelname)s]: %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger._handler_set = True
+    _browsers(config)  # fail fast on an unknown --browser
+    BaseAdminPage.wait_engine = config.getoption("--wait-engine")
+    BaseAdminPage.action_engine = config.getoption("--action-engine")
+    AdminRouter.separator = config.getoption("--route-separator")
+    sharded_dir = config.getoption("--sharded-report")
+    config.stash[screenshot_pipeline_key] = ScreenshotPipeline(
+        os.path.join("reports", "screenshots"),
+        workers=config.getoption("--screenshot-workers"),
+        max_width=config.getoption("--screenshot-max-width"),
+        thumbnail_width=320 if sharded_dir else 0,
+    )
+    if sharded_dir:
+        workerinput = getattr(config, "workerinput", {})
+        report = ShardedReport(sharded_dir, config.stash[screenshot_pipeline_key], workerinput.get("workerid", "master"))
+        if not workerinput:
+            report.reset()
+        config.pluginmanager.register(report, "sharded_report")
+
+    configure_logging(
+        config.getoption("--log-dir"),
+        worker_id=getattr(config, "workerinput", {}).get("workerid", "master"),
+        console=not config.getoption("--no-console-log"),
+        debug=config.getoption("--log-wait-events"),
+    )
+
+    # Without the pytest cache there is no history: waits keep their fixed timeouts
+    timeouts_path = _cache_file(config, "timeouts", "history.json")
+    BaseAdminPage.timeout_history = (
+        TimeoutHistory(timeouts_path, adaptive=config.getoption("--adaptive-timeouts")) if timeouts_path else None
+    )
+    if timeouts_path is None and config.getoption("--adaptive-timeouts"):
+        get_logger().warning("[TIMEOUTS] No pytest cache (-p no:cacheprovider): --adaptive-timeouts has no history to use")
+
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        # Sessions cached by a run that crashed are never reused
+        auth_dir = _auth_cache_dir(config)
+        if auth_dir:
+            AdminAuthCache(auth_dir).clear()
+        # Controller (or serial run): record per-test durations for the duration scheduler
+        durations_path = _cache_file(config, "durations", "history.json")
+        if durations_path:
+            config.pluginmanager.register(DurationRecorder(DurationHistory(durations_path)), "duration_recorder")
+        elif config.getoption("--duration-scheduling"):
+            get_logger().warning("[DURATIONS] No pytest cache (-p no:cacheprovider): --duration-scheduling has no history")
+    elif config.getoption("--duration-scheduling") or len(_browsers(config)) > 1:
+        # Workers tag xdist_group tests with "@group" so the scheduler keeps each group on one worker
+        config.option.loadgroup = True
+
+    if config.getoption("--prewarm-depth") > 0:
+        config.stash[browser_prewarmers_key] = {}
+
+    if config.getoption("--record-impact"):
+        impact_path = _cache_file(config, "impact", "map.json")
+        if impact_path:
+            config.stash[impact_map_key] = ImpactMap(impact_path)
+        else:
+            get_logger().warning("[IMPACT] No pytest cache (-p no:cacheprovider): --record-impact records nothing")
+
+
+def pytest_xdist_make_scheduler(config, log):
+    browsers = _browsers(config)
+    variants = browsers if len(browsers) > 1 else ()
+    recorder = config.pluginmanager.get_plugin("duration_recorder")
+    if config.getoption("--duration-scheduling") and recorder is not None:
+        recorder.scheduler = DurationScheduling(config, recorder.history, log, variants)
+        return recorder.scheduler
+    if variants:
+        # xdist's own schedulers hand out neighbouring tests together, so a test's browsers would share a worker
+        return PlannedScheduling(config, log, variants)
+    return None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    BaseAdminPage.action_stats.reset()
+    marker = item.get_closest_marker("tc_id")
+    set_test_context(item.nodeid, marker.args[0] if marker and marker.args else None)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item):
+    set_test_context(None)
+
+
+def pytest_terminal_summary(terminalreporter):
+    saved = [dict(r.user_properties).get("round_trips_saved", 0)
+             for reports in terminalreporter.stats.values() for r in reports
+             if getattr(r, "when", None) == "call"]
+    if any(saved):
+        terminalreporter.write_line(f"compound actions saved {sum(saved)} WebDriver round trips "
+                                    f"({sum(saved) / len(saved):.1f} per test)")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    pipeline = session.config.stash.get(screenshot_pipeline_key, None)
+    if pipeline:
+        pipeline.flush()
+
+
+def pytest_unconfigure(config):
+    pipeline = config.stash.get(screenshot_pipeline_key, None)
+    if pipeline:
+        pipeline.close()
+
+    # Also runs after Ctrl+C, so warmed browsers never outlive the session
+    for prewarmer in config.stash.get(browser_prewarmers_key, {}).values():
+        prewarmer.close()
+
+    if BaseAdminPage.timeout_history:
+        BaseAdminPage.timeout_history.save()
+
+    impact_map = config.stash.get(impact_map_key, None)
+    if impact_map:
+        impact_map.save()
+
+    # Live admin session cookies must not outlive the run (workers end before the controller)
+    auth_dir = None if hasattr(config, "workerinput") else _auth_cache_dir(config)
+    if auth_dir:
+        AdminAuthCache(auth_dir).clear()
+
+    shutdown_logging()
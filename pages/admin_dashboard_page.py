@@ -1,9 +1,17 @@
 from selenium.webdriver.common.by import By
 from utils.base_page import BaseAdminPage
+from utils.routes import AdminRouter
 
 
 class AdminDashboardPage(BaseAdminPage):
-    """Provides access to main admin sections like Products and Orders."""
+    """Provides access to main admin sections like Products and Orders.
+
+    Navigation defaults to direct token-aware URLs ("url" mode). Use navigation="menu"
+    for tests that specifically cover the left-side admin menu.
+    """
+
+    NAVIGATION_URL = "url"
+    NAVIGATION_MENU = "menu"
 
     # ---------------------------
     # Menu locators
@@ -14,18 +22,39 @@ class AdminDashboardPage(BaseAdminPage):
     PRODUCTS = (By.LINK_TEXT, "Products")
     ORDERS = (By.LINK_TEXT, "Orders")
 
+    def __init__(self, driver, timeout: int = 10, navigation: str = NAVIGATION_URL):
+        super().__init__(driver, timeout)
+        if navigation not in (self.NAVIGATION_URL, self.NAVIGATION_MENU):
+            raise ValueError(f"Unknown navigation mode: {navigation}")
+        self.navigation = navigation
+        self.router = AdminRouter(driver)
+
     # ---------------------------
     # Navigation actions
     # ---------------------------
     def open_products(self) -> None:
-        """Opens the Products management page from the admin menu."""
-        self._open_menu(self.MENU_CATALOG)
-        self.click(self.PRODUCTS)
+        """Opens the Products management page."""
+        if self.navigation == self.NAVIGATION_MENU:
+            self._open_menu(self.MENU_CATALOG)
+            self.click(self.PRODUCTS)
+            return
+        self.router.go("products")
 
     def open_orders(self) -> None:
-        """Opens the Orders management page from the admin menu."""
-        self._open_menu(self.MENU_SALES)
-        self.click(self.ORDERS)
+        """Opens the Orders management page."""
+        if self.navigation == self.NAVIGATION_MENU:
+            self._open_menu(self.MENU_SALES)
+            self.click(self.ORDERS)
+            return
+        self.router.go("orders")
+
+    def open_product_form(self, product_id: str | int | None = None) -> None:
+        """Opens the product form directly (Add form when no product id is given)."""
+        self.router.go("product_form", product_id=product_id)
+
+    def open_order_info(self, order_id: str | int) -> None:
+        """Opens the order view page directly."""
+        self.router.go("order_info", order_id=order_id)
 
     # ---------------------------
     # Internal helpers
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from utils.base_page import BaseAdminPage
+from utils.routes import user_token_from_url
 
 
 class AdminLoginPage(BaseAdminPage):
@@ -12,6 +13,8 @@ class AdminLoginPage(BaseAdminPage):
     PASSWORD = (By.ID, "input-password")
     SUBMIT = (By.CSS_SELECTOR, "button[type='submit']")
 
+    LOGIN_ROUTE = "common/login"
+
     # ---------------------------
     # Navigation
     # ---------------------------
@@ -27,6 +30,22 @@ class AdminLoginPage(BaseAdminPage):
         self._enter_credentials(username, password)
         self.click(self.SUBMIT)
 
+    def wait_for_user_token(self, timeout: int | None = None) -> str:
+        """Waits for the post-login redirect and returns the user_token from the URL."""
+        self._wait(timeout).until(lambda d: self.current_user_token())
+        return self.current_user_token()
+
+    # ---------------------------
+    # State checks
+    # ---------------------------
+    def current_user_token(self) -> str:
+        """Returns the user_token in the current URL, or an empty string if there is none."""
+        return user_token_from_url(self.driver.current_url)
+
+    def is_logged_in(self) -> bool:
+        """True when the current page is an authenticated admin page (not the login route)."""
+        return bool(self.current_user_token()) and self.LOGIN_ROUTE not in self.driver.current_url
+
     # ---------------------------
     # Internal helpers
     # ---------------------------
@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from utils.base_page import BaseAdminPage
+from utils.table_snapshot import TableSnapshot
 
 
 class AdminOrderPage(BaseAdminPage):
@@ -11,10 +12,11 @@ class AdminOrderPage(BaseAdminPage):
     # -------------------------
     ORDER_ID = (By.ID, "input-order-id")
     FILTER = (By.ID, "button-filter")
+    TABLE = "table"
     ROWS = (By.CSS_SELECTOR, "table tbody tr")
-    LOADER = (By.CSS_SELECTOR, ".loader")
 
-    FIRST_ROW_ORDER_ID = (By.CSS_SELECTOR, "table tbody tr td:nth-child(2)")
+    ORDER_ID_COLUMN = 1
+    STATUS_COLUMN = 4
 
     # -------------------------
     # View page
@@ -26,21 +28,7 @@ class AdminOrderPage(BaseAdminPage):
     ADD_HISTORY = (By.ID, "button-history")
     ALERT_SUCCESS = (By.CSS_SELECTOR, ".alert.alert-success")
 
-    # -------------------------
-    # Dynamic locators
-    # -------------------------
-    @staticmethod
-    def view_button(order_id: str) -> tuple:
-        """Locator for the View button in the row that contains the given order id."""
-        return (
-            By.XPATH,
-            f"//tr[td[contains(normalize-space(.), '{order_id}')]]//a[@title='View']",
-        )
-
-    @staticmethod
-    def status_cell(order_id: str) -> tuple:
-        """Locator for the Status cell in the row for the given order id."""
-        return (By.XPATH, f"//tr[td[text()='{order_id}']]/td[5]")
+    _snapshot: TableSnapshot | None = None
 
     # -------------------------
     # List actions
@@ -48,8 +36,9 @@ class AdminOrderPage(BaseAdminPage):
     def filter_by_order_id(self, order_id: str | int) -> None:
         """Filters the orders list by order id."""
         self.type(self.ORDER_ID, str(order_id))
-        self.click(self.FILTER, scroll=False)
-        self._wait_for_list_refresh()
+        with self.expect_ajax():
+            self.click(self.FILTER, scroll=False)
+        self.invalidate_table()
 
     def is_order_displayed(self) -> bool:
         """True when the list shows at least one result row."""
@@ -57,18 +46,38 @@ class AdminOrderPage(BaseAdminPage):
 
     def get_first_order_id(self) -> str:
         """Returns the order id from the first row in the current list."""
-        return self.text_of(self.FIRST_ROW_ORDER_ID, timeout=10)
+        rows = self.table().rows
+        return rows[0].cell(self.ORDER_ID_COLUMN) if rows else ""
 
     def get_order_status(self, order_id: str | int) -> str:
         """Returns the status shown in the list for a given order id."""
-        return self.text_of(self.status_cell(str(order_id)), timeout=10)
+        return self._row(order_id).cell(self.STATUS_COLUMN)
 
     def open_order(self, order_id: str | int) -> None:
         """Opens the order view page for the given order id."""
+        view = self._row(order_id).actions.get("View")
+        if view is None:
+            raise AssertionError(f"View button not found for order: {order_id}")
+
         self.scroll_to_top()
-        self.js_click(self.view_button(str(order_id)), timeout=10)
+        self.driver.execute_script("arguments[0].click();", view)
+        self.invalidate_table()
         self.wait_visible(self.CUSTOMER_NAME, timeout=10)
 
+    def table(self, refresh: bool = False) -> TableSnapshot:
+        """Snapshot of the orders list (one round trip), indexed by order id.
+
+        Cached until filtering or opening an order; pass refresh=True after navigating elsewhere.
+        """
+        if refresh or self._snapshot is None:
+            self.wait_present(self.ROWS, timeout=10)
+            self._snapshot = TableSnapshot.fetch(self.driver, self.TABLE, key_column=self.ORDER_ID_COLUMN)
+        return self._snapshot
+
+    def invalidate_table(self) -> None:
+        """Drops the cached list snapshot (the list changed or was reloaded)."""
+        self._snapshot = None
+
     # -------------------------
     # View getters
     # -------------------------
@@ -89,8 +98,9 @@ class AdminOrderPage(BaseAdminPage):
         Select(select_el).select_by_visible_text(status_text)
 
     def save_history(self) -> None:
-        """Clicks Add History to save the current status change."""
-        self.click(self.ADD_HISTORY, timeout=10)
+        """Clicks Add History and waits for the history request to finish."""
+        with self.expect_ajax():
+            self.click(self.ADD_HISTORY, timeout=10)
 
     def is_success_alert_displayed(self, timeout: int = 5) -> bool:
         """True when the success alert is visible."""
@@ -99,8 +109,9 @@ class AdminOrderPage(BaseAdminPage):
     # -------------------------
     # Internal helpers
     # -------------------------
-    def _wait_for_list_refresh(self) -> None:
-        """Waits for the loader to disappear and the rows to be available."""
-        if self.is_present(self.LOADER, timeout=1):
-            self.wait_invisible(self.LOADER, timeout=10)
-        self.get_all(self.ROWS, timeout=10)
+    def _row(self, order_id: str | int):
+        """Snapshot row for an order id (refetches once before giving up)."""
+        row = self.table().get(order_id) or self.table(refresh=True).get(order_id)
+        if row is None:
+            raise AssertionError(f"Order not found in list: {order_id}")
+        return row
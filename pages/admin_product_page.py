@@ -1,3 +1,6 @@
+import re
+from dataclasses import dataclass, fields
+
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
@@ -5,6 +8,79 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.wait import WebDriverWait
 from utils.base_page import BaseAdminPage
+from utils.table_snapshot import TableSnapshot
+
+
+# Applies a batch of form values in one call: plain inputs, the CKEditor description,
+# checkboxes and selects (matched by visible text), firing input/change like a user would.
+# Hidden tabs do not matter because no element has to be interactable. Returns missing ids.
+_FILL_FORM_SCRIPT = """
+const missing = [];
+for (const f of arguments[0]) {
+    const el = document.getElementById(f.id);
+    if (!el) { missing.push(f.id); continue; }
+    if (f.kind === "ckeditor" && window.CKEDITOR && CKEDITOR.instances[f.id]) {
+        CKEDITOR.instances[f.id].setData(f.value);
+    } else if (f.kind === "checkbox") {
+        el.checked = !!f.value;
+    } else if (f.kind === "select") {
+        const option = Array.from(el.options).find(o => o.text.trim() === f.value);
+        if (!option) { missing.push(f.id + " option '" + f.value + "'"); continue; }
+        el.value = option.value;
+    } else {
+        el.value = f.value;
+    }
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+}
+return missing;
+"""
+
+# Reads the same fields back (CKEditor content as plain text, selects as visible text).
+_READ_FORM_SCRIPT = """
+const values = {};
+for (const f of arguments[0]) {
+    const el = document.getElementById(f.id);
+    if (!el) continue;
+    if (f.kind === "ckeditor" && window.CKEDITOR && CKEDITOR.instances[f.id]) {
+        const div = document.createElement("div");
+        div.innerHTML = CKEDITOR.instances[f.id].getData();
+        values[f.id] = div.textContent.trim();
+    } else if (f.kind === "checkbox") {
+        values[f.id] = el.checked;
+    } else if (f.kind === "select") {
+        values[f.id] = el.selectedIndex >= 0 ? el.options[el.selectedIndex].text.trim() : "";
+    } else {
+        values[f.id] = el.value;
+    }
+}
+return values;
+"""
+
+
+@dataclass
+class ProductSpec:
+    """Values for the product form; fields left as None are not touched."""
+
+    # General tab
+    name: str | None = None
+    meta_title: str | None = None
+    description: str | None = None
+    meta_description: str | None = None
+    meta_keywords: str | None = None
+    tags: str | None = None
+    status: bool | None = None
+    # Data tab
+    model: str | None = None
+    price: str | None = None
+    quantity: int | str | None = None
+    location: str | None = None
+    date_available: str | None = None
+    stock_status: str | None = None
+    # Links tab
+    category: str | None = None
+    # SEO tab
+    seo_keyword: str | None = None
 
 
 class AdminProductPage(BaseAdminPage):
@@ -18,13 +94,15 @@ class AdminProductPage(BaseAdminPage):
 
     ADD_NEW = (By.CSS_SELECTOR, "a[title='Add New']")
     SAVE = (By.XPATH, "//button[@form='form-product' and @type='submit']")
-    DELETE = (By.CSS_SELECTOR, "button[formaction*='product|delete']")
+    DELETE = (By.CSS_SELECTOR, "button[formaction*='product|delete'], button[formaction*='product.delete']")
 
     # -------------------------
     # List page: table, filter, paging
     # -------------------------
     PRODUCT_FORM = (By.ID, "form-product")
+    TABLE = "#product table.table"
     TABLE_ROWS = (By.CSS_SELECTOR, "#product table.table tbody tr")
+    NAME_COLUMN = 2
 
     FILTER_PANEL = (By.ID, "filter-product")
     FILTER_TOGGLE = (By.CSS_SELECTOR, "button[title='Filter'], a[title='Filter']")
@@ -32,6 +110,8 @@ class AdminProductPage(BaseAdminPage):
     FILTER_APPLY = (By.ID, "button-filter")
 
     PAGE_2 = (By.CSS_SELECTOR, "ul.pagination li.page-item a.page-link[href*='page=2']")
+    # OpenCart appends the page number last to pagination links
+    PAGE_LINK = "ul.pagination li.page-item a.page-link[href$='page={number}']"
 
     # -------------------------
     # Tabs
@@ -74,6 +154,31 @@ class AdminProductPage(BaseAdminPage):
     # -------------------------
     SEO_KEYWORD = (By.ID, "input-keyword-0-1")
 
+    # -------------------------
+    # Bulk form fill: ProductSpec field -> (locator, kind)
+    # -------------------------
+    DESCRIPTION = (By.ID, "input-description-1")
+
+    SPEC_FIELDS = {
+        "name": (NAME, "text"),
+        "meta_title": (META_TITLE, "text"),
+        "description": (DESCRIPTION, "ckeditor"),
+        "meta_description": (META_DESCRIPTION, "text"),
+        "meta_keywords": (META_KEYWORDS, "text"),
+        "tags": (TAGS, "text"),
+        "status": (STATUS, "checkbox"),
+        "model": (MODEL, "text"),
+        "price": (PRICE, "text"),
+        "quantity": (QUANTITY, "text"),
+        "location": (LOCATION, "text"),
+        "date_available": (DATE_AVAILABLE, "text"),
+        "stock_status": (STOCK_STATUS, "select"),
+        "category": (CATEGORY, "text"),
+        "seo_keyword": (SEO_KEYWORD, "text"),
+    }
+
+    _snapshot: TableSnapshot | None = None
+
     # -------------------------
     # List actions
     # -------------------------
@@ -88,34 +193,48 @@ class AdminProductPage(BaseAdminPage):
         self._ensure_filter_panel_open()
 
         self.type(self.FILTER_NAME, name)
-        self.click(self.FILTER_APPLY, scroll=False)
+        with self.expect_ajax():
+            self.click(self.FILTER_APPLY, scroll=False)
+        self.invalidate_table()
         self._wait_for_rows()
 
     def open_edit(self, product_name: str) -> None:
         """Opens the Edit form for the first row that matches the product name."""
-        row = self._find_row(product_name)
-        if not row:
-            raise AssertionError(f"Product not found: {product_name}")
-
-        edit = row.find_element(By.CSS_SELECTOR, "a.btn.btn-primary[title='Edit']")
-        self.scroll_into_view(edit)
-        self._safe_click_element(edit)
+        self._act_on_row(product_name, self._click_edit, "Product not found")
+        self.invalidate_table()
         self.wait_visible(self.PRODUCT_FORM)
 
     def select_row_checkbox(self, product_name: str) -> None:
         """Selects the checkbox for the first row that matches the product name."""
-        row = self._find_row(product_name)
-        if not row:
-            raise AssertionError(f"Product not found for selection: {product_name}")
-
-        checkbox = row.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
-        self.scroll_into_view(checkbox)
-        if not checkbox.is_selected():
-            checkbox.click()
+        self._act_on_row(product_name, self._check_row, "Product not found for selection")
+
+    def select_rows_where(self, predicate) -> int:
+        """Selects the checkbox of every listed row whose text satisfies predicate; returns the count."""
+        selected = 0
+        for row in self.table().rows:
+            if row.checkbox is not None and predicate(row.text):
+                self._check_row(row)
+                selected += 1
+        return selected
+
+    def table(self, refresh: bool = False) -> TableSnapshot:
+        """Snapshot of the product list (one round trip), indexed by product name.
+
+        Cached until save/delete/filter/paging; pass refresh=True after navigating elsewhere.
+        """
+        if refresh or self._snapshot is None:
+            self.wait_present(self.TABLE_ROWS, timeout=10)
+            self._snapshot = TableSnapshot.fetch(self.driver, self.TABLE, key_column=self.NAME_COLUMN)
+        return self._snapshot
+
+    def invalidate_table(self) -> None:
+        """Drops the cached list snapshot (the list changed or was reloaded)."""
+        self._snapshot = None
 
     def delete_selected(self) -> None:
         """Clicks Delete for currently selected rows."""
         self.click(self.DELETE)
+        self.invalidate_table()
 
     def accept_delete_confirm(self, timeout: int = 5) -> None:
         """Accepts the browser confirm alert after clicking Delete."""
@@ -123,14 +242,23 @@ class AdminProductPage(BaseAdminPage):
         self.driver.switch_to.alert.accept()
 
     def go_to_page_two(self) -> None:
-        """Navigates to page 2 and waits for the list to refresh."""
-        first = self.wait_present(self.TABLE_ROWS, timeout=10)
-        page_2 = self.wait_present(self.PAGE_2, timeout=10)
+        """Navigates to page 2 and waits for the list refresh request to finish."""
+        self._open_page_link(self.wait_present(self.PAGE_2, timeout=10))
 
-        self.scroll_into_view(page_2)
-        self._safe_click_element(page_2)
+    def go_to_page(self, number: int) -> bool:
+        """Opens page `number` of the current (filtered) list; False when the list has no link to it."""
+        link = (By.CSS_SELECTOR, self.PAGE_LINK.format(number=number))
+        if not self.is_present(link):
+            return False
+        self._open_page_link(self.wait_present(link))
+        return True
+
+    def _open_page_link(self, link) -> None:
+        self.scroll_into_view(link)
 
-        WebDriverWait(self.driver, 10).until(EC.staleness_of(first))
+        with self.expect_ajax():
+            self._safe_click_element(link)
+        self.invalidate_table()
         self.wait_present(self.TABLE_ROWS, timeout=10)
 
     # -------------------------
@@ -141,6 +269,7 @@ class AdminProductPage(BaseAdminPage):
         self.scroll_to_top()
         self.wait_present(self.PRODUCT_FORM)
         self.click(self.SAVE)
+        self.invalidate_table()
 
     def close_alert_if_present(self, timeout: int = 2) -> bool:
         """Closes the top alert if it appears."""
@@ -159,6 +288,28 @@ class AdminProductPage(BaseAdminPage):
         """Waits for the success banner to appear and returns it."""
         return self.wait_visible(self.ALERT_SUCCESS, timeout=timeout)
 
+    # -------------------------
+    # Bulk form fill
+    # -------------------------
+    def fill_form(self, spec: ProductSpec, verify: bool = True) -> None:
+        """Applies a whole ProductSpec in one scripted batch, then verifies it with one read-back.
+
+        Use the per-field setters instead when a test is about keyboard input.
+        """
+        batch = self._spec_batch(spec)
+        self.wait_present(self.PRODUCT_FORM)
+        missing = self.driver.execute_script(_FILL_FORM_SCRIPT, batch)
+        if missing:
+            raise AssertionError(f"Product form fields not found: {', '.join(missing)}")
+        if verify:
+            self._verify_form(batch)
+
+    def read_form(self, spec: ProductSpec) -> dict:
+        """Returns the current form values for the fields set in `spec`, keyed by ProductSpec field."""
+        batch = self._spec_batch(spec)
+        values = self.driver.execute_script(_READ_FORM_SCRIPT, batch)
+        return {f["field"]: values.get(f["id"]) for f in batch}
+
     # -------------------------
     # General tab setters
     # -------------------------
@@ -267,23 +418,69 @@ class AdminProductPage(BaseAdminPage):
         """Waits until the products table has rows (or is fully refreshed)."""
         self.get_all(self.TABLE_ROWS, timeout=timeout)
 
-    def _rows(self, timeout: int = 10):
-        """Returns all product table rows."""
-        return self.get_all(self.TABLE_ROWS, timeout=timeout)
-
-    def _find_row(self, product_name: str, timeout: int = 10):
-        """Finds the first row that contains the given product name."""
-        needle = (product_name or "").strip().lower()
-        if not needle:
-            return None
-
-        for row in self._rows(timeout=timeout):
-            try:
-                if needle in row.text.lower():
-                    return row
-            except StaleElementReferenceException:
+    def _spec_batch(self, spec: ProductSpec) -> list[dict]:
+        """Script arguments (element id, kind, value) for the fields set in a spec."""
+        batch = []
+        for f in fields(spec):
+            value = getattr(spec, f.name)
+            if value is None:
                 continue
-        return None
+            (_, element_id), kind = self.SPEC_FIELDS[f.name]
+            batch.append({
+                "field": f.name,
+                "id": element_id,
+                "kind": kind,
+                "value": value if kind == "checkbox" else str(value),
+            })
+        return batch
+
+    def _verify_form(self, batch: list[dict]) -> None:
+        """Reads the batch back in one call and fails on any value that did not stick."""
+        values = self.driver.execute_script(_READ_FORM_SCRIPT, batch)
+        mismatches = []
+        for f in batch:
+            actual, expected = values.get(f["id"]), f["value"]
+            if f["kind"] == "ckeditor":
+                ok = re.sub(r"<[^>]+>", "", expected).strip() in (actual or "")
+            else:
+                ok = actual == expected
+            if not ok:
+                mismatches.append(f"{f['field']}: expected {expected!r}, got {actual!r}")
+        if mismatches:
+            raise AssertionError("Product form values did not apply:\n" + "\n".join(mismatches))
+
+    def _act_on_row(self, product_name: str, action, not_found: str) -> None:
+        """Runs an action on the row matching the product name, refetching once if the cached snapshot is outdated."""
+        fetched = self._snapshot is None
+        while True:
+            snapshot = self.table()
+            row = snapshot.find(product_name) if (product_name or "").strip() else None
+            if row:
+                try:
+                    action(row)
+                    return
+                except StaleElementReferenceException:
+                    if fetched:
+                        raise
+            elif fetched:
+                raise AssertionError(f"{not_found}: {product_name}")
+
+            self.invalidate_table()
+            fetched = True
+
+    def _click_edit(self, row) -> None:
+        """Clicks the Edit action of a snapshot row."""
+        edit = row.actions.get("Edit")
+        if edit is None:
+            raise AssertionError(f"Edit button not found in row: {row.text}")
+        self.scroll_into_view(edit)
+        self._safe_click_element(edit)
+
+    def _check_row(self, row) -> None:
+        """Ticks the checkbox of a snapshot row."""
+        self.scroll_into_view(row.checkbox)
+        if not row.checkbox.is_selected():
+            row.checkbox.click()
 
     def _ensure_filter_panel_open(self) -> None:
         """Opens the filter panel when it is collapsed (theme-safe)."""
@@ -304,10 +501,7 @@ class AdminProductPage(BaseAdminPage):
 
     def _set_checkbox(self, locator, enabled: bool) -> None:
         """Ensures a checkbox matches the expected on/off state."""
-        el = self.wait_present(locator)
-        self.scroll_into_view(el)
-        if el.is_selected() != enabled:
-            el.click()
+        self.set_checkbox(locator, enabled)
 
     def _safe_click_element(self, element) -> None:
         """Clicks a WebElement, falling back to JS click if needed."""
@@ -1,7 +1,6 @@
 import pytest
 from pages.admin_dashboard_page import AdminDashboardPage
-from pages.admin_login_page import AdminLoginPage
-from pages.admin_product_page import AdminProductPage
+from pages.admin_product_page import AdminProductPage, ProductSpec
 from utils.soft_assert import SoftAssert
 
 
@@ -12,20 +11,11 @@ from utils.soft_assert import SoftAssert
 class TestAdminProductManagement:
     """Admin product E2E tests: add, edit, and delete a product from the OpenCart admin panel."""
 
-    ADMIN_URL = "http://localhost/opencart/upload/admin/"
-    ADMIN_USER = "admin"
-    ADMIN_PASS = "admin"
-
     @pytest.fixture()
     def soft(self, driver, request) -> SoftAssert:
         """Soft assertion helper with logging/screenshots support."""
         return SoftAssert(driver, request)
 
-    @pytest.fixture()
-    def login(self, driver) -> AdminLoginPage:
-        """Admin login page object."""
-        return AdminLoginPage(driver)
-
     @pytest.fixture()
     def dashboard(self, driver) -> AdminDashboardPage:
         """Admin dashboard page object (menu navigation)."""
@@ -37,63 +27,69 @@ class TestAdminProductManagement:
         return AdminProductPage(driver)
 
     @pytest.fixture()
-    def admin_products(self, login, dashboard, products) -> AdminProductPage:
-        """Logs in as admin and opens the Products page, ready for test actions."""
-        login.open(self.ADMIN_URL)
-        login.login_as(self.ADMIN_USER, self.ADMIN_PASS)
-
-        products.close_alert_if_present()
-        dashboard.open_products()
+    def admin_products(
+        self, driver, steps, admin_auth, admin_url, admin_credentials, dashboard, products,
+    ) -> AdminProductPage:
+        """Logs in as admin (cached session) and opens the Products page as checkpointed steps, ready for test actions."""
+        steps.run("logged in", lambda: admin_auth.login(driver, admin_url, *admin_credentials))
+        steps.run("on product list", dashboard.open_products)
 
         return products
 
+    @pytest.fixture()
+    def product_data(self, data_ns, browser_name) -> dict:
+        """Name/model/SEO keyword unique to this run, xdist worker and browser for the product added through the UI."""
+        return {
+            "name": data_ns.name(f"Apple Test Product Automation {browser_name}"),
+            "model": data_ns.model(f"MODEL-001-{browser_name}"),
+            "seo_keyword": data_ns.seo_keyword(f"Keyword-{browser_name}"),
+        }
+
     @pytest.mark.tc_id("ADMIN-PROD-001")
     @pytest.mark.functional
-    def test_add_new_product(self, admin_products, soft):
+    def test_add_new_product(self, admin_products, product_data, steps, admin_state, soft):
         """Adds a new product and checks that OpenCart confirms the save."""
         products = admin_products
 
-        name = "Apple Test Product Automation"
-        meta_title = "Test Meta Title"
-
-        products.open_add()
-
-        products.set_name(name)
-        products.set_meta_title(meta_title)
-        products.set_description_ckeditor("input-description-1", "This is an automated test product.")
-        products.set_meta_description("Automated meta description")
-        products.set_meta_keywords("test, automation, opencart")
-        products.set_tags("test, opencart")
-
-        products.open_data_tab()
-        products.set_model("MODEL-001")
-        products.set_price("99.99")
-        products.set_quantity(25)
-        products.set_location("Warehouse 1")
-        products.set_date_available("2025-08-01")
-        products.set_stock_status("In Stock")
-        products.set_status(True)
-
-        products.open_links_tab()
-        products.set_category("Desktops > Mac")
-
-        products.open_seo_tab()
-        products.set_seo_keyword("Keyword")
-
-        products.save()
-
-        msg = products.get_success_message_if_any()
-        soft.assert_in("Success", msg, "Expected success message after adding product")
+        spec = ProductSpec(
+            name=product_data["name"],
+            meta_title="Test Meta Title",
+            description="This is an automated test product.",
+            meta_description="Automated meta description",
+            meta_keywords="test, automation, opencart",
+            tags="test, opencart",
+            model=product_data["model"],
+            price="99.99",
+            quantity=25,
+            location="Warehouse 1",
+            date_available="2025-08-01",
+            stock_status="In Stock",
+            status=True,
+            category="Desktops > Mac",
+            seo_keyword=product_data["seo_keyword"],
+        )
+
+        steps.run("on add form", products.open_add)
+        steps.run("form filled", lambda: products.fill_form(spec), restorable=False)
+        # A rerun must not save twice: the failed run's save may have gone through (duplicate SEO keyword)
+        saved_before = steps.run("saved", products.save, restorable=False,
+                                 done=lambda: admin_state.products(filter_model=spec.model))
+
+        if not saved_before:
+            msg = products.get_success_message_if_any()
+            soft.assert_in("Success", msg, "Expected success message after adding product")
+        soft.assert_true(admin_state.products(filter_model=spec.model), "Expected the new product in the product list")
         soft.assert_all()
 
     @pytest.mark.tc_id("ADMIN-PROD-002")
     @pytest.mark.functional
-    def test_edit_existing_product(self, admin_products, soft):
-        """Edits an existing product and checks that the update is saved."""
+    def test_edit_existing_product(self, admin_products, product_factory, admin_state, data_ns, soft):
+        """Edits an existing product (created over HTTP) and checks that the update is saved."""
         products = admin_products
 
-        original_name = "Apple Test Product Automation"
-        edited_name = "Test Product Automation - Edited"
+        product = product_factory.create("Test Product Automation")
+        original_name = product.name
+        edited_name = data_ns.name("Test Product Automation - Edited")
 
         products.search_by_name(original_name)
         products.open_edit(original_name)
@@ -108,15 +104,19 @@ class TestAdminProductManagement:
 
         msg = products.get_success_message_if_any()
         soft.assert_in("Success", msg, "Expected success message after editing product")
+
+        saved = admin_state.product(product.product_id, edited_name)
+        soft.assert_equal(saved.name, edited_name, "Expected the edited name to be saved")
+        soft.assert_equal(saved.quantity, 50, "Expected the edited quantity to be saved")
         soft.assert_all()
 
     @pytest.mark.tc_id("ADMIN-PROD-003")
     @pytest.mark.functional
-    def test_delete_product(self, admin_products, soft):
-        """Deletes the test product and checks that OpenCart confirms the deletion."""
+    def test_delete_product(self, admin_products, product_factory, soft):
+        """Deletes a product (created over HTTP) and checks that OpenCart confirms the deletion."""
         products = admin_products
 
-        target_name = "Test Product Automation - Edited"
+        target_name = product_factory.create("Test Product Automation - Delete").name
 
         products.search_by_name(target_name)
 
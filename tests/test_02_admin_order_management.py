@@ -1,8 +1,6 @@
 import pytest
 from pages.admin_dashboard_page import AdminDashboardPage
-from pages.admin_login_page import AdminLoginPage
 from pages.admin_order_page import AdminOrderPage
-from pages.admin_product_page import AdminProductPage
 from utils.soft_assert import SoftAssert
 
 
@@ -13,42 +11,27 @@ from utils.soft_assert import SoftAssert
 class TestAdminOrderManagement:
     """Admin orders E2E tests: view order details, update status, and confirm it stays saved."""
 
-    ADMIN_URL = "http://localhost/opencart/upload/admin/"
-    ADMIN_USER = "admin"
-    ADMIN_PASS = "admin"
-
     @pytest.fixture()
     def soft(self, driver, request) -> SoftAssert:
         """Soft assertion helper with logging/screenshots support."""
         return SoftAssert(driver, request)
 
-    @pytest.fixture()
-    def login(self, driver) -> AdminLoginPage:
-        """Admin login page object."""
-        return AdminLoginPage(driver)
-
     @pytest.fixture()
     def dashboard(self, driver) -> AdminDashboardPage:
         """Admin dashboard page object (menu navigation)."""
         return AdminDashboardPage(driver)
 
-    @pytest.fixture()
-    def products(self, driver) -> AdminProductPage:
-        """Helper page object used only to close the login alert banner if it appears."""
-        return AdminProductPage(driver)
-
     @pytest.fixture()
     def orders(self, driver) -> AdminOrderPage:
         """Admin orders page object (list + order view)."""
         return AdminOrderPage(driver)
 
     @pytest.fixture()
-    def admin_orders(self, login, dashboard, products, orders) -> AdminOrderPage:
-        """Logs in as admin and opens the Orders page, ready for test actions."""
-        login.open(self.ADMIN_URL)
-        login.login_as(self.ADMIN_USER, self.ADMIN_PASS)
-
-        products.close_alert_if_present()
+    def admin_orders(
+        self, driver, admin_auth, admin_url, admin_credentials, dashboard, orders,
+    ) -> AdminOrderPage:
+        """Logs in as admin (cached session) and opens the Orders page, ready for test actions."""
+        admin_auth.login(driver, admin_url, *admin_credentials)
         dashboard.open_orders()
 
         return orders
@@ -67,16 +50,18 @@ class TestAdminOrderManagement:
 
         orders.open_order(order_id)
 
-        soft.assert_equal(orders.get_customer_name(), "John Doe", "Expected customer name: John Doe")
-        soft.assert_true(
-            "Cash On Delivery" in orders.get_payment_method(),
+        dom = soft.snapshot()
+        dom.assert_text(orders.CUSTOMER_NAME, "John Doe", "Expected customer name: John Doe")
+        dom.assert_text_contains(
+            orders.PAYMENT_METHOD,
+            "Cash On Delivery",
             "Expected payment method to contain 'Cash On Delivery'",
         )
         soft.assert_all()
 
     @pytest.mark.tc_id("ADMIN-ORD-002")
     @pytest.mark.functional
-    def test_update_order_status_to_shipped(self, admin_orders, dashboard, soft):
+    def test_update_order_status_to_shipped(self, admin_orders, admin_state, soft):
         """Updates an order status to Shipped and verifies it is saved in the list."""
         orders = admin_orders
 
@@ -95,10 +80,8 @@ class TestAdminOrderManagement:
         orders.save_history()
         soft.assert_true(orders.is_success_alert_displayed(), "Expected success alert after status update")
 
-        dashboard.open_orders()
-
         soft.assert_equal(
-            orders.get_order_status(order_id),
+            admin_state.order(order_id).status,
             "Shipped",
             "Expected order status to be 'Shipped'",
         )
@@ -0,0 +1,49 @@
+import pytest
+import requests
+
+from utils.admin_api import AdminApi
+from utils.admin_state import AdminStateReader
+from utils.product_factory import ProductFactory
+from utils.routes import user_token_from_url
+from utils.standin_server import StandInServer
+from utils.test_data import DataNamespace
+
+
+@pytest.mark.unit
+class TestAdminApiSession:
+    """AdminApi with a browser-style session against the stand-in bound to localhost (the default --admin-url host)."""
+
+    @pytest.fixture(params=["|", "."], ids=["sep-pipe", "sep-dot"])
+    def separator(self, request) -> str:
+        return request.param
+
+    @pytest.fixture()
+    def server(self, separator):
+        server = StandInServer(host="localhost", separator=separator).start()
+        yield server
+        server.stop()
+
+    @pytest.fixture()
+    def api(self, server, separator) -> AdminApi:
+        """Client built like AdminApi.from_driver: the browser reports OCSESSID with domain 'localhost'."""
+        response = requests.post(f"{server.url}index.php?route=common/login{separator}login",
+                                 data={"username": "admin", "password": "admin"}, allow_redirects=False)
+        cookies = [{"name": "OCSESSID", "value": response.cookies["OCSESSID"], "domain": "localhost", "path": "/"}]
+        api = AdminApi(server.url, user_token_from_url(response.headers["Location"]), cookies, separator=separator)
+        yield api
+        api.close()
+
+    def test_host_only_cookie_is_sent_to_localhost(self, api):
+        assert "selected[]" in api.get("catalog/product{sep}list")
+
+    def test_factory_and_state_reader_use_the_session(self, api):
+        factory = ProductFactory(api, DataNamespace())
+        product = factory.create("Cookie Check")
+        assert AdminStateReader(api).product(product.product_id, product.spec.name).quantity == 10
+        factory.cleanup()
+        assert not AdminStateReader(api).products(filter_model=product.spec.model)
+
+    def test_other_separator_is_not_served(self, api, separator):
+        api.separator = "." if separator == "|" else "|"
+        with pytest.raises(AssertionError, match="HTTP 404"):
+            api.get("catalog/product{sep}list")
@@ -0,0 +1,34 @@
+import pytest
+
+from utils.admin_state import AdminStateReader
+
+
+def _order_list(*order_ids):
+    rows = "".join(
+        f'<tr><td><input type="checkbox" name="selected[]" value="{i}"></td><td>{i}</td><td>Default</td>'
+        f'<td>John Doe</td><td>Pending</td><td>$10.00</td><td>01/01/2026</td></tr>'
+        for i in order_ids
+    )
+    return f'<table class="table"><tbody>{rows}</tbody></table>'
+
+
+class _Api:
+    """Returns the same order list fragment for every request, whatever the filter."""
+
+    def __init__(self, *order_ids):
+        self.html = _order_list(*order_ids)
+
+    def get(self, route, **params):
+        return self.html
+
+
+@pytest.mark.unit
+class TestOrderLookup:
+
+    def test_order_is_the_row_with_its_id(self):
+        assert AdminStateReader(_Api(11, 1, 12)).order("1").order_id == 1
+
+    def test_filter_that_lists_other_orders_is_not_a_match(self):
+        # e.g. a filter ignored by the list, or one that matches loosely
+        with pytest.raises(AssertionError, match="Order not found in list: 1"):
+            AdminStateReader(_Api(11, 12)).order(1)
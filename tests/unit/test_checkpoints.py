@@ -0,0 +1,81 @@
+import pytest
+
+from utils.checkpoints import CheckpointLog, StepRunner
+
+
+class _Browser:
+    """Just enough of a WebDriver for StepRunner: a current URL, cookies and get()."""
+
+    def __init__(self):
+        self.current_url = "http://localhost/admin/index.php?route=common/dashboard&user_token=t"
+        self.opened = []
+
+    def get_cookies(self):
+        return [{"name": "OCSESSID", "value": "s", "domain": "localhost", "path": "/"}]
+
+    def get(self, url):
+        self.opened.append(url)
+        self.current_url = url
+
+    def add_cookie(self, cookie):
+        pass
+
+
+def _times_out():
+    raise AssertionError("Timed out waiting for the product form")
+
+
+def _failed_run(log, save_error):
+    """The first attempt: fixture steps, the add-form step, then a save that times out."""
+    steps = StepRunner(_Browser(), log)
+    steps.run("logged in", lambda: "token")
+    steps.run("on product list", lambda: None)
+    steps.run("on add form", lambda: None)
+    steps.run("form filled", lambda: None, restorable=False)
+    with pytest.raises(AssertionError):
+        steps.run("saved", save_error, restorable=False)
+    log.resumable = True
+
+
+@pytest.mark.unit
+class TestStepRunnerResume:
+
+    def _save_times_out(self, saved):
+        def save():
+            saved.append(True)
+            raise AssertionError("Timed out waiting for the success alert")
+        return save
+
+    def test_rerun_skips_fixture_steps_and_does_not_repeat_a_save_that_went_through(self):
+        log, saved, calls = CheckpointLog(), [], []
+        _failed_run(log, self._save_times_out(saved))
+
+        browser = _Browser()
+        steps = StepRunner(browser, log)
+        assert steps.run("logged in", lambda: calls.append("login")) == "token"
+        steps.run("on product list", lambda: calls.append("open products"))
+        steps.run("on add form", lambda: calls.append("open add"))
+        steps.run("form filled", lambda: calls.append("fill"), restorable=False)
+        result = steps.run("saved", lambda: calls.append("save"), restorable=False, done=lambda: saved)
+
+        assert calls == ["fill"]
+        assert result == [True]
+        assert browser.opened[-1].endswith("route=common/dashboard&user_token=t")
+
+    def test_save_runs_again_when_the_failed_attempt_did_not_take_effect(self):
+        log, calls = CheckpointLog(), []
+        _failed_run(log, _times_out)
+
+        steps = StepRunner(_Browser(), log)
+        for name in ("logged in", "on product list", "on add form"):
+            steps.run(name, lambda: calls.append(name))
+        steps.run("form filled", lambda: calls.append("fill"), restorable=False)
+        steps.run("saved", lambda: calls.append("save"), restorable=False, done=lambda: [])
+
+        assert calls == ["fill", "save"]
+
+    def test_done_is_not_asked_on_a_first_run(self):
+        steps = StepRunner(_Browser(), CheckpointLog())
+        asked = []
+        steps.run("saved", lambda: "saved", restorable=False, done=lambda: asked.append(True))
+        assert not steps.resumed and not asked
@@ -0,0 +1,89 @@
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from utils.dom_actions import DomActions
+
+
+class _NavigatingBrowser:
+    """Plays a page whose action navigates: the first `unloads` calls act and then lose the result to the unload.
+
+    Like the in-page script, a later call with a token that already acted reports done without acting.
+    """
+
+    def __init__(self, unloads: int = 1):
+        self.unloads = unloads
+        self.actions = 0
+        self.tokens = []
+        self.performed = set()
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, kind, query, action, value, options, timeout_ms, token):
+        self.tokens.append(token)
+        if token in self.performed:
+            return {"done": True, "unloaded": True}
+        self.actions += 1
+        self.performed.add(token)
+        if len(self.tokens) <= self.unloads:
+            raise JavascriptException("javascript error: document unloaded while waiting for result")
+        return {"done": True}
+
+
+@pytest.mark.unit
+class TestDomActionsRetry:
+
+    def test_unload_after_the_action_is_success_without_acting_again(self):
+        browser = _NavigatingBrowser()
+        result = DomActions(browser).run((By.ID, "button-save"), "click", timeout=5)
+
+        assert result == {"done": True, "unloaded": True}
+        assert browser.actions == 1
+        assert len(set(browser.tokens)) == 1
+
+    def test_unload_at_the_deadline_still_checks_for_the_action(self):
+        browser = _NavigatingBrowser()
+        result = DomActions(browser).run((By.ID, "button-save"), "click", timeout=0)
+
+        assert result["done"] and browser.actions == 1
+
+    def test_every_call_has_its_own_token(self):
+        browser = _NavigatingBrowser(unloads=0)
+        actions = DomActions(browser)
+        actions.run((By.ID, "a"), "click")
+        actions.run((By.ID, "a"), "click")
+
+        assert browser.actions == 2 and len(set(browser.tokens)) == 2
+
+    def test_repeated_unloads_time_out(self):
+        class _AlwaysUnloading(_NavigatingBrowser):
+            def execute_async_script(self, *args):
+                self.tokens.append(args[-1])
+                raise JavascriptException("javascript error: document unloaded while waiting for result")
+
+        browser = _AlwaysUnloading()
+        with pytest.raises(TimeoutException):
+            DomActions(browser).run((By.ID, "a"), "click", timeout=0.05)
+
+    def test_error_in_the_page_is_raised_without_retrying(self):
+        class _Failing(_NavigatingBrowser):
+            def execute_async_script(self, *args):
+                self.tokens.append(args[-1])
+                return {"done": False, "error": "TypeError: Cannot read properties of undefined (reading 'set')"}
+
+        browser = _Failing()
+        with pytest.raises(JavascriptException, match="reading 'set'"):
+            DomActions(browser).run((By.ID, "input-name"), "type", "MacBook", timeout=5)
+        assert len(browser.tokens) == 1
+
+    def test_script_error_is_not_mistaken_for_an_unload(self):
+        class _BadXPath(_NavigatingBrowser):
+            def execute_async_script(self, *args):
+                self.tokens.append(args[-1])
+                raise JavascriptException("javascript error: '//a[' is not a valid XPath expression.")
+
+        browser = _BadXPath()
+        with pytest.raises(JavascriptException, match="not a valid XPath"):
+            DomActions(browser).run((By.XPATH, "//a["), "click", timeout=5)
+        assert len(browser.tokens) == 1
@@ -0,0 +1,163 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.admin_dashboard_page import AdminDashboardPage
+from pages.admin_product_page import AdminProductPage
+from utils.base_page import BaseAdminPage
+from utils.dom_snapshot import HIDDEN_ATTRIBUTE, DomSnapshot
+from utils.soft_assert import DomAssertions, SoftAssert
+
+
+PAGE = """
+<nav id="column-left"><ul id="menu">
+  <li><a id="menu-catalog" href="#collapse-catalog">Catalog</a>
+    <ul id="collapse-catalog"><li><a href="/products"> Products </a><li><a href="/reviews">Reviews</a></ul>
+  <li><a href="/orders">Orders</a>
+</ul></nav>
+<div id="alert"><div class="alert alert-success alert-dismissible">Success: You have modified products!
+  <button type="button" class="btn-close" data-bs-dismiss="alert"></button></div></div>
+<form id="form-product">
+  <input type="text" name="filter_name" value="MacBook">
+  <select id="input-status"><option value="1">Enabled<option value="0" selected>Disabled</select>
+</form>
+<button type="submit" form="form-product" class="btn btn-primary">Save</button>
+<button type="submit" form="form-list" formaction="index.php?route=catalog/product|delete">Delete</button>
+<table class="table"><tbody>
+  <tr><td><input type="checkbox" name="selected[]" value="40"><td class="text-start">iPhone<td>10
+  <tr><td><input type="checkbox" name="selected[]" value="41"><td class="text-start">iMac<td>0
+</tbody></table>
+<p>First<p>Second
+"""
+
+
+@pytest.fixture()
+def dom() -> DomSnapshot:
+    return DomSnapshot(PAGE)
+
+
+def _texts(dom, elements):
+    return [dom.text(e) for e in elements]
+
+
+@pytest.mark.unit
+class TestDomSnapshotSelectors:
+
+    @pytest.mark.parametrize("locator", [
+        BaseAdminPage.ALERT_CLOSE_BUTTON,
+        AdminProductPage.ALERT_CLOSE,
+        AdminProductPage.SAVE,
+        AdminProductPage.DELETE,
+        AdminDashboardPage.PRODUCTS,
+        AdminDashboardPage.ORDERS,
+    ])
+    def test_page_object_locators_resolve(self, dom, locator):
+        assert len(dom.find_all(locator)) == 1
+
+    @pytest.mark.parametrize("css, expected", [
+        ("#menu > li > a", ["Catalog", "Orders"]),
+        ("ul#collapse-catalog a[href^='/']", ["Products", "Reviews"]),
+        ("table.table tbody tr td.text-start", ["iPhone", "iMac"]),
+        ("button[formaction*='product|delete'], a[href$='orders']", ["Orders", "Delete"]),
+    ])
+    def test_css(self, dom, css, expected):
+        assert _texts(dom, dom.select(css)) == expected
+
+    @pytest.mark.parametrize("xpath, expected", [
+        ("//ul[@id='collapse-catalog']/li[2]/a", ["Reviews"]),
+        ("//a[normalize-space()='Products' or text()='Orders']", ["Products", "Orders"]),
+        ("//td[starts-with(., 'iP')]", ["iPhone"]),
+        ("//button[@type='submit' and not(@formaction)]", ["Save"]),
+        (".//tr[.//input[@value='41']]/td[3]", None),
+        ("//tbody/tr[2]/td[2]", ["iMac"]),
+    ])
+    def test_xpath(self, dom, xpath, expected):
+        if expected is None:
+            with pytest.raises(ValueError, match="Unsupported XPath"):
+                dom.xpath(xpath)
+        else:
+            assert _texts(dom, dom.xpath(xpath)) == expected
+
+    def test_partial_link_text(self, dom):
+        assert _texts(dom, dom.find_all((By.PARTIAL_LINK_TEXT, "view"))) == ["Reviews"]
+
+    def test_unsupported_strategy(self, dom):
+        with pytest.raises(ValueError, match="Unsupported locator strategy"):
+            dom.find_all(("accessibility id", "save"))
+
+
+@pytest.mark.unit
+class TestDomSnapshotParsing:
+
+    def test_unclosed_cells_rows_and_list_items_are_siblings(self, dom):
+        assert [len(tr) for tr in dom.select("tbody > tr")] == [3, 3]
+        assert _texts(dom, dom.select("#collapse-catalog > li")) == ["Products", "Reviews"]
+        assert len(dom.select("#menu > li")) == 2
+
+    def test_unclosed_options_and_paragraphs(self, dom):
+        assert len(dom.select("select > option")) == 2
+        assert DomSnapshot.value(dom.find((By.ID, "input-status"))) == "0"
+        assert _texts(dom, dom.select("p")) == ["First", "Second"]
+
+    def test_nested_table_keeps_its_cells(self):
+        dom = DomSnapshot("<table><tr><td>a<table><tr><td>b<td>c</table><td>d</table>")
+        assert _texts(dom, dom.xpath("/table/tr/td")) == ["abc", "d"]
+
+
+# As captured: the browser marked the tooltip (display: none), the collapsed menu and its items
+# (hidden through their parent), and the badge with visibility: hidden around a visible label
+CAPTURED = f"""
+<table id="customer"><tr><td>Customer</td>
+  <td id="customer-name">John <span {HIDDEN_ATTRIBUTE}="">(guest)</span>Doe<script>track("customer")</script>
+    <style>#customer-name {{ font-weight: bold }}</style></td></tr></table>
+<div id="payment"><span {HIDDEN_ATTRIBUTE}="">Badge <b>Cash On Delivery</b></span>
+  <ul {HIDDEN_ATTRIBUTE}=""><li {HIDDEN_ATTRIBUTE}="">Bank Transfer</li></ul></div>
+<select id="hidden-status" {HIDDEN_ATTRIBUTE}=""><option selected>Pending</select>
+"""
+
+
+@pytest.mark.unit
+class TestRenderedText:
+    """text() follows WebElement.text, not the DOM's textContent."""
+
+    @pytest.fixture()
+    def captured(self):
+        return DomSnapshot(CAPTURED)
+
+    def test_hidden_script_and_style_text_is_left_out(self, captured):
+        cell = captured.find((By.ID, "customer-name"))
+        assert captured.text(cell) == "John Doe"
+        assert "(guest)" in "".join(cell.itertext())
+
+    def test_visible_child_of_a_hidden_element_is_rendered(self, captured):
+        assert captured.text(captured.find((By.ID, "payment"))) == "Cash On Delivery"
+
+    def test_hidden_element_has_no_text(self, captured):
+        assert captured.text(captured.find((By.CSS_SELECTOR, "#payment li"))) == ""
+        assert captured.text(captured.find((By.ID, "hidden-status"))) == ""
+
+    def test_xpath_string_values_still_see_all_text(self, captured):
+        assert len(captured.xpath("//td[contains(., '(guest)')]")) == 1
+
+    def test_capture_passes_the_marker_attribute(self):
+        class _Browser:
+            def execute_script(self, script, *args):
+                self.args = args
+                return CAPTURED
+
+        browser = _Browser()
+        DomSnapshot.capture(browser)
+        assert browser.args == (None, HIDDEN_ATTRIBUTE)
+
+
+@pytest.mark.unit
+class TestDomAssertions:
+
+    def test_unsupported_locator_fails_the_assertion(self, dom, request):
+        soft = SoftAssert(None, request)
+        assertions = DomAssertions(soft, dom)
+
+        assertions.assert_present((By.XPATH, "//a/.."))
+        assertions.assert_text(AdminDashboardPage.PRODUCTS, "Products")
+
+        assert len(soft._errors) == 1
+        assert "Unsupported XPath" in soft._errors[0][0]
@@ -0,0 +1,47 @@
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from utils.dom_waits import DomWaiter
+
+UNLOADED = "javascript error: document unloaded while waiting for result"
+
+
+class _Browser:
+    """Answers execute_async_script from a list: an exception is raised, anything else returned."""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.calls = 0
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, *args):
+        self.calls += 1
+        answer = self.answers[min(self.calls, len(self.answers)) - 1]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+@pytest.mark.unit
+class TestDomWaiterRetry:
+
+    def test_navigation_is_retried_on_the_new_page(self):
+        browser = _Browser(JavascriptException(UNLOADED), "element")
+        assert DomWaiter(browser).until((By.ID, "alert"), "present", timeout=5) == "element"
+        assert browser.calls == 2
+
+    def test_script_error_is_raised_at_once(self):
+        error = JavascriptException("javascript error: Failed to execute 'evaluate' on 'Document': "
+                                    "The string '//div[' is not a valid XPath expression.")
+        browser = _Browser(error)
+        with pytest.raises(JavascriptException, match="not a valid XPath expression"):
+            DomWaiter(browser).until((By.XPATH, "//div["), "present", timeout=5)
+        assert browser.calls == 1
+
+    def test_repeated_navigation_times_out(self):
+        browser = _Browser(JavascriptException("Document was unloaded"))
+        with pytest.raises(TimeoutException):
+            DomWaiter(browser).until((By.ID, "alert"), "present", timeout=0.05)
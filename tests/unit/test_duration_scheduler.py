@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils.duration_scheduler import DurationHistory, DurationScheduling, PlannedScheduling, variant_of
+
+BROWSERS = ("chrome", "firefox", "edge")
+
+
+class _Worker:
+    """Just enough of an xdist WorkerController for a scheduler: records the tests it is sent."""
+
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def _collection(*tests):
+    return [f"tests/test_a.py::{test}[{browser}]" for test in tests for browser in BROWSERS]
+
+
+def _schedule(scheduler, collection, workers=3):
+    nodes = [_Worker(f"gw{i}") for i in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    # Workers finish their tests in turn until the scheduler has handed everything out
+    done = {node: 0 for node in nodes}
+    while any(done[node] < len(node.sent) for node in nodes):
+        for node in nodes:
+            if done[node] < len(node.sent):
+                scheduler.mark_test_complete(node, node.sent[done[node]])
+                done[node] += 1
+    return {node.gateway.id: [collection[i] for i in node.sent] for node in nodes}
+
+
+def _worker_of(sent, nodeid):
+    return next(worker for worker, nodeids in sent.items() if nodeid in nodeids)
+
+
+@pytest.fixture()
+def config():
+    """The options an xdist scheduler reads: three local workers (-n 3)."""
+    return SimpleNamespace(getvalue={"tx": ["3*popen"]}.get)
+
+
+@pytest.mark.unit
+class TestVariantSpreading:
+
+    @pytest.mark.parametrize("nodeid, test", [
+        ("t.py::test_save[firefox]", "t.py::test_save"),
+        ("t.py::test_save[firefox-MacBook]", "t.py::test_save[MacBook]"),
+        ("t.py::test_save[edge]@products", "t.py::test_save"),
+        ("t.py::test_save", "t.py::test_save"),
+    ])
+    def test_variant_of(self, nodeid, test):
+        assert variant_of(nodeid, BROWSERS) == test
+
+    def test_variants_of_a_test_get_different_workers(self, config):
+        collection = _collection("test_add", "test_edit", "test_delete", "test_filter")
+        sent = _schedule(PlannedScheduling(config, variants=BROWSERS), collection)
+
+        for test in ("test_add", "test_edit", "test_delete", "test_filter"):
+            workers = {_worker_of(sent, f"tests/test_a.py::{test}[{browser}]") for browser in BROWSERS}
+            assert len(workers) == 3, test
+        # Each worker starts on a variant of the first test, so the three browsers run it side by side
+        assert sorted(nodeids[0] for nodeids in sent.values()) == sorted(_collection("test_add"))
+
+    def test_longest_first_keeps_variants_apart(self, config, tmp_path):
+        history = DurationHistory(str(tmp_path / "history.json"))
+        history._history = {f"tests/test_a.py::test_add[{b}]": [30.0] for b in BROWSERS}
+        history._history.update({f"tests/test_a.py::test_edit[{b}]": [5.0] for b in BROWSERS})
+        collection = _collection("test_add", "test_edit")
+        sent = _schedule(DurationScheduling(config, history, variants=BROWSERS), collection)
+
+        workers = {_worker_of(sent, f"tests/test_a.py::test_add[{b}]") for b in BROWSERS}
+        assert len(workers) == 3
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+
+from utils.test_data import DataNamespace, purge_leftover_products
+
+NOW = datetime(2026, 1, 21, 14, 0)
+
+
+class _ProductList:
+    """The "AUTO-" filtered product list, `per_page` rows a page, with AdminProductPage's purge actions."""
+
+    def __init__(self, names, per_page=2):
+        self.names = list(names)
+        self.per_page = per_page
+        self.page = 1
+        self.selected = []
+
+    def _rows(self):
+        start = (self.page - 1) * self.per_page
+        return self.names[start:start + self.per_page]
+
+    def search_by_name(self, name):
+        self.page = 1
+
+    def go_to_page(self, number):
+        if (number - 1) * self.per_page >= len(self.names):
+            return False
+        self.page = number
+        return True
+
+    def select_rows_where(self, predicate):
+        self.selected = [name for name in self._rows() if predicate(name)]
+        return len(self.selected)
+
+    def delete_selected(self):
+        self.names = [name for name in self.names if name not in self.selected]
+
+    def accept_delete_confirm(self):
+        pass
+
+    def wait_success_message(self):
+        pass
+
+
+@pytest.mark.unit
+class TestPurgeLeftoverProducts:
+
+    def test_leftovers_behind_a_page_of_running_workers_are_purged(self):
+        namespace = DataNamespace(run_id="aaaa", worker_id="gw0", started_at=NOW)
+        running = [f"AUTO-20260121T1355-bbbb-gw{i} Product" for i in range(3)]
+        stale = "AUTO-20260120T0900-cccc-gw0 Product"
+        products = _ProductList(running + [namespace.name("Product 1"), stale])
+
+        assert purge_leftover_products(products, namespace) == 2
+        assert products.names == running
@@ -0,0 +1,192 @@
+import importlib.util
+import subprocess
+
+import pytest
+
+from utils.test_impact import ImpactMap, ImpactRecorder, changed_lines, changed_units, fixture_scope, select_tests
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    """Git repo with one commit ("base") holding pages/a.py, pages/b.py and pages/c.py."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "tests@example.com")
+    _git(tmp_path, "config", "user.name", "tests")
+    (tmp_path / "pages").mkdir()
+    for name in "abc":
+        (tmp_path / "pages" / f"{name}.py").write_text("x = 1\ny = 2\nz = 3\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    _git(tmp_path, "tag", "base")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestChangedLines:
+
+    def test_modified_lines(self, repo):
+        (repo / "pages" / "b.py").write_text("x = 1\ny = 20\nz = 3\n")
+        assert changed_lines("base", str(repo)) == {"pages/b.py": {2}}
+
+    def test_deleted_file_after_a_modified_file(self, repo):
+        (repo / "pages" / "a.py").write_text("x = 10\ny = 2\nz = 3\n")
+        (repo / "pages" / "b.py").unlink()
+        assert changed_lines("base", str(repo)) == {"pages/a.py": {1}, "pages/b.py": set()}
+
+    def test_deleted_line_that_looks_like_a_header(self, repo):
+        (repo / "pages" / "c.py").write_text("-- a/pages/x.py\n++ b/pages/y.py\n")
+        _git(repo, "commit", "-q", "-am", "odd lines")
+        _git(repo, "tag", "odd")
+        (repo / "pages" / "c.py").unlink()
+        assert changed_lines("odd", str(repo)) == {"pages/c.py": set()}
+
+    def test_pure_deletion_touches_the_neighbouring_lines(self, repo):
+        (repo / "pages" / "a.py").write_text("x = 1\nz = 3\n")
+        assert changed_lines("base", str(repo)) == {"pages/a.py": {1, 2}}
+
+    def test_unknown_base_fails(self, repo):
+        with pytest.raises(subprocess.CalledProcessError):
+            changed_lines("no-such-ref", str(repo))
+
+
+PAGE = """\
+TIMEOUT = 10
+
+
+class ProductPage:
+    SAVE = ("css", "#save")
+
+    def save(self):
+        def confirm():
+            return True
+        return confirm()
+
+    def delete(self):
+        pass
+"""
+
+
+@pytest.fixture()
+def page_root(tmp_path):
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "product.py").write_text(PAGE)
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestChangedUnits:
+
+    @pytest.mark.parametrize("line, unit", [
+        (1, "pages/product.py::"),
+        (5, "pages/product.py::ProductPage"),
+        (10, "pages/product.py::ProductPage.save"),
+        (9, "pages/product.py::ProductPage.save.<locals>.confirm"),
+        (13, "pages/product.py::ProductPage.delete"),
+    ])
+    def test_innermost_definition(self, page_root, line, unit):
+        assert changed_units({"pages/product.py": {line}}, str(page_root)) == {unit}
+
+    def test_deleted_and_non_python_files_are_whole_file_units(self, page_root):
+        changes = {"pages/gone.py": set(), "utils/data.json": {3}}
+        assert changed_units(changes, str(page_root)) == {"pages/gone.py::", "utils/data.json::"}
+
+
+@pytest.mark.unit
+class TestSelectTests:
+    NODEIDS = ["tests/test_a.py::test_save", "tests/test_a.py::test_delete", "tests/test_b.py::test_new"]
+    IMPACT = {
+        "tests/test_a.py::test_save": ["pages/product.py::ProductPage.save.<locals>.confirm"],
+        "tests/test_a.py::test_delete": ["pages/product.py::ProductPage.delete", fixture_scope("admin_api")],
+    }
+
+    def _select(self, root, changes, shared=None):
+        return select_tests(self.NODEIDS, self.IMPACT, changes, str(root), shared)[0]
+
+    def test_changed_method_selects_its_callers_and_unmapped_tests(self, page_root):
+        assert self._select(page_root, {"pages/product.py": {13}}) == [
+            "tests/test_a.py::test_delete", "tests/test_b.py::test_new"]
+
+    def test_class_body_change_selects_every_method_caller(self, page_root):
+        assert self._select(page_root, {"pages/product.py": {5}}) == self.NODEIDS
+
+    def test_changed_test_file_is_selected(self, page_root):
+        assert self._select(page_root, {"tests/test_a.py": {1}}) == self.NODEIDS
+
+    def test_framework_configuration_selects_everything(self, page_root):
+        assert self._select(page_root, {"conftest.py": {1}}) == self.NODEIDS
+
+    def test_shared_fixture_dependencies(self, page_root):
+        shared = {
+            fixture_scope("admin_api"): ["utils/auth_cache.py::AdminAuthCache.login"],
+            "utils/auth_cache.py::AdminAuthCache.login": ["pages/product.py::ProductPage.save"],
+        }
+        assert self._select(page_root, {"pages/product.py": {10}}, shared) == self.NODEIDS
+        assert self._select(page_root, {"pages/product.py": {10}}) == [
+            "tests/test_a.py::test_save", "tests/test_b.py::test_new"]
+
+
+AUTH_CACHE = """\
+class AdminAuthCache:
+    def __init__(self):
+        self.token = None
+
+    def login(self):
+        if self.token is None:
+            self.token = _log_in()
+        return self.token
+
+
+def _log_in():
+    return "token"
+
+
+def open_products():
+    return "products"
+"""
+
+
+@pytest.mark.unit
+class TestImpactRecording:
+
+    @pytest.fixture()
+    def auth_cache(self, tmp_path):
+        (tmp_path / "utils").mkdir()
+        path = tmp_path / "utils" / "auth_cache.py"
+        path.write_text(AUTH_CACHE)
+        spec = importlib.util.spec_from_file_location("impact_auth_cache", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_cached_call_records_its_body_as_shared(self, tmp_path, auth_cache):
+        recorder = ImpactRecorder(str(tmp_path))
+        cache = auth_cache.AdminAuthCache()
+        recorder.start()
+        cache.login()
+        cache.login()
+        auth_cache.open_products()
+        calls = recorder.stop()
+
+        assert calls == ["utils/auth_cache.py::AdminAuthCache.login", "utils/auth_cache.py::open_products"]
+        assert recorder.shared == {"utils/auth_cache.py::AdminAuthCache.login": {"utils/auth_cache.py::_log_in"}}
+
+    def test_fixture_scope_and_map_round_trip(self, tmp_path, auth_cache):
+        recorder = ImpactRecorder(str(tmp_path))
+        recorder.start()
+        recorder.enter(fixture_scope("admin_api"))
+        auth_cache.open_products()
+        recorder.exit(fixture_scope("admin_api"))
+        calls = recorder.stop()
+
+        impact_map = ImpactMap(str(tmp_path / "map.json"))
+        impact_map.record("t::first", calls, recorder.shared, ["admin_api", "driver"])
+        impact_map.record("t::second", [], {}, ["admin_api"])
+        impact_map.save()
+
+        reloaded = ImpactMap(str(tmp_path / "map.json"))
+        assert reloaded.tests == {"t::first": [fixture_scope("admin_api")], "t::second": [fixture_scope("admin_api")]}
+        assert reloaded.shared == {fixture_scope("admin_api"): ["utils/auth_cache.py::open_products"]}
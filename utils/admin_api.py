@@ -0,0 +1,86 @@
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.routes import USER_TOKEN_PARAM, AdminRouter, admin_base_from_url, user_token_from_url
+
+
+class AdminApi:
+    """Calls OpenCart admin routes over HTTP with a logged-in browser's session (cookies + user_token).
+
+    Uses one pooled requests.Session, so setup/teardown calls reuse keep-alive connections
+    instead of driving the UI.
+    """
+
+    def __init__(self, admin_url: str, user_token: str, cookies: list[dict], separator: str | None = None,
+                 pool_size: int = 4, timeout: float = 15):
+        self.admin_url = admin_url
+        self.user_token = user_token
+        self.separator = separator if separator is not None else AdminRouter.separator
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        for cookie in cookies:
+            # Browsers report host-only cookies with the bare host as domain; cookiejar would then never
+            # send them to "localhost" (it matches that as "localhost.local"), so keep them host-only.
+            domain = cookie.get("domain", "")
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=domain if domain.startswith(".") else "", path=cookie.get("path", "/"),
+            )
+
+    @classmethod
+    def from_driver(cls, driver: WebDriver, separator: str | None = None) -> "AdminApi":
+        """Client sharing the session of a browser that is on an authenticated admin page."""
+        current = driver.current_url
+        token = user_token_from_url(current)
+        if not token:
+            raise AssertionError(f"No user_token in the current URL, log in first: {current}")
+        return cls(admin_base_from_url(current), token, driver.get_cookies(), separator=separator)
+
+    # -------------------------
+    # Requests
+    # -------------------------
+    def url(self, route: str, **params) -> str:
+        """Admin URL for a route; "{sep}" in the route becomes the method separator."""
+        query = {"route": route.format(sep=self.separator), USER_TOKEN_PARAM: self.user_token}
+        query.update({k: v for k, v in params.items() if v is not None})
+        return f"{self.admin_url}index.php?{urlencode(query, safe='/|')}"
+
+    def get(self, route: str, **params) -> str:
+        """GETs a route and returns the response body (HTML page or list fragment)."""
+        route = route.format(sep=self.separator)
+        response = self.session.get(self.url(route, **params), timeout=self.timeout, allow_redirects=False)
+        self._check(response, route)
+        return response.text
+
+    def post(self, route: str, data: dict, **params) -> dict:
+        """POSTs form data to an AJAX route and returns its JSON; raises AssertionError on an OpenCart error."""
+        route = route.format(sep=self.separator)
+        response = self.session.post(self.url(route, **params), data=data, timeout=self.timeout, allow_redirects=False)
+        self._check(response, route)
+        try:
+            body = response.json()
+        except ValueError:
+            raise AssertionError(f"{route} did not return JSON: {response.text[:200]}")
+
+        if body.get("error"):
+            raise AssertionError(f"{route} failed: {body['error']}")
+        return body
+
+    def close(self) -> None:
+        """Closes the pooled connections."""
+        self.session.close()
+
+    @staticmethod
+    def _check(response: requests.Response, route: str) -> None:
+        """Fails on redirects to the login page (expired session) and HTTP errors."""
+        if response.is_redirect:
+            raise AssertionError(f"{route} redirected to {response.headers.get('Location')} (session expired?)")
+        if response.status_code >= 400:
+            raise AssertionError(f"{route} returned HTTP {response.status_code}")
@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+from html.parser import HTMLParser
+
+from utils.admin_api import AdminApi
+
+
+# -------------------------
+# Records
+# -------------------------
+@dataclass(frozen=True)
+class OrderRecord:
+    """One row of the admin order list."""
+
+    order_id: int
+    customer: str
+    status: str
+    total: str
+    date_added: str
+
+
+@dataclass(frozen=True)
+class ProductRecord:
+    """One row of the admin product list."""
+
+    product_id: int
+    name: str
+    model: str
+    price: str
+    quantity: int
+    enabled: bool
+
+
+# -------------------------
+# List fragment parsing
+# -------------------------
+class _ListTableParser(HTMLParser):
+    """Collects the body rows of the first table in a list fragment: cell texts and the row checkbox value."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows: list[tuple[str, list[str]]] = []
+        self._depth = 0
+        self._in_body = False
+        self._done = False
+        self._row: list[str] | None = None
+        self._row_id = ""
+        self._cell: list[str] | None = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._done:
+            return
+        if tag == "table":
+            self._depth += 1
+        elif tag == "tbody" and self._depth == 1:
+            self._in_body = True
+        elif not self._in_body:
+            return
+        elif tag == "tr":
+            self._row, self._row_id = [], ""
+        elif tag == "td" and self._row is not None:
+            self._cell = []
+        elif tag == "br" and self._cell is not None:
+            self._cell.append(" ")
+        elif tag == "input" and self._row is not None:
+            attrs = dict(attrs)
+            if attrs.get("type") == "checkbox" and attrs.get("name") == "selected[]":
+                self._row_id = attrs.get("value", "")
+
+    def handle_endtag(self, tag):
+        if self._done:
+            return
+        if tag == "table":
+            self._depth -= 1
+            self._done = self._depth == 0
+        elif tag == "tbody":
+            self._in_body = False
+        elif tag == "td" and self._cell is not None:
+            self._row.append(" ".join("".join(self._cell).split()))
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            if self._row_id:
+                self.rows.append((self._row_id, self._row))
+            self._row = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def parse_list_rows(html: str) -> list[tuple[str, list[str]]]:
+    """(checkbox value, cell texts) for each data row of an admin list table ("No results!" rows are skipped)."""
+    parser = _ListTableParser()
+    parser.feed(html)
+    parser.close()
+    return parser.rows
+
+
+# -------------------------
+# Reader
+# -------------------------
+class AdminStateReader:
+    """Reads order and product state over HTTP (list fragments parsed locally) for post-condition checks.
+
+    Costs one request per list page instead of a page render plus waits in the browser,
+    and looks up many entities per request.
+    """
+
+    ORDER_LIST_ROUTE = "sale/order{sep}list"
+    PRODUCT_LIST_ROUTE = "catalog/product{sep}list"
+
+    # Column positions in the OpenCart 4 list tables (0 = row checkbox)
+    ORDER_COLUMNS = {"order_id": 1, "customer": 3, "status": 4, "total": 5, "date_added": 6}
+    PRODUCT_COLUMNS = {"name": 2, "model": 3, "price": 4, "quantity": 5, "status": 6}
+
+    def __init__(self, api: AdminApi):
+        self.api = api
+
+    # -------------------------
+    # Orders
+    # -------------------------
+    def orders(self, **filters) -> list[OrderRecord]:
+        """Orders on one list page; `filters` are list parameters (filter_order_id, filter_order_status_id, page...)."""
+        html = self.api.get(self.ORDER_LIST_ROUTE, **filters)
+        return [self._order(cells) for _, cells in parse_list_rows(html)]
+
+    def orders_by_id(self, order_ids) -> dict[int, OrderRecord]:
+        """Records for many orders: one request for the first list page, one filtered request per order not on it."""
+        wanted = {int(i) for i in order_ids}
+        found = {o.order_id: o for o in self.orders() if o.order_id in wanted}
+        for order_id in wanted - found.keys():
+            found.update({o.order_id: o for o in self.orders(filter_order_id=order_id) if o.order_id == order_id})
+        return found
+
+    def order(self, order_id: int | str) -> OrderRecord:
+        """Record for one order; raises AssertionError when the filtered list does not show it."""
+        order_id = int(order_id)
+        record = next((o for o in self.orders(filter_order_id=order_id) if o.order_id == order_id), None)
+        if record is None:
+            raise AssertionError(f"Order not found in list: {order_id}")
+        return record
+
+    # -------------------------
+    # Products
+    # -------------------------
+    def products(self, **filters) -> list[ProductRecord]:
+        """Products on one list page; `filters` are list parameters (filter_name, filter_model, page...)."""
+        html = self.api.get(self.PRODUCT_LIST_ROUTE, **filters)
+        return [self._product(product_id, cells) for product_id, cells in parse_list_rows(html)]
+
+    def products_by_id(self, product_ids, name_prefix: str | None = None) -> dict[int, ProductRecord]:
+        """Records for many products, reading list pages (optionally narrowed by a name prefix) until all are found."""
+        wanted = {int(i) for i in product_ids}
+        found: dict[int, ProductRecord] = {}
+        page = 1
+        while wanted - found.keys():
+            records = self.products(filter_name=name_prefix, page=page)
+            if not records:
+                break
+            found.update({p.product_id: p for p in records if p.product_id in wanted})
+            page += 1
+        return found
+
+    def product(self, product_id: int, name: str) -> ProductRecord:
+        """Record for one product (looked up by its current name); raises AssertionError when it is not listed."""
+        record = self.products_by_id([product_id], name_prefix=name).get(int(product_id))
+        if record is None:
+            raise AssertionError(f"Product #{product_id} not found in list: {name}")
+        return record
+
+    # -------------------------
+    # Row mapping
+    # -------------------------
+    def _order(self, cells: list[str]) -> OrderRecord:
+        col = self.ORDER_COLUMNS
+        return OrderRecord(
+            order_id=int(cells[col["order_id"]]),
+            customer=cells[col["customer"]],
+            status=cells[col["status"]],
+            total=cells[col["total"]],
+            date_added=cells[col["date_added"]],
+        )
+
+    def _product(self, product_id: str, cells: list[str]) -> ProductRecord:
+        col = self.PRODUCT_COLUMNS
+        quantity = cells[col["quantity"]].split()[0] if cells[col["quantity"]] else "0"
+        return ProductRecord(
+            product_id=int(product_id),
+            name=cells[col["name"]],
+            model=cells[col["model"]],
+            price=cells[col["price"]],
+            quantity=int(quantity) if quantity.lstrip("-").isdigit() else 0,
+            enabled=cells[col["status"]].lower() == "enabled",
+        )
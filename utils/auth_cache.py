@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import time
+
+from filelock import FileLock
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.admin_login_page import AdminLoginPage
+from utils.logger import get_logger
+
+
+class AdminAuthCache:
+    """Logs in once per admin credential and replays the session (cookies + user_token) into later browsers.
+
+    Entries are stored as owner-only JSON files guarded by a file lock, so every xdist worker
+    of a run reuses the same login. They hold live session cookies, so they only live for
+    one run: conftest clears the directory when the run starts and when it ends.
+    """
+
+    DASHBOARD_ROUTE = "index.php?route=common/dashboard&user_token={token}"
+
+    def __init__(self, cache_dir: str, lock_timeout: int = 120):
+        self.cache_dir = cache_dir
+        self.lock_timeout = lock_timeout
+        self.logger = get_logger()
+        self._entries: dict[str, dict] = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def login(self, driver: WebDriver, admin_url: str, username: str, password: str) -> str:
+        """Leaves the browser on the admin dashboard as `username` and returns the user_token."""
+        key = self._key(admin_url, username)
+
+        entry = self._entries.get(key) or self._read(key)
+        if entry and self._restore(driver, admin_url, entry):
+            self._entries[key] = entry
+            return entry["user_token"]
+
+        with FileLock(self._path(key) + ".lock", timeout=self.lock_timeout):
+            shared = self._read(key)
+            if shared and shared != entry and self._restore(driver, admin_url, shared):
+                self._entries[key] = shared
+                return shared["user_token"]
+
+            entry = self._login_via_ui(driver, admin_url, username, password)
+            self._write(key, entry)
+
+        self._entries[key] = entry
+        return entry["user_token"]
+
+    def invalidate(self, admin_url: str, username: str) -> None:
+        """Drops the cached session for a credential (e.g. after a test logs out)."""
+        key = self._key(admin_url, username)
+        self._entries.pop(key, None)
+        with FileLock(self._path(key) + ".lock", timeout=self.lock_timeout):
+            if os.path.exists(self._path(key)):
+                os.remove(self._path(key))
+
+    def clear(self) -> None:
+        """Deletes every stored session (in memory and on disk)."""
+        self._entries.clear()
+        for name in os.listdir(self.cache_dir):
+            if name.endswith((".json", ".tmp")):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    # -------------------------
+    # Login / restore
+    # -------------------------
+    def _login_via_ui(self, driver: WebDriver, admin_url: str, username: str, password: str) -> dict:
+        """Logs in through the login form and captures the resulting session."""
+        self.logger.info(f"[AUTH] Logging in through the UI as '{username}'")
+        login = AdminLoginPage(driver)
+        login.open(admin_url)
+        login.login_as(username, password)
+        token = login.wait_for_user_token()
+        login.close_alert_if_present()
+
+        return {
+            "user_token": token,
+            "cookies": driver.get_cookies(),
+            "created_at": time.time(),
+        }
+
+    def _restore(self, driver: WebDriver, admin_url: str, entry: dict) -> bool:
+        """Injects a cached session and checks OpenCart still accepts it."""
+        inject_cookies(driver, admin_url, entry["cookies"])
+        driver.get(admin_url + self.DASHBOARD_ROUTE.format(token=entry["user_token"]))
+
+        if AdminLoginPage(driver).is_logged_in():
+            return True
+
+        self.logger.info("[AUTH] Cached admin session expired, logging in again")
+        return False
+
+    # -------------------------
+    # Storage
+    # -------------------------
+    @staticmethod
+    def _key(admin_url: str, username: str) -> str:
+        """Stable file-safe key for an (admin URL, username) pair."""
+        return hashlib.sha1(f"{admin_url}|{username}".encode()).hexdigest()[:16]
+
+    def _path(self, key: str) -> str:
+        """Path of the JSON entry for a key."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read(self, key: str) -> dict | None:
+        """Loads a shared entry, or None when it is missing or unreadable."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, entry: dict) -> None:
+        """Atomically replaces the shared entry (callers hold the file lock)."""
+        tmp_path = self._path(key) + ".tmp"
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._path(key))
+
+
+def inject_cookies(driver: WebDriver, admin_url: str, cookies: list[dict]) -> None:
+    """Sets saved cookies (via CDP on Chromium, so no extra page load is needed)."""
+    if hasattr(driver, "execute_cdp_cmd"):
+        keys = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        params = []
+        for cookie in cookies:
+            param = {k: cookie[k] for k in keys if k in cookie}
+            if "expiry" in cookie:
+                param["expires"] = cookie["expiry"]
+            params.append(param)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+        return
+
+    driver.get(admin_url)
+    for cookie in cookies:
+        driver.add_cookie(cookie)
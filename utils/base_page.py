@@ -1,11 +1,49 @@
+import logging
+import sys
+import time
+from contextlib import contextmanager
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
+from utils.dom_actions import ActionStats, DomActions
+from utils.dom_waits import DomWaiter
+from utils.logger import get_logger
+from utils.network_idle import NetworkIdle
 
 
 class BaseAdminPage:
-    """Common Selenium helpers for OpenCart admin pages (waits, actions, and alert helpers)."""
+    """Common Selenium helpers for OpenCart admin pages (waits, actions, and alert helpers).
+
+    Waits run on one of two engines: "classic" (WebDriverWait polling) or "browser"
+    (one in-page MutationObserver wait per call). The default is set by --wait-engine.
+    When a TimeoutHistory is attached, every satisfied wait is recorded per locator and
+    (with --adaptive-timeouts) non-zero timeouts are derived from that history.
+
+    click/type/set_checkbox run on the "native" action engine (separate waits, scroll and
+    WebElement calls) or the "browser" one (one compound in-page script per action, see
+    DomActions), set by --action-engine. `trusted=True` always takes the native path.
+    """
+
+    WAIT_CLASSIC = "classic"
+    WAIT_BROWSER = "browser"
+    wait_engine = WAIT_CLASSIC
+    timeout_history = None
+
+    ACTION_NATIVE = "native"
+    ACTION_BROWSER = "browser"
+    action_engine = ACTION_NATIVE
+    action_stats = ActionStats()
+
+    # Wait condition name -> expected condition used by the classic engine
+    CONDITIONS = {
+        "present": EC.presence_of_element_located,
+        "visible": EC.visibility_of_element_located,
+        "clickable": EC.element_to_be_clickable,
+        "invisible": EC.invisibility_of_element_located,
+        "all_visible": EC.visibility_of_all_elements_located,
+    }
 
     # Admin common locators
     ALERT_CLOSE_BUTTON = (By.XPATH, "//button[@type='button' and contains(@class,'btn-close')]")
@@ -20,37 +58,97 @@ class BaseAdminPage:
     # Wait helpers
     # -------------------------
     def _wait(self, timeout: int | None = None) -> WebDriverWait:
-        """Creates a WebDriverWait using the default timeout (or a custom one)."""
-        return WebDriverWait(self.driver, timeout or self.timeout)
+        """Creates a WebDriverWait using the default timeout (or a custom one, including 0)."""
+        return WebDriverWait(self.driver, self.timeout if timeout is None else timeout)
+
+    def _until(self, condition: str, locator, timeout: int | None = None):
+        """Waits for a named condition on the selected engine; raises TimeoutException."""
+        timeout = self.timeout if timeout is None else timeout
+        history = self.timeout_history
+        if history:
+            timeout = history.timeout_for(condition, locator, timeout)
+
+        start = time.monotonic()
+        try:
+            if self.wait_engine == self.WAIT_BROWSER:
+                result = DomWaiter(self.driver).until(locator, condition, timeout)
+            else:
+                result = self._wait(timeout).until(self.CONDITIONS[condition](locator))
+        except TimeoutException:
+            self._log_wait(condition, locator, time.monotonic() - start, "timeout")
+            raise
+
+        elapsed = time.monotonic() - start
+        if history:
+            history.record(condition, locator, elapsed)
+        self._log_wait(condition, locator, elapsed, "ok")
+        return result
+
+    def _log_wait(self, condition: str, locator, seconds: float, outcome: str) -> None:
+        """Queues a structured DEBUG event for a wait (page-object method, locator, duration, outcome)."""
+        logger = get_logger()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        # First frame outside this module is the page-object method (or test) that asked for the wait
+        frame = sys._getframe(1)
+        while frame and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        method = f"{type(self).__name__}.{frame.f_code.co_name}" if frame else None
+
+        logger.debug(
+            f"{condition} {locator[1]} -> {outcome} in {seconds:.3f}s",
+            extra={
+                "method": method,
+                "locator": f"{locator[0]}={locator[1]}",
+                "condition": condition,
+                "duration": round(seconds, 4),
+                "outcome": outcome,
+            },
+        )
 
     def wait_visible(self, locator, timeout: int | None = None):
         """Waits until the element is visible and returns it."""
         try:
-            return self._wait(timeout).until(EC.visibility_of_element_located(locator))
+            return self._until("visible", locator, timeout)
         except TimeoutException:
             raise AssertionError(f"Timed out waiting for visible element: {locator}")
 
     def wait_present(self, locator, timeout: int | None = None):
         """Waits until the element exists in the DOM and returns it."""
         try:
-            return self._wait(timeout).until(EC.presence_of_element_located(locator))
+            return self._until("present", locator, timeout)
         except TimeoutException:
             raise AssertionError(f"Timed out waiting for present element: {locator}")
 
     def wait_clickable(self, locator, timeout: int | None = None):
         """Waits until the element is clickable and returns it."""
         try:
-            return self._wait(timeout).until(EC.element_to_be_clickable(locator))
+            return self._until("clickable", locator, timeout)
         except TimeoutException:
             raise AssertionError(f"Timed out waiting for clickable element: {locator}")
 
     def wait_invisible(self, locator, timeout=None):
         """Wait until the element becomes invisible or is removed from the DOM."""
         try:
-            return self._wait(timeout).until(EC.invisibility_of_element_located(locator))
+            return self._until("invisible", locator, timeout)
         except TimeoutException:
             raise AssertionError(f"Timed out waiting for INVISIBLE element: {locator}")
 
+    @contextmanager
+    def expect_ajax(self, timeout: int | None = None):
+        """Context manager: after the wrapped action, waits until the XHR/fetch requests it issued are done.
+
+        Replaces loader/staleness heuristics for AJAX list refreshes (filter, search, paging).
+        """
+        tracker = NetworkIdle(self.driver)
+        tracker.mark()
+        yield
+        try:
+            tracker.wait(self.timeout if timeout is None else timeout)
+        except TimeoutException:
+            raise AssertionError("Timed out waiting for AJAX requests to finish")
+
     # -------------------------
     # Element getters
     # -------------------------
@@ -61,7 +159,7 @@ class BaseAdminPage:
     def get_all(self, locator, timeout: int | None = None):
         """Returns all visible elements that match the locator."""
         try:
-            return self._wait(timeout).until(EC.visibility_of_all_elements_located(locator))
+            return self._until("all_visible", locator, timeout)
         except TimeoutException:
             raise AssertionError(f"Timed out waiting for visible elements: {locator}")
 
@@ -79,8 +177,28 @@ class BaseAdminPage:
         """Scrolls to the top of the page."""
         self.driver.execute_script("window.scrollTo(0, 0);")
 
-    def click(self, locator, timeout: int | None = None, scroll: bool = True) -> None:
-        """Clicks an element, with optional scroll and JS fallback."""
+    def _compound(self, trusted: bool) -> bool:
+        """True when an action should run as one in-page script."""
+        return self.action_engine == self.ACTION_BROWSER and not trusted
+
+    def _act(self, action: str, locator, timeout: int | None = None, **kwargs) -> dict:
+        """Runs a compound in-page action; raises AssertionError when the element never became actionable."""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        try:
+            result = DomActions(self.driver, self.action_stats).run(locator, action, timeout=timeout, **kwargs)
+        except TimeoutException as e:
+            self._log_wait(f"act_{action}", locator, time.monotonic() - start, "timeout")
+            raise AssertionError(f"Timed out waiting for actionable element: {locator} ({e.msg})")
+        self._log_wait(f"act_{action}", locator, time.monotonic() - start, "ok")
+        return result
+
+    def click(self, locator, timeout: int | None = None, scroll: bool = True, trusted: bool = False) -> None:
+        """Clicks an element, with optional scroll and JS fallback (trusted=True forces a native click)."""
+        if self._compound(trusted):
+            self._act("click", locator, timeout, scroll=scroll)
+            return
+
         element = self.wait_visible(locator, timeout)
         if scroll:
             self.scroll_into_view(element)
@@ -98,13 +216,28 @@ class BaseAdminPage:
             self.scroll_into_view(element)
         self.driver.execute_script("arguments[0].click();", element)
 
-    def type(self, locator, text: str, timeout: int | None = None, clear: bool = True) -> None:
-        """Types into a field (optionally clears first)."""
+    def type(self, locator, text: str, timeout: int | None = None, clear: bool = True, trusted: bool = False) -> None:
+        """Types into a field (optionally clears first; trusted=True sends real key events)."""
+        if self._compound(trusted):
+            self._act("type", locator, timeout, value=text, clear=clear)
+            return
+
         element = self.wait_visible(locator, timeout)
         if clear:
             element.clear()
         element.send_keys(text)
 
+    def set_checkbox(self, locator, enabled: bool, timeout: int | None = None, trusted: bool = False) -> None:
+        """Ensures a checkbox matches the expected on/off state."""
+        if self._compound(trusted):
+            self._act("checkbox", locator, timeout, value=enabled)
+            return
+
+        element = self.wait_present(locator, timeout)
+        self.scroll_into_view(element)
+        if element.is_selected() != enabled:
+            element.click()
+
     def text_of(self, locator, timeout: int | None = None) -> str:
         """Returns element text."""
         return self.wait_visible(locator, timeout).text.strip()
@@ -115,7 +248,7 @@ class BaseAdminPage:
     def is_present(self, locator, timeout: int = 0) -> bool:
         """True if the element appears in the DOM within the timeout."""
         try:
-            self._wait(timeout).until(EC.presence_of_element_located(locator))
+            self._until("present", locator, timeout)
             return True
         except TimeoutException:
             return False
@@ -123,7 +256,7 @@ class BaseAdminPage:
     def is_visible(self, locator, timeout: int = 0) -> bool:
         """True if the element becomes visible within the timeout."""
         try:
-            self._wait(timeout).until(EC.visibility_of_element_located(locator))
+            self._until("visible", locator, timeout)
             return True
         except TimeoutException:
             return False
@@ -131,7 +264,7 @@ class BaseAdminPage:
     def is_clickable(self, locator, timeout: int = 0) -> bool:
         """True if the element becomes clickable within the timeout."""
         try:
-            self._wait(timeout).until(EC.element_to_be_clickable(locator))
+            self._until("clickable", locator, timeout)
             return True
         except TimeoutException:
             return False
@@ -0,0 +1,147 @@
+import json
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+class CommandCounter:
+    """Counts WebDriver commands (HTTP round trips) sent through one driver."""
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.count = 0
+
+    @contextmanager
+    def counting(self):
+        """Counts every driver/element command issued inside the block."""
+        execute = self.driver.execute
+
+        def counted(driver_command, params=None):
+            self.count += 1
+            return execute(driver_command, params)
+
+        # Elements call their parent's execute(), so shadowing it on the instance covers both.
+        self.driver.execute = counted
+        try:
+            yield self
+        finally:
+            del self.driver.execute
+
+
+@dataclass
+class BenchmarkStats:
+    """Summary of one benchmarked page-object operation."""
+
+    name: str
+    iterations: int
+    median_s: float
+    p95_s: float
+    min_s: float
+    commands: float
+
+    @classmethod
+    def from_samples(cls, name: str, durations: list[float], commands: list[int]) -> "BenchmarkStats":
+        return cls(
+            name=name,
+            iterations=len(durations),
+            median_s=round(statistics.median(durations), 4),
+            p95_s=round(percentile(durations, 95), 4),
+            min_s=round(min(durations), 4),
+            commands=statistics.median(commands),
+        )
+
+
+class Benchmark:
+    """Runs page-object operations repeatedly and records wall time and WebDriver command counts."""
+
+    def __init__(self, iterations: int = 10, warmup: int = 1):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.results: dict[str, BenchmarkStats] = {}
+
+    def measure(
+        self,
+        name: str,
+        driver: WebDriver,
+        operation: Callable[[], object],
+        setup: Callable[[], object] | None = None,
+    ) -> BenchmarkStats:
+        """Times `operation` (after an untimed `setup` each round) and stores its statistics."""
+        counter = CommandCounter(driver)
+        durations, commands = [], []
+
+        for i in range(self.warmup + self.iterations):
+            if setup:
+                setup()
+            counter.count = 0
+            with counter.counting():
+                start = time.perf_counter()
+                operation()
+                elapsed = time.perf_counter() - start
+            if i >= self.warmup:
+                durations.append(elapsed)
+                commands.append(counter.count)
+
+        stats = BenchmarkStats.from_samples(name, durations, commands)
+        self.results[name] = stats
+        return stats
+
+
+class BenchmarkBaseline:
+    """Baseline JSON of benchmark statistics and the regression check against it."""
+
+    def __init__(self, path: str, threshold_pct: float = 20.0):
+        self.path = path
+        self.threshold_pct = threshold_pct
+        self.entries: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, results: dict[str, BenchmarkStats]) -> None:
+        """Merges the results into the baseline file."""
+        self.entries.update({name: asdict(stats) for name, stats in results.items()})
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+
+    def regressions(self, results: dict[str, BenchmarkStats]) -> list[str]:
+        """Operations whose median time or command count grew beyond the threshold."""
+        found = []
+        for name, stats in results.items():
+            base = self.entries.get(name)
+            if not base:
+                continue
+            for metric in ("median_s", "commands"):
+                old, new = base[metric], getattr(stats, metric)
+                if old and (new - old) / old * 100 > self.threshold_pct:
+                    found.append(f"{name}: {metric} {old} -> {new} (+{(new - old) / old * 100:.1f}%)")
+        return found
+
+    def format_table(self, results: dict[str, BenchmarkStats]) -> str:
+        """Plain-text results table with the change against the baseline."""
+        lines = [f"{'operation':<28}{'median':>10}{'p95':>10}{'cmds':>7}{'vs base':>10}"]
+        for name, stats in sorted(results.items()):
+            base = self.entries.get(name)
+            delta = ""
+            if base and base["median_s"]:
+                delta = f"{(stats.median_s - base['median_s']) / base['median_s'] * 100:+.1f}%"
+            lines.append(
+                f"{name:<28}{stats.median_s * 1000:>8.1f}ms{stats.p95_s * 1000:>8.1f}ms"
+                f"{stats.commands:>7g}{delta:>10}"
+            )
+        return "\n".join(lines)
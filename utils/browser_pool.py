@@ -0,0 +1,118 @@
+import threading
+from typing import Callable
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.logger import get_logger
+
+
+class BrowserPool:
+    """Keeps long-lived WebDriver sessions and hands a clean one to each test."""
+
+    BLANK_URL = "about:blank"
+
+    def __init__(self, factory: Callable[[], WebDriver], max_idle: int = 1):
+        self._factory = factory
+        self._max_idle = max_idle
+        self._idle: list[WebDriver] = []
+        self._all: list[WebDriver] = []
+        self._lock = threading.Lock()
+        self.logger = get_logger()
+
+    # -------------------------
+    # Lease
+    # -------------------------
+    def acquire(self) -> WebDriver:
+        """Returns an idle browser from the pool, or launches a new one."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+
+        driver = self._factory()
+        with self._lock:
+            self._all.append(driver)
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Resets the browser and returns it to the pool (or quits it if the reset fails)."""
+        if not self.reset(driver):
+            self.discard(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(driver)
+                return
+        self.discard(driver)
+
+    def discard(self, driver: WebDriver) -> None:
+        """Quits a browser and forgets it."""
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+            if driver in self._idle:
+                self._idle.remove(driver)
+        self._quit(driver)
+
+    def close_all(self) -> None:
+        """Quits every browser started by the pool (session teardown)."""
+        with self._lock:
+            drivers, self._all, self._idle = self._all, [], []
+        for driver in drivers:
+            self._quit(driver)
+
+    # -------------------------
+    # State reset
+    # -------------------------
+    def reset(self, driver: WebDriver) -> bool:
+        """Clears per-test state: alerts, extra tabs, storage, cookies, and the current page."""
+        try:
+            self._dismiss_alert(driver)
+            self._close_extra_windows(driver)
+            self._clear_storage(driver)
+            self._clear_cookies(driver)
+            driver.get(self.BLANK_URL)
+            return True
+        except WebDriverException as e:
+            self.logger.warning(f"[POOL] Browser reset failed, dropping session: {e.msg}")
+            return False
+
+    @staticmethod
+    def _dismiss_alert(driver: WebDriver) -> None:
+        """Dismisses an open alert/confirm so the session accepts commands again."""
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+    @staticmethod
+    def _close_extra_windows(driver: WebDriver) -> None:
+        """Closes every tab except the first one and switches back to it."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+    @staticmethod
+    def _clear_storage(driver: WebDriver) -> None:
+        """Clears local/session storage for the origin currently loaded."""
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+
+    @staticmethod
+    def _clear_cookies(driver: WebDriver) -> None:
+        """Clears cookies for all domains (CDP on Chromium, current domain otherwise)."""
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+
+    def _quit(self, driver: WebDriver) -> None:
+        """Quits a browser, ignoring sessions that are already gone."""
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
@@ -0,0 +1,65 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.logger import get_logger
+
+
+class BrowserPrewarmer:
+    """Launches browsers in background threads so fresh_browser tests get an already-started one.
+
+    `warm(count)` keeps `count` launches running or finished ahead of time (the caller
+    bounds it by the warm-ahead depth); `acquire()` hands out the oldest one, or launches
+    synchronously when none is warm. `close()` cancels queued launches, waits for running ones and quits every unused browser.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], depth: int = 1):
+        self._factory = factory
+        self.depth = depth
+        self._warm: deque[Future] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=depth + 1, thread_name_prefix="browser-prewarm")
+        self._lock = threading.Lock()
+        self._closed = False
+        self.logger = get_logger()
+
+    def warm(self, count: int = 1) -> None:
+        """Starts background launches until `count` browsers are warm or warming."""
+        with self._lock:
+            if self._closed:
+                return
+            while len(self._warm) < count:
+                self._warm.append(self._executor.submit(self._factory))
+
+    def acquire(self) -> WebDriver:
+        """Returns a pre-warmed browser (waiting for one still launching), or launches one now."""
+        with self._lock:
+            future = self._warm.popleft() if self._warm else None
+        if future is not None:
+            try:
+                return future.result()
+            except WebDriverException as e:
+                self.logger.warning(f"[PREWARM] Background launch failed, launching in the foreground: {e.msg}")
+        return self._factory()
+
+    def close(self) -> None:
+        """Cancels pending launches and quits every browser nobody acquired."""
+        with self._lock:
+            self._closed = True
+            futures, self._warm = list(self._warm), deque()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+        for future in futures:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            try:
+                future.result().quit()
+            except WebDriverException:
+                pass
+
+
+browser_prewarmers_key = pytest.StashKey[dict]()
@@ -0,0 +1,122 @@
+from dataclasses import dataclass, replace
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+
+# Chrome prefs used by every profile (no password/autofill popups over the admin forms)
+CHROME_PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "autofill.profile_enabled": False,
+    "autofill.credit_card_enabled": False
+}
+
+# The same popups, in Firefox preference names
+FIREFOX_PREFS = {
+    "signon.rememberSignons": False,
+    "extensions.formautofill.addresses.enabled": False,
+    "extensions.formautofill.creditCards.enabled": False,
+    "browser.shell.checkDefaultBrowser": False,
+}
+
+BROWSERS = ("chrome", "firefox", "edge")
+
+# Resources the admin pages load but the tests never look at: product thumbnails,
+# web fonts and the dashboard chart/map widgets. CKEditor is kept, the product form needs it.
+FAST_BLOCKED_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.eot",
+    "*/image/cache/*",
+    "*dashboard/chart*", "*dashboard/map*", "*jqvmap*", "*flot*",
+]
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    """How a browser is launched: window mode, Chrome switches, and URL patterns blocked via CDP."""
+
+    name: str
+    headless: bool = False
+    window_size: tuple[int, int] | None = None
+    arguments: tuple[str, ...] = ()
+    blocked_urls: tuple[str, ...] = ()
+
+    def with_blocked_urls(self, patterns: list[str]) -> "BrowserProfile":
+        """Copy of the profile with extra URL patterns blocked."""
+        return replace(self, blocked_urls=self.blocked_urls + tuple(p for p in patterns if p))
+
+
+PROFILES = {
+    "default": BrowserProfile(name="default", arguments=("--start-maximized",)),
+    "fast": BrowserProfile(
+        name="fast",
+        headless=True,
+        window_size=(1920, 1080),
+        arguments=("--disable-extensions", "--disable-gpu", "--no-first-run", "--mute-audio"),
+        blocked_urls=tuple(FAST_BLOCKED_URLS),
+    ),
+}
+
+
+def chrome_options(profile: BrowserProfile) -> Options:
+    """Chrome options for a profile."""
+    options = Options()
+    if profile.headless:
+        options.add_argument("--headless=new")
+    if profile.window_size:
+        options.add_argument("--window-size={},{}".format(*profile.window_size))
+    for argument in profile.arguments:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    return options
+
+
+def edge_options(profile: BrowserProfile) -> EdgeOptions:
+    """Edge options for a profile (Chromium switches and prefs, like Chrome)."""
+    options = EdgeOptions()
+    if profile.headless:
+        options.add_argument("--headless=new")
+    if profile.window_size:
+        options.add_argument("--window-size={},{}".format(*profile.window_size))
+    for argument in profile.arguments:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    return options
+
+
+def firefox_options(profile: BrowserProfile) -> FirefoxOptions:
+    """Firefox options for a profile; Chrome-only switches are dropped (maximizing happens after launch)."""
+    options = FirefoxOptions()
+    if profile.headless:
+        options.add_argument("-headless")
+    if profile.window_size:
+        options.add_argument("--width={}".format(profile.window_size[0]))
+        options.add_argument("--height={}".format(profile.window_size[1]))
+    for name, value in FIREFOX_PREFS.items():
+        options.set_preference(name, value)
+    return options
+
+
+def launch_browser(browser: str, profile: BrowserProfile):
+    """Starts a WebDriver session of `browser` ("chrome", "firefox" or "edge") for a profile."""
+    if browser == "chrome":
+        return webdriver.Chrome(options=chrome_options(profile))
+    if browser == "edge":
+        return webdriver.Edge(options=edge_options(profile))
+    if browser == "firefox":
+        driver = webdriver.Firefox(options=firefox_options(profile))
+        if "--start-maximized" in profile.arguments:
+            driver.maximize_window()
+        return driver
+    raise ValueError(f"Unknown browser '{browser}', expected one of: {', '.join(BROWSERS)}")
+
+
+def apply_network_blocking(driver, profile: BrowserProfile) -> None:
+    """Blocks the profile's URL patterns through the DevTools protocol (Chromium only)."""
+    if not profile.blocked_urls or not hasattr(driver, "execute_cdp_cmd"):
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)})
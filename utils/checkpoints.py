@@ -0,0 +1,117 @@
+from dataclasses import dataclass, field
+from typing import Callable
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.auth_cache import inject_cookies
+from utils.logger import get_logger
+from utils.routes import admin_base_from_url
+
+
+# Failures worth resuming from a checkpoint: waits that ran out and elements replaced mid-action.
+# The page objects turn wait timeouts into AssertionError("Timed out waiting ...").
+TRANSIENT_ERRORS = (TimeoutException, StaleElementReferenceException)
+TRANSIENT_MESSAGES = ("Timed out waiting",)
+
+
+def is_transient(excinfo) -> bool:
+    """True when a test failure looks like a timing problem rather than a real defect."""
+    if excinfo.errisinstance(TRANSIENT_ERRORS):
+        return True
+    return excinfo.errisinstance(AssertionError) and str(excinfo.value).startswith(TRANSIENT_MESSAGES)
+
+
+@dataclass
+class Checkpoint:
+    """Browser state after a successful step: enough to reopen the page in the same session."""
+
+    step: str
+    url: str | None = None
+    cookies: list[dict] = field(default_factory=list)
+    result: object = None
+
+
+@dataclass
+class CheckpointLog:
+    """Checkpoints of one test item; kept in the item's stash, so it survives pytest-rerunfailures reruns."""
+
+    checkpoints: dict[str, Checkpoint] = field(default_factory=dict)
+    order: list[str] = field(default_factory=list)
+    resumable: bool = False
+
+    def clear(self) -> None:
+        self.checkpoints.clear()
+        self.order.clear()
+        self.resumable = False
+
+
+checkpoint_log_key = pytest.StashKey[CheckpointLog]()
+
+
+class StepRunner:
+    """Runs a test's named workflow steps and resumes a rerun from the last restorable checkpoint.
+
+    Each `run(name, action)` records a checkpoint on success. Restorable steps (the default)
+    store the URL and cookies; steps that only change in-page state (e.g. filling a form) pass
+    restorable=False and are re-run. After a transient failure, the rerun skips every step up
+    to the last restorable checkpoint, reopens its URL with its cookies and continues from there.
+    Skipped steps return the value they returned originally (keep it plain data, not elements).
+    Steps that are not safe to repeat (e.g. a save) pass `done`, asked before they re-run on a
+    resumed run: a truthy answer means the failed run's attempt already took effect, and it
+    becomes the step's result instead of running the action again.
+    """
+
+    def __init__(self, driver: WebDriver, log: CheckpointLog):
+        self.driver = driver
+        self.log = log
+        self.logger = get_logger()
+        self._resume_at = self._resume_point() if log.resumable else None
+        self.resumed = self._resume_at is not None
+        self._skipping = self.resumed
+        if not self._skipping:
+            log.clear()
+
+    def run(self, name: str, action: Callable[[], object], restorable: bool = True,
+            done: Callable[[], object] | None = None):
+        """Runs (or, when resuming, skips) a step and records its checkpoint."""
+        if self._skipping:
+            checkpoint = self.log.checkpoints.get(name)
+            if checkpoint is None:
+                raise AssertionError(f"Step '{name}' was not part of the failed run; cannot resume")
+            if name == self._resume_at:
+                self._restore(checkpoint)
+                self._skipping = False
+            self.logger.info(f"[STEP] {name}: skipped, done in the failed run")
+            return checkpoint.result
+
+        result = done() if self.resumed and done is not None else None
+        if result:
+            self.logger.info(f"[STEP] {name}: not repeated, it took effect in the failed run")
+        else:
+            result = action()
+        checkpoint = Checkpoint(name, result=result)
+        if restorable:
+            checkpoint.url = self.driver.current_url
+            checkpoint.cookies = self.driver.get_cookies()
+        if name not in self.log.checkpoints:
+            self.log.order.append(name)
+        self.log.checkpoints[name] = checkpoint
+        return result
+
+    def _resume_point(self) -> str | None:
+        """Last restorable checkpoint of the failed run."""
+        for name in reversed(self.log.order):
+            if self.log.checkpoints[name].url:
+                return name
+        return None
+
+    def _restore(self, checkpoint: Checkpoint) -> None:
+        """Reopens the checkpoint's page with its cookies."""
+        self.logger.info(f"[STEP] Resuming after '{checkpoint.step}' at {checkpoint.url}")
+        try:
+            inject_cookies(self.driver, admin_base_from_url(checkpoint.url), checkpoint.cookies)
+            self.driver.get(checkpoint.url)
+        except WebDriverException as e:
+            raise AssertionError(f"Could not restore checkpoint '{checkpoint.step}': {e.msg}")
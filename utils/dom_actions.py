@@ -0,0 +1,193 @@
+import time
+import uuid
+from dataclasses import dataclass
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+from utils.dom_waits import ensure_script_timeout, is_unload_error, to_dom_query
+
+
+# Locates the element, waits until it is actionable, scrolls it into view and performs the
+# action, all inside the page. Returns {done: true, ...} or, on timeout, {done: false, reason}.
+# The call's token is stored in sessionStorage (it survives same-origin navigation) right
+# before acting, so a retry after the page unloaded knows the action already happened; an
+# action that throws removes it again, so it is never mistaken for one that happened, and
+# reports {done: false, error}.
+_ACTION_SCRIPT = """
+const [kind, query, action, value, options, timeoutMs, token, done] = arguments;
+const PERFORMED_KEY = "dom-actions:performed";
+
+function performed() {
+    try { return sessionStorage.getItem(PERFORMED_KEY) === token; } catch (e) { return window[PERFORMED_KEY] === token; }
+}
+function markPerformed() {
+    try { sessionStorage.setItem(PERFORMED_KEY, token); } catch (e) { window[PERFORMED_KEY] = token; }
+}
+function clearPerformed() {
+    try { sessionStorage.removeItem(PERFORMED_KEY); } catch (e) { delete window[PERFORMED_KEY]; }
+}
+if (performed()) {
+    done({done: true, unloaded: true});
+    return;
+}
+
+function find() {
+    if (kind === "css") return document.querySelector(query);
+    return document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function visible(el) {
+    if (!el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.visibility === "hidden" || style.display === "none" || style.opacity === "0") return false;
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+
+let reason = "not found";
+function attempt() {
+    const el = find();
+    if (!el) { reason = "not found"; return null; }
+    // Checkboxes are often styled switches over a hidden input; they only need to exist
+    if (action !== "checkbox" && !visible(el)) { reason = "not visible"; return null; }
+    if (el.disabled) { reason = "disabled"; return null; }
+    if (action === "type" && el.readOnly) { reason = "read-only"; return null; }
+    if (options.scroll) el.scrollIntoView({block: "center", inline: "nearest"});
+
+    if (!["click", "type", "checkbox"].includes(action)) throw new Error("Unknown action: " + action);
+    markPerformed();
+    try {
+        return act(el);
+    } catch (e) {
+        clearPerformed();
+        throw e;
+    }
+}
+function act(el) {
+    if (action === "click") {
+        // Dispatched on the element itself, like the native path's JS-click fallback for covered elements
+        el.click();
+        return {done: true};
+    }
+    if (action === "type") {
+        el.focus();
+        // The prototype's setter, so frameworks that wrap `value` still see the change
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set;
+        setter.call(el, (options.clear ? "" : el.value) + value);
+        el.dispatchEvent(new Event("input", {bubbles: true}));
+        el.dispatchEvent(new Event("change", {bubbles: true}));
+        return {done: true, value: el.value};
+    }
+    const changed = el.checked !== value;
+    if (changed) el.click();
+    return {done: true, changed: changed};
+}
+
+let settled = false, observer = null, poll = null, timer = null;
+function finish(result) {
+    if (settled) return;
+    settled = true;
+    if (observer) observer.disconnect();
+    clearInterval(poll);
+    clearTimeout(timer);
+    done(result);
+}
+function check() {
+    if (settled) return;
+    let result;
+    try {
+        result = attempt();
+    } catch (e) {
+        // Reported, not thrown: thrown from an observer or poll callback it would never reach the caller
+        finish({done: false, error: String(e)});
+        return;
+    }
+    if (result) finish(result);
+}
+
+check();
+if (!settled) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    poll = setInterval(check, 50);
+    timer = setTimeout(() => finish({done: false, reason: reason}), timeoutMs);
+}
+"""
+
+# Minimum WebDriver commands the native path of each action needs when every wait succeeds
+# on its first poll (e.g. click: find + isDisplayed, scroll script, find + isDisplayed +
+# isEnabled, click). The compound path needs one.
+NATIVE_ROUND_TRIPS = {"click": 7, "type": 4, "checkbox": 4}
+
+
+@dataclass
+class ActionStats:
+    """Compound actions run and WebDriver round trips they saved (reset per test by conftest)."""
+
+    actions: int = 0
+    round_trips_saved: int = 0
+
+    def record(self, action: str) -> None:
+        self.actions += 1
+        self.round_trips_saved += NATIVE_ROUND_TRIPS[action] - 1
+
+    def reset(self) -> None:
+        self.actions = 0
+        self.round_trips_saved = 0
+
+
+class DomActions:
+    """Runs "locate, wait until actionable, scroll, act" as one execute_async_script call.
+
+    Actions use DOM events (element.click(), value setter + input/change events), not
+    trusted OS-level input; callers that need real key/mouse events use the native path.
+    """
+
+    ACTIONS = tuple(NATIVE_ROUND_TRIPS)
+
+    def __init__(self, driver, stats: ActionStats | None = None):
+        self.driver = driver
+        self.stats = stats
+
+    def run(self, locator, action: str, value=None, timeout: float = 10,
+            scroll: bool = True, clear: bool = True) -> dict:
+        """Performs the action once the element is actionable; raises TimeoutException with the reason.
+
+        A retry after the document was replaced only acts if the action has not happened yet;
+        an unload caused by the action itself (a navigating click) counts as success.
+        """
+        if action not in self.ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+
+        kind, query = to_dom_query(locator)
+        options = {"scroll": scroll, "clear": clear}
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + timeout
+        result = {"done": False, "reason": "not found"}
+        final = False
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            ensure_script_timeout(self.driver, remaining)
+            try:
+                result = self.driver.execute_async_script(
+                    _ACTION_SCRIPT, kind, query, action, value, options, int(remaining * 1000), token
+                )
+            except JavascriptException as e:
+                # The document was replaced: retry on the new page, which reports an action that already
+                # happened as done. One more call is made even at the deadline to find that out.
+                # Any other script error (a bad XPath, a throwing setter) is raised as it is.
+                if not is_unload_error(e):
+                    raise
+                if final:
+                    break
+                final = time.monotonic() >= deadline
+                continue
+
+            if result and result.get("error"):
+                raise JavascriptException(f"{action} on {locator} failed in the page: {result['error']}")
+            if result and result.get("done"):
+                if self.stats is not None:
+                    self.stats.record(action)
+                return result
+            if time.monotonic() >= deadline:
+                break
+
+        raise TimeoutException(f"{action} not possible on {locator} within {timeout}s: {result.get('reason')}")
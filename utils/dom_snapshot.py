@@ -0,0 +1,492 @@
+import copy
+import re
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+
+from selenium.webdriver.common.by import By
+
+
+# Serializes the document (or the first match of a CSS selector) once, copying live form
+# state (typed values, checked boxes, selected options) into attributes so it survives, and
+# marking elements that are not rendered (display: none, visibility: hidden, opacity: 0,
+# also through an ancestor) so text() leaves them out like WebElement.text does.
+_SERIALIZE_SCRIPT = """
+const [rootCss, hiddenAttribute] = arguments;
+const root = rootCss ? document.querySelector(rootCss) : document.documentElement;
+if (!root) return null;
+const clone = root.cloneNode(true);
+const liveAll = [root, ...root.querySelectorAll("*")];
+const copyAll = [clone, ...clone.querySelectorAll("*")];
+liveAll.forEach((el, i) => {
+    // Options of a closed select have no box of their own; their select decides
+    if (el.tagName === "OPTION" || el.tagName === "OPTGROUP") return;
+    let hidden;
+    if (el.checkVisibility) {
+        hidden = !el.checkVisibility({visibilityProperty: true, opacityProperty: true});
+    } else {
+        const style = window.getComputedStyle(el);
+        hidden = style.visibility === "hidden" || style.opacity === "0" || !el.getClientRects().length;
+    }
+    if (hidden) copyAll[i].setAttribute(hiddenAttribute, "");
+});
+const live = [root, ...root.querySelectorAll("input, textarea, select option")];
+const copy = [clone, ...clone.querySelectorAll("input, textarea, select option")];
+live.forEach((el, i) => {
+    const target = copy[i];
+    if (el.tagName === "INPUT") {
+        target.setAttribute("value", el.value);
+        if (el.checked) target.setAttribute("checked", ""); else target.removeAttribute("checked");
+    } else if (el.tagName === "TEXTAREA") {
+        target.textContent = el.value;
+    } else if (el.tagName === "OPTION") {
+        if (el.selected) target.setAttribute("selected", ""); else target.removeAttribute("selected");
+    }
+});
+return clone.outerHTML;
+"""
+
+HIDDEN_ATTRIBUTE = "data-snapshot-hidden"
+# Elements whose content is never rendered as text
+UNRENDERED_TAGS = {"head", "noscript", "script", "style", "template"}
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source",
+             "track", "wbr"}
+
+# Start tags that end an open element without its end tag, like a browser's parser does:
+# tag -> (open tags it closes, tags that stop the search, e.g. a nested list or table)
+_TABLE_SECTIONS = {"tbody", "thead", "tfoot"}
+_CLOSES_P = ({"p"}, {"button", "caption", "table", "td", "th", "template"})
+_IMPLIED_END = {
+    "li": ({"li"}, {"ol", "ul"}),
+    "dt": ({"dd", "dt"}, {"dl"}),
+    "dd": ({"dd", "dt"}, {"dl"}),
+    "td": ({"td", "th"}, {"table", "tr"}),
+    "th": ({"td", "th"}, {"table", "tr"}),
+    "tr": ({"td", "th", "tr"}, {"table"} | _TABLE_SECTIONS),
+    **{tag: ({"td", "th", "tr"} | _TABLE_SECTIONS, {"table"}) for tag in _TABLE_SECTIONS},
+    "option": ({"option"}, {"datalist", "optgroup", "select"}),
+    "optgroup": ({"optgroup", "option"}, {"datalist", "select"}),
+    **{tag: _CLOSES_P for tag in ("address", "article", "aside", "blockquote", "div", "dl", "fieldset", "footer",
+                                  "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "main", "nav",
+                                  "ol", "p", "pre", "section", "table", "ul")},
+}
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds an ElementTree from (possibly sloppy) HTML: void tags, implied end tags (p, li, dt/dd, table
+    rows/cells/sections, option/optgroup) and stray end tags."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = ET.Element("document")
+        self._stack = [self.root]
+
+    def _close_implied(self, tag):
+        closes, stops = _IMPLIED_END[tag]
+        close_from = None
+        for i in range(len(self._stack) - 1, 0, -1):
+            open_tag = self._stack[i].tag
+            if open_tag in stops:
+                break
+            if open_tag in closes:
+                close_from = i
+        if close_from is not None:
+            del self._stack[close_from:]
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _IMPLIED_END:
+            self._close_implied(tag)
+        element = ET.SubElement(self._stack[-1], tag, {k: v or "" for k, v in attrs})
+        if tag not in VOID_TAGS:
+            self._stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in _IMPLIED_END:
+            self._close_implied(tag)
+        ET.SubElement(self._stack[-1], tag, {k: v or "" for k, v in attrs})
+
+    def handle_endtag(self, tag):
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data):
+        parent = self._stack[-1]
+        if len(parent):
+            parent[-1].tail = (parent[-1].tail or "") + data
+        else:
+            parent.text = (parent.text or "") + data
+
+
+# -------------------------
+# CSS selector subset
+# -------------------------
+_ATTR = re.compile(r"""\[\s*([\w-]+)\s*(?:([~^$*|]?=)\s*(?:"([^"]*)"|'([^']*)'|([^\]\s]+)))?\s*\]""")
+_BRACKET = r"""\[(?:[^\]'"]|'[^']*'|"[^"]*")*\]"""
+_COMPOUND = re.compile(rf"(\*|[a-zA-Z][\w-]*)?((?:#[\w-]+|\.[\w-]+|{_BRACKET})*)$")
+
+
+def _parse_compound(text: str) -> tuple[str | None, list]:
+    """(tag, [(attribute, op, value)]) for one compound selector like `a.btn[title='Edit']`."""
+    match = _COMPOUND.match(text)
+    if not match:
+        raise ValueError(f"Unsupported CSS selector part: {text}")
+    tag = None if match.group(1) in (None, "*") else match.group(1).lower()
+
+    checks, rest = [], match.group(2)
+    while rest:
+        if rest[0] == "#":
+            name = re.match(r"#([\w-]+)", rest).group(1)
+            checks.append(("id", "=", name))
+            rest = rest[len(name) + 1:]
+        elif rest[0] == ".":
+            name = re.match(r"\.([\w-]+)", rest).group(1)
+            checks.append(("class", "~=", name))
+            rest = rest[len(name) + 1:]
+        else:
+            attr = _ATTR.match(rest)
+            if not attr:
+                raise ValueError(f"Unsupported CSS selector part: {text}")
+            value = next((v for v in attr.groups()[2:] if v is not None), None)
+            checks.append((attr.group(1), attr.group(2), value))
+            rest = rest[attr.end():]
+    return tag, checks
+
+
+def _parse_selector(selector: str) -> list[list[tuple[str, str | None, list]]]:
+    """Comma groups of [(combinator, tag, checks)], combinator being " " (descendant) or ">" (child)."""
+    groups = []
+    for group in selector.split(","):
+        tokens = re.findall(rf"{_BRACKET}|>|\s+|[^\s>\[]+", group.strip())
+        steps, current, combinator = [], "", " "
+        for token in tokens + [" "]:
+            if token == ">" or token.isspace():
+                if current:
+                    steps.append((combinator, *_parse_compound(current)))
+                    current, combinator = "", " "
+                if token == ">":
+                    combinator = ">"
+            else:
+                current += token
+        groups.append(steps)
+    return groups
+
+
+def _matches_compound(element: ET.Element, tag: str | None, checks: list) -> bool:
+    if tag and element.tag != tag:
+        return False
+    for name, op, value in checks:
+        actual = element.get(name)
+        if actual is None:
+            return False
+        if op is None:
+            continue
+        if op == "=" and actual != value:
+            return False
+        if op == "~=" and value not in actual.split():
+            return False
+        if op == "^=" and not actual.startswith(value):
+            return False
+        if op == "$=" and not actual.endswith(value):
+            return False
+        if op == "*=" and value not in actual:
+            return False
+        if op == "|=" and actual != value and not actual.startswith(value + "-"):
+            return False
+    return True
+
+
+# -------------------------
+# XPath subset
+# -------------------------
+_XPATH_TOKEN = re.compile(r"""\s*(//|/|!=|=|\[|\]|\(|\)|,|\*|\.|@[\w-]+|'[^']*'|"[^"]*"|\d+|[A-Za-z_][\w-]*)""")
+
+
+def _string_value(element: ET.Element) -> str:
+    return "".join(element.itertext())
+
+
+def _rendered_text(element: ET.Element) -> str:
+    """Text of an element without unrendered tags; a hidden element's own text is left out, its children decide."""
+    if element.tag in UNRENDERED_TAGS:
+        return ""
+    shown = element.get(HIDDEN_ATTRIBUTE) is None
+    parts = [element.text or ""] if shown else []
+    for child in element:
+        parts.append(_rendered_text(child))
+        if shown:
+            parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _as_string(value) -> str:
+    """XPath string(): first node of a node-set, or the value itself."""
+    if isinstance(value, list):
+        return value[0] if value else ""
+    return value
+
+
+class _XPathParser:
+    """Compiles the XPath subset DomSnapshot supports into [(axis, tag, [predicate])] steps.
+
+    Paths of child (/) and descendant (//) steps with a tag or *, predicates combining
+    `and`/`or`/not() over @attr, `.`, text(), string literals, =, !=, contains(),
+    starts-with(), normalize-space(), and positions like [2]. Anything else is a ValueError.
+    """
+
+    def __init__(self, xpath: str):
+        self.xpath = xpath
+        self.tokens = []
+        pos = 0
+        while pos < len(xpath):
+            match = _XPATH_TOKEN.match(xpath, pos)
+            if not match or not match.group(1):
+                if xpath[pos:].strip():
+                    self._fail()
+                break
+            self.tokens.append(match.group(1))
+            pos = match.end()
+        self.pos = 0
+
+    def _fail(self):
+        raise ValueError(f"Unsupported XPath for DOM snapshots: {self.xpath}")
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self, expected=None):
+        token = self._peek()
+        if token is None or (expected is not None and token != expected):
+            self._fail()
+        self.pos += 1
+        return token
+
+    # -- paths --
+    def parse(self) -> list:
+        if self._peek() == ".":
+            self._next()
+        if self._peek() not in ("/", "//"):
+            self._fail()
+        steps = []
+        while self._peek() in ("/", "//"):
+            axis = self._next()
+            tag = self._next()
+            if tag != "*" and not re.fullmatch(r"[A-Za-z_][\w-]*", tag):
+                self._fail()
+            predicates = []
+            while self._peek() == "[":
+                self._next()
+                predicates.append(self._predicate())
+                self._next("]")
+            steps.append((axis, None if tag == "*" else tag.lower(), predicates))
+        if self._peek() is not None:
+            self._fail()
+        return steps
+
+    # -- predicates: functions (element, position) -> bool --
+    def _predicate(self):
+        if (self._peek() or "").isdigit() and self.tokens[self.pos + 1:self.pos + 2] == ["]"]:
+            index = int(self._next())
+            return lambda element, position: position == index
+        expression = self._or()
+        return lambda element, position: bool(expression(element))
+
+    def _or(self):
+        parts = [self._and()]
+        while self._peek() == "or":
+            self._next()
+            parts.append(self._and())
+        return parts[0] if len(parts) == 1 else (lambda e: any(bool(p(e)) for p in parts))
+
+    def _and(self):
+        parts = [self._unary()]
+        while self._peek() == "and":
+            self._next()
+            parts.append(self._unary())
+        return parts[0] if len(parts) == 1 else (lambda e: all(bool(p(e)) for p in parts))
+
+    def _unary(self):
+        if self._peek() == "not":
+            self._next()
+            self._next("(")
+            inner = self._or()
+            self._next(")")
+            return lambda e: not bool(inner(e))
+        if self._peek() == "(":
+            self._next()
+            inner = self._or()
+            self._next(")")
+            return inner
+        left = self._value()
+        if self._peek() not in ("=", "!="):
+            return left
+        op = self._next()
+        right = self._value()
+
+        def compare(e):
+            lefts, rights = self._strings(left(e)), self._strings(right(e))
+            if op == "=":
+                return any(a == b for a in lefts for b in rights)
+            return any(a != b for a in lefts for b in rights)
+        return compare
+
+    def _value(self):
+        """A value function: node-sets are lists of strings, function results are str/bool."""
+        token = self._next()
+        if token[0] in "'\"":
+            literal = token[1:-1]
+            return lambda e: literal
+        if token[0] == "@":
+            name = token[1:]
+            return lambda e: [e.get(name)] if e.get(name) is not None else []
+        if token == ".":
+            return lambda e: [_string_value(e)]
+        if token == "text":
+            self._next("(")
+            self._next(")")
+            return lambda e: [t for t in [e.text] + [child.tail for child in e] if t]
+        if token in ("contains", "starts-with"):
+            self._next("(")
+            haystack = self._value()
+            self._next(",")
+            needle = self._value()
+            self._next(")")
+            if token == "contains":
+                return lambda e: _as_string(needle(e)) in _as_string(haystack(e))
+            return lambda e: _as_string(haystack(e)).startswith(_as_string(needle(e)))
+        if token == "normalize-space":
+            self._next("(")
+            argument = (lambda e: [_string_value(e)]) if self._peek() == ")" else self._value()
+            self._next(")")
+            return lambda e: " ".join(_as_string(argument(e)).split())
+        self._fail()
+
+    @staticmethod
+    def _strings(value) -> list[str]:
+        if isinstance(value, list):
+            return value
+        return ["true" if value else "false"] if isinstance(value, bool) else [value]
+
+
+# -------------------------
+# Snapshot
+# -------------------------
+class DomSnapshot:
+    """A DOM tree captured in one WebDriver call and queried locally with CSS, XPath or link text.
+
+    Supports the CSS used by the page objects (tag, #id, .class, [attr], [attr=|^=|$=|*=|~=v],
+    descendant and child combinators, comma groups), the XPath subset of _XPathParser
+    (e.g. //button[@type='button' and contains(@class,'btn-close')]) and (partial) link text.
+    Other locators raise ValueError. text() is the rendered text: script/style contents and
+    elements hidden at capture time (marked with HIDDEN_ATTRIBUTE) are left out.
+    """
+
+    def __init__(self, html: str):
+        builder = _TreeBuilder()
+        builder.feed(html or "")
+        builder.close()
+        self.root = builder.root
+        self._parents = {child: parent for parent in self.root.iter() for child in parent}
+        self._order = {element: i for i, element in enumerate(self.root.iter())}
+
+    @classmethod
+    def capture(cls, driver, root_css: str | None = None) -> "DomSnapshot":
+        """Serializes the page (or the subtree at `root_css`) with its live form state in one call."""
+        return cls(driver.execute_script(_SERIALIZE_SCRIPT, root_css, HIDDEN_ATTRIBUTE) or "")
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def find_all(self, locator) -> list[ET.Element]:
+        """Elements matching a Selenium-style (By, value) locator."""
+        by, value = locator
+        if by == By.XPATH:
+            return self.xpath(value)
+        if by == By.LINK_TEXT:
+            return [a for a in self.root.iter("a") if self.text(a) == value]
+        if by == By.PARTIAL_LINK_TEXT:
+            return [a for a in self.root.iter("a") if value in self.text(a)]
+        if by == By.ID:
+            return self.select(f'[id="{value}"]')
+        if by == By.NAME:
+            return self.select(f'[name="{value}"]')
+        if by == By.CLASS_NAME:
+            return self.select(f".{value}")
+        if by in (By.CSS_SELECTOR, By.TAG_NAME):
+            return self.select(value)
+        raise ValueError(f"Unsupported locator strategy for DOM snapshots: {by}")
+
+    def find(self, locator) -> ET.Element | None:
+        """First element matching a locator, or None."""
+        found = self.find_all(locator)
+        return found[0] if found else None
+
+    def select(self, css: str) -> list[ET.Element]:
+        """Elements matching a CSS selector, in document order."""
+        groups = _parse_selector(css)
+        return [el for el in self.root.iter() if el is not self.root and any(self._matches(el, g) for g in groups)]
+
+    def xpath(self, xpath: str) -> list[ET.Element]:
+        """Elements matching an XPath of the supported subset, in document order."""
+        context = [self.root]
+        for axis, tag, predicates in _XPathParser(xpath).parse():
+            parents = [node for c in context for node in c.iter()] if axis == "//" else context
+            found = set()
+            for parent in dict.fromkeys(parents):
+                # Positions count per parent, as in XPath's child axis
+                candidates = [child for child in parent if tag is None or child.tag == tag]
+                for predicate in predicates:
+                    candidates = [c for i, c in enumerate(candidates, start=1) if predicate(c, i)]
+                found.update(candidates)
+            context = sorted(found, key=self._order.__getitem__)
+        return context
+
+    def _matches(self, element: ET.Element, steps: list) -> bool:
+        """Right-to-left match of a selector chain against an element and its ancestors."""
+        combinator, tag, checks = steps[-1]
+        if not _matches_compound(element, tag, checks):
+            return False
+        if len(steps) == 1:
+            return True
+
+        parent = self._parents.get(element)
+        if combinator == ">":
+            return parent is not None and parent is not self.root and self._matches(parent, steps[:-1])
+        while parent is not None and parent is not self.root:
+            if self._matches(parent, steps[:-1]):
+                return True
+            parent = self._parents.get(parent)
+        return False
+
+    # -------------------------
+    # Element helpers
+    # -------------------------
+    @staticmethod
+    def text(element: ET.Element) -> str:
+        """Whitespace-normalized rendered text (for a select: the selected option's text)."""
+        if element.tag == "select":
+            if element.get(HIDDEN_ATTRIBUTE) is not None:
+                return ""
+            selected = [o for o in element.iter("option") if o.get("selected") is not None]
+            element = selected[0] if selected else next(element.iter("option"), element)
+        return " ".join(_rendered_text(element).split())
+
+    @staticmethod
+    def value(element: ET.Element) -> str:
+        """Form value: input value attribute, textarea text, or the selected option's value/text."""
+        if element.tag == "textarea":
+            return "".join(element.itertext())
+        if element.tag == "select":
+            selected = [o for o in element.iter("option") if o.get("selected") is not None]
+            option = selected[0] if selected else next(element.iter("option"), None)
+            return "" if option is None else option.get("value", DomSnapshot.text(option))
+        return element.get("value", "")
+
+    @staticmethod
+    def outer_html(element: ET.Element, limit: int = 20000) -> str:
+        """Serialized element (truncated to `limit` characters) for failure artifacts."""
+        element = copy.copy(element)
+        element.tail = None
+        html = ET.tostring(element, encoding="unicode", method="html")
+        return html if len(html) <= limit else html[:limit] + "\n<!-- truncated -->"
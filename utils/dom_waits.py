@@ -0,0 +1,143 @@
+import time
+import weakref
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+
+# Resolves a locator and evaluates a condition inside the page. A MutationObserver (plus a
+# short in-page poll for style-only changes such as CSS transitions) re-checks the condition,
+# so the browser answers as soon as it holds instead of the client polling over HTTP.
+_WAIT_SCRIPT = """
+const [kind, query, condition, timeoutMs, done] = arguments;
+
+function find() {
+    if (kind === "css") return Array.from(document.querySelectorAll(query));
+    const snap = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const found = [];
+    for (let i = 0; i < snap.snapshotLength; i++) found.push(snap.snapshotItem(i));
+    return found;
+}
+function visible(el) {
+    if (!el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.visibility === "hidden" || style.display === "none" || style.opacity === "0") return false;
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+function evaluate() {
+    const els = find();
+    switch (condition) {
+        case "present": return els.length ? els[0] : null;
+        case "visible": return els.length && visible(els[0]) ? els[0] : null;
+        case "clickable": return els.length && visible(els[0]) && !els[0].disabled ? els[0] : null;
+        case "invisible": return !els.length || !visible(els[0]);
+        case "all_visible": return els.length && els.every(visible) ? els : null;
+    }
+    throw new Error("Unknown wait condition: " + condition);
+}
+
+let settled = false, observer = null, poll = null, timer = null;
+function finish(value) {
+    if (settled) return;
+    settled = true;
+    if (observer) observer.disconnect();
+    clearInterval(poll);
+    clearTimeout(timer);
+    done(value);
+}
+function check() {
+    const result = evaluate();
+    if (result) finish(result);
+}
+
+check();
+if (!settled) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    poll = setInterval(check, 50);
+    timer = setTimeout(() => finish(condition === "invisible" ? false : null), timeoutMs);
+}
+"""
+
+# What drivers report when the document is replaced under a running script (Chrome/Edge, Firefox)
+_UNLOAD_MESSAGES = ("document unloaded", "document was unloaded", "inspected target navigated",
+                    "execution context was destroyed", "cannot find context with specified id")
+
+# Script timeout already configured per driver (avoids one extra round trip per wait).
+_script_timeouts = weakref.WeakKeyDictionary()
+
+
+def ensure_script_timeout(driver, seconds: float) -> None:
+    """Raises the driver's async script timeout when an in-page wait needs longer than configured."""
+    needed = int(seconds) + 5
+    if _script_timeouts.get(driver, 0) >= needed:
+        return
+    driver.set_script_timeout(needed)
+    _script_timeouts[driver] = needed
+
+
+def is_unload_error(error: JavascriptException) -> bool:
+    """True when a script failed because the page navigated away, not because of an error in it."""
+    message = (error.msg or "").lower()
+    return any(text in message for text in _UNLOAD_MESSAGES)
+
+
+def to_dom_query(locator) -> tuple[str, str]:
+    """Translates a Selenium locator into ("css"|"xpath", query) for in-page resolution."""
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.ID:
+        return "css", f'[id="{value}"]'
+    if by == By.NAME:
+        return "css", f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css", f".{value}"
+    if by == By.TAG_NAME:
+        return "css", value
+    if by == By.LINK_TEXT:
+        return "xpath", f"//a[normalize-space(.)='{value}']"
+    if by == By.PARTIAL_LINK_TEXT:
+        return "xpath", f"//a[contains(normalize-space(.), '{value}')]"
+    raise ValueError(f"Unsupported locator strategy for in-browser waits: {by}")
+
+
+class DomWaiter:
+    """Waits for element conditions inside the browser with a single execute_async_script call."""
+
+    CONDITIONS = ("present", "visible", "clickable", "invisible", "all_visible")
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def until(self, locator, condition: str, timeout: float):
+        """Returns the element(s) (or True for "invisible") once the condition holds; raises TimeoutException."""
+        if condition not in self.CONDITIONS:
+            raise ValueError(f"Unknown wait condition: {condition}")
+
+        kind, query = to_dom_query(locator)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            ensure_script_timeout(self.driver, remaining)
+            try:
+                result = self.driver.execute_async_script(
+                    _WAIT_SCRIPT, kind, query, condition, int(remaining * 1000)
+                )
+            except JavascriptException as e:
+                # The document was replaced while waiting (navigation): retry on the new page.
+                # Anything else (e.g. an invalid selector) fails the same way on every retry.
+                if not is_unload_error(e):
+                    raise
+                if time.monotonic() >= deadline:
+                    break
+                continue
+
+            if result:
+                return result
+            if time.monotonic() >= deadline:
+                break
+
+        raise TimeoutException(f"{condition} not satisfied for {locator} within {timeout}s")
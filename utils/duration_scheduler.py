@@ -0,0 +1,267 @@
+import heapq
+import json
+import os
+import statistics
+import time
+
+import pytest
+from filelock import FileLock
+from xdist.scheduler import LoadGroupScheduling
+
+
+def strip_group(nodeid: str) -> str:
+    """Node id without the "@group" suffix xdist adds under loadgroup distribution."""
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
+
+
+def simulate_makespan(costs: list[float], workers: int) -> float:
+    """Makespan of handing `costs` out in order, each to the worker that frees up first."""
+    if not costs or workers < 1:
+        return 0.0
+    loads = [0.0] * workers
+    for cost in costs:
+        heapq.heappush(loads, heapq.heappop(loads) + cost)
+    return max(loads)
+
+
+class DurationHistory:
+    """Per-test durations (setup + call + teardown) of recent runs, kept in a JSON file.
+
+    A test's estimate is the median of its last `max_samples` runs; tests without
+    history get the median estimate of the known tests (or `default` on a first run).
+    """
+
+    def __init__(self, path: str, max_samples: int = 5, default: float = 10.0):
+        self.path = path
+        self.max_samples = max_samples
+        self.default = default
+        self._history: dict[str, list[float]] = self._load()
+        self._new: dict[str, float] = {}
+        self._fallback = (statistics.median(self.estimate(n) for n in self._history)
+                          if self._history else default)
+
+    def _load(self) -> dict[str, list[float]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def estimate(self, nodeid: str) -> float:
+        """Expected duration of a test in seconds."""
+        samples = self._history.get(strip_group(nodeid))
+        return statistics.median(samples) if samples else self._fallback
+
+    def add(self, nodeid: str, seconds: float) -> None:
+        """Adds a phase duration of the running session to a test's total."""
+        key = strip_group(nodeid)
+        self._new[key] = self._new.get(key, 0.0) + seconds
+
+    def save(self) -> None:
+        """Appends this session's totals to the history file (newest max_samples per test)."""
+        if not self._new:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with FileLock(self.path + ".lock", timeout=60):
+            merged = self._load()
+            for key, seconds in self._new.items():
+                merged[key] = (merged.get(key, []) + [round(seconds, 3)])[-self.max_samples:]
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(merged, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        self._history = merged
+        self._new = {}
+
+
+def variant_of(nodeid: str, variants) -> str:
+    """Test a parametrized variant belongs to: the node id without its "@group" suffix and variant id.
+
+    With variants ("chrome", "firefox"), "t.py::test_save[firefox-a]" belongs to "t.py::test_save[a]"
+    and "t.py::test_save[chrome]" to "t.py::test_save".
+    """
+    nodeid = strip_group(nodeid)
+    if not nodeid.endswith("]") or "[" not in nodeid:
+        return nodeid
+    base, _, params = nodeid[:-1].partition("[")
+    rest = [param for param in params.split("-") if param not in variants]
+    return f"{base}[{'-'.join(rest)}]" if rest else base
+
+
+class PlannedScheduling(LoadGroupScheduling):
+    """xdist scheduler that plans every unit onto a worker up front, keeping test variants apart.
+
+    Units are the loadgroup ones: every test on its own, except tests sharing an
+    `xdist_group`, which stay one unit on one worker. Each unit, in collection order, is
+    planned onto the least-loaded worker that holds no other variant of its tests (the
+    same test in another browser), so the variants of a test run on different workers.
+    Workers run their own plan; a worker that runs dry takes the smallest unit left
+    in the busiest plan, so an uneven plan does not leave it idle.
+    """
+
+    def __init__(self, config: pytest.Config, log=None, variants=()):
+        super().__init__(config, log)
+        self.variants = tuple(variants)
+        self.started: float | None = None
+        self._costs: dict[str, float] = {}
+        self._loads: dict = {}
+        self._plans: dict = {}
+
+    def _cost(self, nodeid: str) -> float:
+        """Planning weight of a test."""
+        return 1.0
+
+    def _plan_order(self) -> list[str]:
+        """Units in the order they are planned."""
+        return list(self.workqueue)
+
+    def schedule(self) -> None:
+        """Plans the whole collection, then distributes like LoadScopeScheduling."""
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        for nodeid in self.collection:
+            scope = self._split_scope(nodeid)
+            self.workqueue.setdefault(scope, {})[nodeid] = False
+            self._costs[scope] = self._costs.get(scope, 0.0) + self._cost(nodeid)
+
+        # Avoid having more workers than work
+        for _ in range(len(self.nodes) - len(self.workqueue)):
+            unused_node, _assigned = self.assigned_work.popitem()
+            unused_node.shutdown()
+
+        self._plan()
+        self.started = time.monotonic()
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+
+    def _plan(self) -> None:
+        """Each unit goes to the least-loaded worker without another variant of its tests (any worker if all have one)."""
+        self._loads = {node: 0.0 for node in self.nodes}
+        self._plans = {node: [] for node in self.nodes}
+        planned_tests = {node: set() for node in self.nodes}
+        for scope in self._plan_order():
+            tests = {variant_of(nodeid, self.variants) for nodeid in self.workqueue[scope]}
+            candidates = [node for node in self.nodes if not planned_tests[node] & tests] or self.nodes
+            node = min(candidates, key=self._loads.__getitem__)
+            self._plans[node].append(scope)
+            self._loads[node] += self._costs[scope]
+            planned_tests[node] |= tests
+
+    def _own_plan(self, node) -> list[str]:
+        """The node's planned units not yet handed out."""
+        plan = self._plans.get(node, [])
+        plan[:] = [scope for scope in plan if scope in self.workqueue]
+        return plan
+
+    def _next_scope(self, node) -> str:
+        plan = self._own_plan(node)
+        if plan:
+            return plan.pop(0)
+        # Units requeued from a crashed worker first, then the smallest unit of the busiest plan
+        planned = {scope for other in self._plans for scope in self._own_plan(other)}
+        orphans = [scope for scope in self.workqueue if scope not in planned]
+        if orphans:
+            return orphans[0]
+        donor = max((p for p in self._plans.values() if p), key=lambda p: sum(self._costs[s] for s in p))
+        return donor.pop()
+
+    def _assign_work_unit(self, node) -> None:
+        """Sends the node its next planned (or stolen) unit."""
+        scope = self._next_scope(node)
+        work_unit = self.workqueue.pop(scope)
+        self.assigned_work.setdefault(node, {})[scope] = work_unit
+
+        worker_collection = self.registered_collections[node]
+        node.send_runtest_some([worker_collection.index(nodeid) for nodeid, done in work_unit.items() if not done])
+
+    def _reschedule(self, node) -> None:
+        if node.shutting_down:
+            return
+        if not self.workqueue:
+            node.shutdown()
+            return
+
+        # Keep two tests queued (a worker only starts a test once it knows the next one),
+        # but only take another plan's work when this worker is about to go idle
+        pending = self._pending_of(self.assigned_work[node])
+        if pending > 2 or (pending > 1 and not self._own_plan(node)):
+            return
+        self._assign_work_unit(node)
+
+    def remove_node(self, node) -> str | None:
+        self._plans.pop(node, None)
+        return super().remove_node(node)
+
+
+class DurationScheduling(PlannedScheduling):
+    """PlannedScheduling longest-first (LPT) from DurationHistory.
+
+    Each unit costs the sum of its tests' estimates and is planned onto the
+    least-loaded worker, longest first (still keeping test variants apart).
+    """
+
+    def __init__(self, config: pytest.Config, history: DurationHistory, log=None, variants=()):
+        self.history = history
+        super().__init__(config, log, variants)
+        self.predicted_makespan: float | None = None
+        self.collection_order_makespan: float | None = None
+
+    def _cost(self, nodeid: str) -> float:
+        return self.history.estimate(nodeid)
+
+    def _plan_order(self) -> list[str]:
+        return sorted(self.workqueue, key=lambda s: -self._costs[s])
+
+    def _plan(self) -> None:
+        super()._plan()
+        self.predicted_makespan = max(self._loads.values())
+        self.collection_order_makespan = simulate_makespan(list(self._costs.values()), len(self.nodes))
+        self.log(f"LPT over {len(self._costs)} units on {len(self.nodes)} workers: predicted makespan "
+                 f"{self.predicted_makespan:.1f}s (collection order {self.collection_order_makespan:.1f}s)")
+
+
+class DurationRecorder:
+    """pytest plugin (controller side): feeds test durations into the history and reports the makespan."""
+
+    def __init__(self, history: DurationHistory):
+        self.history = history
+        self.scheduler: DurationScheduling | None = None
+        self._busy: dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self.history.add(report.nodeid, report.duration)
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "master"
+        self._busy[worker] = self._busy.get(worker, 0.0) + report.duration
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        scheduler = self.scheduler
+        if scheduler is None or scheduler.predicted_makespan is None or not self._busy:
+            return
+        wall = time.monotonic() - scheduler.started
+        terminalreporter.write_sep("-", "duration scheduling")
+        terminalreporter.write_line(
+            f"predicted makespan {scheduler.predicted_makespan:.1f}s "
+            f"(collection order would be {scheduler.collection_order_makespan:.1f}s)")
+        terminalreporter.write_line(
+            f"actual makespan {max(self._busy.values()):.1f}s (busiest worker), {wall:.1f}s wall clock")
+        terminalreporter.write_line(
+            "worker busy time: " + ", ".join(f"{w} {s:.1f}s" for w, s in sorted(self._busy.items())))
+
+    def pytest_sessionfinish(self) -> None:
+        self.history.save()
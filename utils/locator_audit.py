@@ -0,0 +1,272 @@
+import argparse
+import importlib
+import inspect
+import os
+import pkgutil
+import re
+import statistics
+from dataclasses import dataclass, field
+
+from selenium.webdriver.common.by import By
+
+import pages
+from utils.base_page import BaseAdminPage
+from utils.dom_waits import to_dom_query
+
+
+STRATEGIES = {value for name, value in vars(By).items() if name.isupper()}
+
+# Resolves one query `rounds` times per batch inside the page; returns the mean ms per
+# resolution of each batch (performance.now() is too coarse to time a single query), the
+# match count and, when a suggestion is given, whether it matches exactly the same nodes.
+_RESOLVE_SCRIPT = """
+const [kind, query, rounds, batches, altKind, altQuery] = arguments;
+function find(k, q) {
+    if (k === "css") return Array.from(document.querySelectorAll(q));
+    const snap = document.evaluate(q, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const found = [];
+    for (let i = 0; i < snap.snapshotLength; i++) found.push(snap.snapshotItem(i));
+    return found;
+}
+function time(k, q) {
+    const samples = [];
+    let matches = [];
+    for (let b = 0; b < batches; b++) {
+        const start = performance.now();
+        for (let i = 0; i < rounds; i++) matches = find(k, q);
+        samples.push((performance.now() - start) / rounds);
+    }
+    return {samples, matches};
+}
+const main = time(kind, query);
+const result = {samples: main.samples, count: main.matches.length};
+if (altQuery) {
+    const alt = time(altKind, altQuery);
+    result.altSamples = alt.samples;
+    result.altEquivalent = alt.matches.length === main.matches.length && alt.matches.every((el, i) => el === main.matches[i]);
+}
+return result;
+"""
+
+
+@dataclass
+class LocatorRef:
+    """A locator constant and the page-object class that declares it."""
+
+    owner: str
+    name: str
+    by: str
+    value: str
+    issues: list[str] = field(default_factory=list)
+    suggestion: tuple[str, str] | None = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.owner}.{self.name}"
+
+
+@dataclass
+class LocatorCost:
+    """Measured resolution cost of one locator on one page."""
+
+    ref: LocatorRef
+    median_ms: float
+    matches: int
+    suggestion_ms: float | None = None
+    suggestion_equivalent: bool | None = None
+    flags: list[str] = field(default_factory=list)
+
+
+# -------------------------
+# Collection
+# -------------------------
+def page_object_classes() -> list[type]:
+    """BaseAdminPage and every page-object class defined under pages/."""
+    classes = [BaseAdminPage]
+    for module_info in pkgutil.iter_modules(pages.__path__):
+        module = importlib.import_module(f"pages.{module_info.name}")
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, BaseAdminPage) and cls.__module__ == module.__name__:
+                classes.append(cls)
+    return classes
+
+
+def collect_locators(classes: list[type] | None = None) -> list[LocatorRef]:
+    """Locator constants declared directly on each class (inherited ones are reported once, on their owner)."""
+    refs = []
+    for cls in classes or page_object_classes():
+        for name, value in vars(cls).items():
+            if (isinstance(value, tuple) and len(value) == 2 and value[0] in STRATEGIES
+                    and isinstance(value[1], str)):
+                refs.append(lint(LocatorRef(cls.__name__, name, value[0], value[1])))
+    return refs
+
+
+# -------------------------
+# Static lint
+# -------------------------
+_XPATH_SIMPLE = re.compile(r"^//(?P<tag>[a-z][a-z0-9]*|\*)\[(?P<predicates>.+)\]$", re.IGNORECASE)
+_XPATH_ATTR = re.compile(r"^@(?P<attr>[\w-]+)\s*=\s*'(?P<value>[^']*)'$")
+_XPATH_CLASS = re.compile(r"^contains\(\s*@class\s*,\s*'(?P<cls>[\w-]+)'\s*\)$")
+
+
+def xpath_to_css(xpath: str) -> str | None:
+    """CSS equivalent of a simple `//tag[@attr='v' and contains(@class,'c')]` XPath, if there is one.
+
+    contains(@class, 'c') becomes `.c`, i.e. a whole-class match instead of a substring match;
+    the measured run checks that both select the same nodes.
+    """
+    match = _XPATH_SIMPLE.match(xpath.strip())
+    if not match:
+        return None
+
+    tag = "" if match.group("tag") == "*" else match.group("tag")
+    parts = []
+    for predicate in re.split(r"\s+and\s+", match.group("predicates")):
+        predicate = predicate.strip()
+        attr, cls = _XPATH_ATTR.match(predicate), _XPATH_CLASS.match(predicate)
+        if attr and attr.group("attr") == "id":
+            parts.append(f"#{attr.group('value')}")
+        elif attr:
+            parts.append(f"[{attr.group('attr')}='{attr.group('value')}']")
+        elif cls:
+            parts.append(f".{cls.group('cls')}")
+        else:
+            return None
+    return tag + "".join(parts) or None
+
+
+def lint(ref: LocatorRef) -> LocatorRef:
+    """Fills in static issues and a cheaper equivalent selector where one is known."""
+    if ref.by == By.XPATH:
+        if "normalize-space(" in ref.value or "text()" in ref.value:
+            ref.issues.append("text match: evaluates the text of every candidate node; prefer an id or attribute")
+        if "contains(@class" in ref.value:
+            ref.issues.append("class substring match: prefer a CSS class selector")
+        if ref.value.startswith("//*") or ref.value.startswith("(//"):
+            ref.issues.append("unanchored XPath: scans the whole document")
+        css = xpath_to_css(ref.value)
+        if css:
+            ref.suggestion = (By.CSS_SELECTOR, css)
+    elif ref.by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        ref.issues.append("link text: resolved by scanning every link's rendered text; prefer href or id")
+    elif ref.by == By.CSS_SELECTOR:
+        if "*=" in ref.value:
+            ref.issues.append("attribute substring match: prefer an exact attribute, id or class")
+        if re.search(r"(^|[\s>])\*", ref.value):
+            ref.issues.append("universal selector: matches every element before filtering")
+    return ref
+
+
+# -------------------------
+# Measurement
+# -------------------------
+def measure(driver, refs: list[LocatorRef], rounds: int = 50, batches: int = 5,
+            slow_factor: float = 5.0) -> list[LocatorCost]:
+    """Resolves every locator rounds x batches times in the current page; returns costs, slowest first."""
+    costs = []
+    for ref in refs:
+        kind, query = to_dom_query((ref.by, ref.value))
+        alt_kind, alt_query = to_dom_query(ref.suggestion) if ref.suggestion else (None, None)
+        result = driver.execute_script(_RESOLVE_SCRIPT, kind, query, rounds, batches, alt_kind, alt_query)
+        cost = LocatorCost(ref, round(statistics.median(result["samples"]), 4), result["count"])
+        if alt_query:
+            cost.suggestion_ms = round(statistics.median(result["altSamples"]), 4)
+            cost.suggestion_equivalent = result["altEquivalent"]
+        costs.append(cost)
+
+    baseline = statistics.median(c.median_ms for c in costs) if costs else 0
+    for cost in costs:
+        if cost.matches > 1 and not _expects_many(cost.ref.name):
+            cost.flags.append(f"ambiguous: {cost.matches} matches")
+        if baseline and cost.median_ms > baseline * slow_factor:
+            cost.flags.append(f"slow: {cost.median_ms / baseline:.0f}x the median locator")
+    return sorted(costs, key=lambda c: c.median_ms, reverse=True)
+
+
+def _expects_many(name: str) -> bool:
+    """Locators meant to return lists (ROWS, TABLE_ROWS, ...)."""
+    return name.endswith("ROWS")
+
+
+# -------------------------
+# Output
+# -------------------------
+def format_static(refs: list[LocatorRef]) -> str:
+    """Lint findings, one block per locator with issues."""
+    lines = []
+    for ref in refs:
+        if not ref.issues:
+            continue
+        lines.append(f"{ref.label}: ({ref.by}) {ref.value}")
+        lines.extend(f"    - {issue}" for issue in ref.issues)
+        if ref.suggestion:
+            lines.append(f"    suggestion: ({ref.suggestion[0]}) {ref.suggestion[1]}")
+    return "\n".join(lines) or "No locator issues found."
+
+
+def format_costs(costs: list[LocatorCost]) -> str:
+    """Ranking table of measured locators."""
+    lines = [f"{'locator':<44}{'median':>10}{'matches':>9}  notes"]
+    for cost in costs:
+        notes = list(cost.flags) + cost.ref.issues
+        if cost.suggestion_ms is not None:
+            same = "same nodes" if cost.suggestion_equivalent else "DIFFERENT nodes"
+            notes.append(f"suggest ({cost.ref.suggestion[0]}) {cost.ref.suggestion[1]}: "
+                         f"{cost.suggestion_ms * 1000:.1f}us, {same}")
+        lines.append(f"{cost.ref.label:<44}{cost.median_ms * 1000:>8.1f}us{cost.matches:>9}  {'; '.join(notes)}")
+    return "\n".join(lines)
+
+
+# -------------------------
+# CLI
+# -------------------------
+def _open_page(driver, args) -> None:
+    """Loads the saved HTML file, or logs in and opens the requested admin page."""
+    if args.html:
+        driver.get("file://" + os.path.abspath(args.html))
+        return
+
+    from pages.admin_dashboard_page import AdminDashboardPage
+    from pages.admin_login_page import AdminLoginPage
+
+    login = AdminLoginPage(driver)
+    login.open(args.admin_url)
+    login.login_as(args.admin_user, args.admin_password)
+    login.wait_for_user_token()
+    if args.page != "dashboard":
+        AdminDashboardPage(driver).router.go(args.page)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rank page-object locators by resolution cost.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--static", action="store_true", help="Only lint the locators (no browser).")
+    source.add_argument("--html", help="Saved admin page to resolve the locators against.")
+    source.add_argument("--admin-url", help="Live admin base URL (ending with /admin/).")
+    parser.add_argument("--admin-user", default="admin")
+    parser.add_argument("--admin-password", default="admin")
+    parser.add_argument("--page", default="products", choices=["dashboard", "products", "orders", "product_form"],
+                        help="Admin page to open with --admin-url.")
+    parser.add_argument("--rounds", type=int, default=50, help="Resolutions per timed batch (5 batches per locator).")
+    args = parser.parse_args(argv)
+
+    refs = collect_locators()
+    if args.static:
+        print(format_static(refs))
+        return 0
+
+    from selenium import webdriver
+    from utils.browser_profiles import PROFILES, chrome_options
+
+    driver = webdriver.Chrome(options=chrome_options(PROFILES["fast"]))
+    try:
+        _open_page(driver, args)
+        print(format_costs(measure(driver, refs, rounds=args.rounds)))
+    finally:
+        driver.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
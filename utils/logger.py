@@ -1,4 +1,18 @@
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+
+# Structured fields page objects and SoftAssert pass through `extra=`
+EVENT_FIELDS = ("method", "locator", "condition", "duration", "outcome")
+
+# Test the current thread is running (set by the pytest hooks; one test at a time per worker)
+_test_context = {"test_id": None, "tc_id": None}
+_listener: logging.handlers.QueueListener | None = None
+
 
 def get_logger(name="test_logger"):
     logger = logging.getLogger(name)
@@ -9,3 +23,120 @@ def get_logger(name="test_logger"):
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
     return logger
+
+
+def set_test_context(test_id: str | None, tc_id: str | None = None) -> None:
+    """Tags the following log records with the running test (None clears it)."""
+    _test_context["test_id"] = test_id
+    _test_context["tc_id"] = tc_id
+
+
+class _TestContextFilter(logging.Filter):
+    """Stamps records with the worker and running test in the emitting thread (before they are queued)."""
+
+    def __init__(self, worker_id: str):
+        super().__init__()
+        self.worker_id = worker_id
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.worker = self.worker_id
+        record.test_id = _test_context["test_id"]
+        record.tc_id = _test_context["tc_id"]
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: time, level, worker, test id, tc_id, message and any event fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "worker": getattr(record, "worker", None),
+            "test_id": getattr(record, "test_id", None),
+            "tc_id": getattr(record, "tc_id", None),
+            "message": record.getMessage(),
+        }
+        for name in EVENT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value if isinstance(value, (int, float, bool)) else str(value)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _ConsoleFilter(logging.Filter):
+    """Keeps fine-grained page-object events (DEBUG) out of the human-readable console."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.INFO
+
+
+class _StderrHandler(logging.StreamHandler):
+    """StreamHandler on whatever sys.stderr is when a record is emitted (pytest swaps it to capture output)."""
+
+    def __init__(self):
+        super().__init__(sys.stderr)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def configure_logging(log_dir: str, worker_id: str = "master", console: bool = True,
+                      debug: bool = False, name: str = "test_logger") -> str:
+    """Routes the test logger through a queue to a background listener; returns the JSON-lines file path.
+
+    Test code only enqueues records for `<log_dir>/<worker_id>.jsonl`, which the listener thread
+    writes. The console line (when `console` is on) is written by the logging thread itself, so
+    pytest's capture (-s, --capture=tee-sys, per-test sections) sees it in the right test.
+    DEBUG page-object events are only produced with `debug`.
+    """
+    global _listener
+    shutdown_logging(name)
+
+    os.makedirs(log_dir, exist_ok=True)
+    path = os.path.join(log_dir, f"{worker_id}.jsonl")
+    file_handler = logging.FileHandler(path, mode="w", encoding="utf-8", delay=True)
+    file_handler.setFormatter(JsonLinesFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(_TestContextFilter(worker_id))
+
+    logger = logging.getLogger(name)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    if console:
+        console_handler = _StderrHandler()
+        console_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s]: %(message)s'))
+        console_handler.addFilter(_ConsoleFilter())
+        logger.addHandler(console_handler)
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    return path
+
+
+def shutdown_logging(name: str = "test_logger") -> None:
+    """Drains the queue, stops the listener and closes its files."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+    logger = logging.getLogger(name)
+    for handler in list(logger.handlers):
+        if isinstance(handler, (logging.handlers.QueueHandler, _StderrHandler)):
+            logger.removeHandler(handler)
@@ -0,0 +1,81 @@
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from utils.dom_waits import ensure_script_timeout
+
+
+# Counts XMLHttpRequest/fetch calls issued by the page (installed once per document).
+# Returns how many requests had been issued so far, which marks the start of an action.
+_MARK_SCRIPT = """
+if (!window.__netIdle) {
+    const state = window.__netIdle = {issued: 0, pending: 0, lastDone: performance.now()};
+    const started = () => { state.issued++; state.pending++; };
+    const finished = () => { state.pending = Math.max(0, state.pending - 1); state.lastDone = performance.now(); };
+
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener("loadend", finished, {once: true});
+        return send.apply(this, arguments);
+    };
+
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function () {
+            started();
+            return fetch.apply(this, arguments).finally(finished);
+        };
+    }
+}
+return window.__netIdle.issued;
+"""
+
+# Resolves once the requests issued after `mark` have all finished and the network has been
+# quiet for `quietMs` (chained requests), or after `graceMs` when the action issued none.
+_WAIT_SCRIPT = """
+const [mark, timeoutMs, quietMs, graceMs, done] = arguments;
+const state = window.__netIdle;
+const start = performance.now();
+const timer = setInterval(() => {
+    const now = performance.now();
+    const issued = state ? state.issued - mark : 0;
+    let result = null;
+    if (issued > 0 && state.pending === 0 && now - state.lastDone >= quietMs) result = {idle: true, requests: issued};
+    else if (issued === 0 && now - start >= graceMs) result = {idle: true, requests: 0};
+    else if (now - start >= timeoutMs) result = {idle: false, requests: issued};
+    if (result) { clearInterval(timer); done(result); }
+}, 20);
+"""
+
+
+class NetworkIdle:
+    """Waits for the XHR/fetch requests started by one page-object action to finish.
+
+    Usage: `mark()` before the action (installs the in-page counter), `wait()` after it.
+    """
+
+    def __init__(self, driver, quiet_ms: int = 50, grace_ms: int = 300):
+        self.driver = driver
+        self.quiet_ms = quiet_ms
+        self.grace_ms = grace_ms
+        self._mark = 0
+
+    def mark(self) -> None:
+        """Installs the request counter (if needed) and remembers how many requests were issued so far."""
+        self._mark = self.driver.execute_script(_MARK_SCRIPT)
+
+    def wait(self, timeout: float = 10) -> int:
+        """Blocks until the action's requests are done; returns how many there were.
+
+        A full page navigation replaces the counter; that is treated as settled because the
+        browser already waited for the new document to load.
+        """
+        ensure_script_timeout(self.driver, timeout)
+        try:
+            result = self.driver.execute_async_script(
+                _WAIT_SCRIPT, self._mark, int(timeout * 1000), self.quiet_ms, self.grace_ms
+            )
+        except JavascriptException:
+            return 0
+
+        if not result["idle"]:
+            raise TimeoutException(f"{result['requests']} AJAX request(s) still pending after {timeout}s")
+        return result["requests"]
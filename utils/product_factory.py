@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+
+from pages.admin_product_page import ProductSpec
+from utils.admin_api import AdminApi
+from utils.logger import get_logger
+from utils.test_data import DataNamespace
+
+
+# Default OpenCart install: stock status name -> stock_status_id
+STOCK_STATUS_IDS = {"Out Of Stock": 5, "2-3 Days": 6, "In Stock": 7, "Pre-Order": 8}
+
+
+@dataclass
+class CreatedProduct:
+    """A product created through the admin API."""
+
+    product_id: int
+    spec: ProductSpec
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+
+def product_payload(spec: ProductSpec, product_id: int = 0, language_id: int = 1) -> dict:
+    """Form fields posted by the OpenCart 4 product form for a ProductSpec (category is not sent)."""
+    description = f"product_description[{language_id}]"
+    return {
+        "product_id": product_id,
+        f"{description}[name]": spec.name or "",
+        f"{description}[description]": spec.description or "",
+        f"{description}[meta_title]": spec.meta_title or spec.name or "",
+        f"{description}[meta_description]": spec.meta_description or "",
+        f"{description}[meta_keyword]": spec.meta_keywords or "",
+        f"{description}[tag]": spec.tags or "",
+        "model": spec.model or "",
+        "price": spec.price or "",
+        "quantity": spec.quantity if spec.quantity is not None else 1,
+        "location": spec.location or "",
+        "date_available": spec.date_available or "",
+        "stock_status_id": STOCK_STATUS_IDS.get(spec.stock_status or "In Stock", 7),
+        "status": 1 if spec.status else 0,
+        "product_store[]": [0],
+        f"product_seo_url[0][{language_id}]": spec.seo_keyword or "",
+    }
+
+
+class ProductFactory:
+    """Creates products through catalog/product.save and deletes them through catalog/product.delete.
+
+    Names, models and SEO keywords come from the run's DataNamespace plus a per-factory
+    sequence, so every product is unique; `cleanup()` deletes everything the factory created.
+    """
+
+    SAVE_ROUTE = "catalog/product{sep}save"
+    DELETE_ROUTE = "catalog/product{sep}delete"
+    LIST_ROUTE = "catalog/product{sep}list"
+
+    def __init__(self, api: AdminApi, namespace: DataNamespace):
+        self.api = api
+        self.namespace = namespace
+        self.created: list[CreatedProduct] = []
+        self.logger = get_logger()
+        self._seq = 0
+
+    def create(self, base_name: str = "Test Product", **fields) -> CreatedProduct:
+        """Creates a product with unique name/model/SEO keyword; `fields` override ProductSpec values."""
+        self._seq += 1
+        spec = ProductSpec(
+            name=self.namespace.name(f"{base_name} {self._seq}"),
+            meta_title=base_name,
+            model=self.namespace.model(f"MODEL-{self._seq:03d}"),
+            price="99.99",
+            quantity=10,
+            stock_status="In Stock",
+            status=True,
+            seo_keyword=self.namespace.seo_keyword(f"{base_name}-{self._seq}"),
+        )
+        for field, value in fields.items():
+            setattr(spec, field, value)
+
+        body = self.api.post(self.SAVE_ROUTE, product_payload(spec))
+        product_id = int(body.get("product_id") or self._lookup_id(spec.model))
+        product = CreatedProduct(product_id, spec)
+        self.created.append(product)
+        self.logger.info(f"[DATA] Created product #{product_id} '{spec.name}' via HTTP")
+        return product
+
+    def delete(self, *product_ids: int) -> None:
+        """Deletes products by id (ids that no longer exist are ignored by OpenCart)."""
+        if product_ids:
+            self.api.post(self.DELETE_ROUTE, {"selected[]": list(product_ids)})
+
+    def cleanup(self) -> None:
+        """Deletes every product this factory created (best-effort, for fixture teardown)."""
+        if not self.created:
+            return
+        try:
+            self.delete(*(p.product_id for p in self.created))
+        except (AssertionError, OSError) as e:
+            self.logger.warning(f"[DATA] HTTP cleanup failed, left for the session purge: {e}")
+        self.created.clear()
+
+    def _lookup_id(self, model: str) -> int:
+        """Finds a new product's id by its unique model (OpenCart versions that do not return it)."""
+        html = self.api.get(self.LIST_ROUTE, filter_model=model)
+        marker = 'name="selected[]" value="'
+        if marker not in html:
+            raise AssertionError(f"Created product not found in the list: {model}")
+        return int(html.split(marker, 1)[1].split('"', 1)[0])
@@ -0,0 +1,64 @@
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+USER_TOKEN_PARAM = "user_token"
+
+
+def user_token_from_url(url: str) -> str:
+    """Returns the OpenCart user_token in a URL, or an empty string if there is none."""
+    query = parse_qs(urlparse(url).query)
+    return (query.get(USER_TOKEN_PARAM) or [""])[0]
+
+
+def admin_base_from_url(url: str) -> str:
+    """Returns the admin base URL (everything before index.php) of an admin page URL."""
+    return url.split("index.php", 1)[0]
+
+
+class AdminRouter:
+    """Builds token-aware admin URLs so pages can be opened with a single driver.get."""
+
+    # Route names -> OpenCart routes. "{sep}" is the method separator ("|" in 4.0.0/4.0.1, "." from 4.0.2).
+    ROUTES = {
+        "dashboard": "common/dashboard",
+        "products": "catalog/product",
+        "product_form": "catalog/product{sep}form",
+        "orders": "sale/order",
+        "order_info": "sale/order{sep}info",
+    }
+
+    # Set once per session by conftest (--route-separator); used by AdminApi too
+    separator = "|"
+
+    def __init__(self, driver: WebDriver, admin_url: str | None = None, separator: str | None = None):
+        self.driver = driver
+        self.admin_url = admin_url
+        if separator is not None:
+            self.separator = separator
+
+    # -------------------------
+    # URL building
+    # -------------------------
+    def url(self, name: str, **params) -> str:
+        """Builds the URL of a named route using the browser's current user_token."""
+        if name not in self.ROUTES:
+            raise KeyError(f"Unknown admin route: {name}")
+
+        current = self.driver.current_url
+        token = user_token_from_url(current)
+        if not token:
+            raise AssertionError(f"No user_token in the current URL, log in first: {current}")
+
+        base = self.admin_url or admin_base_from_url(current)
+        query = {"route": self.ROUTES[name].format(sep=self.separator), USER_TOKEN_PARAM: token}
+        query.update({k: v for k, v in params.items() if v is not None})
+        return f"{base}index.php?{urlencode(query, safe='/|')}"
+
+    # -------------------------
+    # Navigation
+    # -------------------------
+    def go(self, name: str, **params) -> None:
+        """Opens a named route directly."""
+        self.driver.get(self.url(name, **params))
@@ -0,0 +1,90 @@
+import base64
+import importlib.util
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.logger import get_logger
+
+
+class ScreenshotPipeline:
+    """Grabs screenshots on the test thread and decodes/resizes/writes them in background workers.
+
+    Only `get_screenshot_as_base64()` runs on the test thread; PNG decoding, optional
+    downscaling (Pillow, when installed) and disk I/O happen in a thread pool that is
+    flushed at session end, so report links resolve once the run is over.
+    """
+
+    def __init__(self, directory: str, workers: int = 2, max_width: int = 0, thumbnail_width: int = 0):
+        self.directory = directory
+        self.logger = get_logger()
+        has_pillow = importlib.util.find_spec("PIL") is not None
+        if not has_pillow and (max_width or thumbnail_width):
+            disabled = " and ".join(n for n, on in (("thumbnails", thumbnail_width), ("downscaling", max_width)) if on)
+            self.logger.warning(f"[SCREENSHOT] Pillow is not installed; screenshot {disabled} disabled "
+                                f"(pip install Pillow)")
+        self.max_width = max_width if has_pillow else 0
+        self.thumbnail_width = thumbnail_width if has_pillow else 0
+        self._executor = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="screenshot")
+        self._futures = []
+        os.makedirs(self.directory, exist_ok=True)
+
+    def capture(self, driver, filename: str) -> str:
+        """Captures the current page and queues it for writing; returns the report-relative path."""
+        data = driver.get_screenshot_as_base64()
+        self._futures.append(self._executor.submit(self._write, data, os.path.join(self.directory, filename)))
+        return f"screenshots/{filename}"
+
+    def thumbnail_for(self, relative_path: str) -> str | None:
+        """Report-relative path of the thumbnail written for a screenshot, or None when thumbnails are off."""
+        if not self.thumbnail_width:
+            return None
+        return f"screenshots/thumbs/{os.path.basename(relative_path)}"
+
+    def flush(self) -> None:
+        """Blocks until every queued screenshot is on disk."""
+        futures, self._futures = self._futures, []
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.warning(f"[SCREENSHOT] Failed to write screenshot: {e}")
+
+    def close(self) -> None:
+        """Flushes pending screenshots and stops the workers."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def _write(self, data: str, path: str) -> None:
+        """Decodes (and optionally downscales) a base64 PNG and writes it to disk."""
+        png = base64.b64decode(data)
+        if self.thumbnail_width:
+            thumbs_dir = os.path.join(self.directory, "thumbs")
+            os.makedirs(thumbs_dir, exist_ok=True)
+            with open(os.path.join(thumbs_dir, os.path.basename(path)), "wb") as f:
+                f.write(self._downscale(png, self.thumbnail_width))
+        if self.max_width:
+            png = self._downscale(png, self.max_width)
+        with open(path, "wb") as f:
+            f.write(png)
+
+    @staticmethod
+    def _downscale(png: bytes, width: int) -> bytes:
+        """Shrinks the image to `width` pixels (kept as-is when Pillow is not installed)."""
+        try:
+            from PIL import Image
+        except ImportError:
+            return png
+
+        with Image.open(io.BytesIO(png)) as image:
+            if image.width <= width:
+                return png
+            height = round(image.height * width / image.width)
+            out = io.BytesIO()
+            image.resize((width, height)).save(out, format="PNG", optimize=True)
+            return out.getvalue()
+
+
+screenshot_pipeline_key = pytest.StashKey[ScreenshotPipeline]()
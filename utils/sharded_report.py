@@ -0,0 +1,183 @@
+import html
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+
+
+_INDEX_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>OpenCart Admin UI – test report</title>
+<style>
+body {{ font-family: sans-serif; margin: 1.5em; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border-bottom: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }}
+tr.summary {{ cursor: pointer; }}
+.passed {{ color: #2e7d32; }} .failed, .error {{ color: #c62828; }} .skipped {{ color: #ef6c00; }}
+pre {{ white-space: pre-wrap; font-size: 12px; }}
+img.thumb {{ max-width: 240px; margin: 4px; border: 1px solid #ccc; }}
+</style>
+</head>
+<body>
+<h1>OpenCart Admin UI – test report</h1>
+<p>{summary}</p>
+<table>
+<thead><tr><th>Result</th><th>Test</th><th>TC ID</th><th>Worker</th><th>Duration</th></tr></thead>
+<tbody>
+{rows}
+</tbody>
+</table>
+<script>
+// Details live in per-test shard scripts and are loaded on first expand (works from file://).
+window.__shard = function (id, data) {{
+    const cell = document.getElementById("detail-" + id);
+    const shots = (data.screenshots || []).map(s =>
+        `<a href="${{s.full}}" target="_blank"><img class="thumb" loading="lazy" src="${{s.thumb || s.full}}"></a>`
+    ).join("");
+    const pre = document.createElement("pre");
+    pre.textContent = [data.longrepr, data.log].filter(Boolean).join("\\n\\n");
+    cell.innerHTML = shots;
+    cell.appendChild(pre);
+}};
+function toggle(id, src) {{
+    const row = document.getElementById("row-" + id);
+    row.hidden = !row.hidden;
+    if (!row.dataset.loaded) {{
+        row.dataset.loaded = "1";
+        const script = document.createElement("script");
+        script.src = src;
+        document.body.appendChild(script);
+    }}
+}}
+</script>
+</body>
+</html>
+"""
+
+
+class ShardedReport:
+    """Lightweight HTML report built from per-test shards written during the run.
+
+    Every process (controller or xdist worker) writes one small JS shard per test plus a line
+    in its own summary file as results arrive. At the end of the run the controller merges all
+    summary files into an index page; test details and screenshot thumbnails load on demand.
+    """
+
+    def __init__(self, directory: str, screenshots, worker_id: str = "master"):
+        self.directory = directory
+        self.screenshots = screenshots
+        self.worker_id = worker_id
+        self.shard_dir = os.path.join(directory, "shards")
+        self.reports_dir = os.path.dirname(screenshots.directory) if screenshots else "reports"
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    def reset(self) -> None:
+        """Removes shards of a previous run (controller only, before workers start)."""
+        shutil.rmtree(self.shard_dir, ignore_errors=True)
+        os.makedirs(self.shard_dir, exist_ok=True)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        """Writes a shard for the call phase and for failed/skipped setup or teardown."""
+        if hasattr(report, "node"):
+            return  # report relayed from an xdist worker, which wrote its own shard
+        if report.when != "call" and report.passed:
+            return
+
+        with self._lock:
+            self._seq += 1
+            shard_id = f"{self.worker_id}-{self._seq:05d}"
+
+        shard = {
+            "nodeid": report.nodeid,
+            "when": report.when,
+            "outcome": "error" if report.failed and report.when != "call" else report.outcome,
+            "duration": round(report.duration, 3),
+            "tc_id": self._tc_id(report),
+            "worker": self.worker_id,
+            "longrepr": str(report.longrepr) if report.longrepr else "",
+            "log": report.caplog,
+            "screenshots": self._screenshots(report),
+        }
+        self._write_shard(shard_id, shard)
+
+    def pytest_sessionfinish(self, session) -> None:
+        """The controller (or a non-distributed run) builds the index once every shard is written."""
+        if self.worker_id == "master":
+            self.build_index()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if self.worker_id == "master":
+            path = os.path.abspath(os.path.join(self.directory, "index.html"))
+            terminalreporter.write_sep("-", f"Generated sharded report: {path}")
+
+    def build_index(self) -> str:
+        """Merges the summary files of every process into index.html; returns its path."""
+        entries = []
+        for name in sorted(os.listdir(self.shard_dir)):
+            if name.endswith(".jsonl"):
+                with open(os.path.join(self.shard_dir, name), encoding="utf-8") as f:
+                    entries.extend(json.loads(line) for line in f if line.strip())
+        entries.sort(key=lambda e: e["nodeid"])
+
+        rows = []
+        for e in entries:
+            sid = html.escape(e["id"])
+            rows.append(
+                f'<tr class="summary" onclick="toggle(\'{sid}\', \'shards/{sid}.js\')">'
+                f'<td class="{e["outcome"]}">{e["outcome"]}</td>'
+                f'<td>{html.escape(e["nodeid"])}{"" if e["when"] == "call" else " (" + e["when"] + ")"}</td>'
+                f'<td>{html.escape(e["tc_id"] or "")}</td><td>{html.escape(e["worker"])}</td>'
+                f'<td>{e["duration"]:.2f}s</td></tr>'
+                f'<tr id="row-{sid}" hidden><td colspan="5" id="detail-{sid}">Loading…</td></tr>'
+            )
+
+        counts = {}
+        for e in entries:
+            counts[e["outcome"]] = counts.get(e["outcome"], 0) + 1
+        summary = ", ".join(f"{n} {outcome}" for outcome, n in sorted(counts.items()))
+        summary += f" – generated {datetime.now():%Y-%m-%d %H:%M:%S}"
+
+        path = os.path.join(self.directory, "index.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_INDEX_TEMPLATE.format(summary=html.escape(summary), rows="\n".join(rows)))
+        return path
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+    def _write_shard(self, shard_id: str, shard: dict) -> None:
+        """Writes the detail shard and appends its summary line."""
+        os.makedirs(self.shard_dir, exist_ok=True)
+        with open(os.path.join(self.shard_dir, f"{shard_id}.js"), "w", encoding="utf-8") as f:
+            f.write(f"window.__shard({json.dumps(shard_id)}, {json.dumps(shard)});\n")
+
+        summary = {k: shard[k] for k in ("nodeid", "when", "outcome", "duration", "tc_id", "worker")}
+        summary["id"] = shard_id
+        with open(os.path.join(self.shard_dir, f"{self.worker_id}.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(summary) + "\n")
+
+    def _screenshots(self, report) -> list[dict]:
+        """Full-size and thumbnail links (relative to the index page) for the report's images."""
+        images = []
+        for extra in getattr(report, "extras", None) or getattr(report, "extra", []):
+            if isinstance(extra, dict) and extra.get("format_type") == "image":
+                relative = extra["content"]
+                thumb = self.screenshots.thumbnail_for(relative) if self.screenshots else None
+                images.append({"full": self._from_index(relative), "thumb": thumb and self._from_index(thumb)})
+        return images
+
+    def _from_index(self, report_relative: str) -> str:
+        """Converts a path relative to reports/ into one relative to the index page."""
+        return os.path.relpath(os.path.join(self.reports_dir, report_relative), self.directory).replace("\\", "/")
+
+    @staticmethod
+    def _tc_id(report) -> str | None:
+        """tc_id marker value (copied into user_properties at collection time)."""
+        return dict(report.user_properties).get("tc_id")
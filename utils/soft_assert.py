@@ -2,10 +2,15 @@ import os
 import uuid
 from datetime import datetime
 from pytest_html import extras
+from utils.dom_snapshot import DomSnapshot
 from utils.logger import get_logger
-import sys
+from utils.screenshot_pipeline import screenshot_pipeline_key
 
 class SoftAssert:
+    # Structured outcome attached to each assertion's log record
+    PASS = {"outcome": "pass"}
+    FAIL = {"outcome": "fail"}
+
     def __init__(self, driver, request):
         self._infos = []
         self._errors = []
@@ -24,56 +29,71 @@ class SoftAssert:
             current_node.extra = []
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{label}_{timestamp}_{uuid.uuid4().hex[:6]}.png"
-        abs_path = os.path.join(self.screenshot_dir, filename)
-        self.driver.save_screenshot(abs_path)
-        relative_path = f"screenshots/{filename}".replace("\\", "/")
+        pipeline = self.request.config.stash.get(screenshot_pipeline_key, None)
+        if pipeline:
+            relative_path = pipeline.capture(self.driver, filename)
+        else:
+            abs_path = os.path.join(self.screenshot_dir, filename)
+            self.driver.save_screenshot(abs_path)
+            relative_path = f"screenshots/{filename}".replace("\\", "/")
         current_node.extra.append(extras.image(relative_path, mime_type='image/png'))
         return relative_path
 
+    def _attach_dom(self, label, fragment):
+        try:
+            current_node = self.request.node
+        except Exception:
+            return
+        if not hasattr(current_node, "extra"):
+            current_node.extra = []
+        current_node.extra.append(extras.text(fragment, name=label))
+
+    def snapshot(self, root_css=None):
+        """Captures the DOM once; the returned helper soft-asserts against it with no further browser calls."""
+        return DomAssertions(self, DomSnapshot.capture(self.driver, root_css))
+
     def assert_true(self, condition, message=""):
         message = message or "Expected condition to be True"
         try:
             assert condition, message
         except AssertionError as e:
             error_msg = f"[ASSERT_TRUE FAIL] {str(e)}"
-            self.logger.error(error_msg, stacklevel=2)
+            self.logger.error(error_msg, stacklevel=2, extra=self.FAIL)
             self._errors.append((error_msg, None))
         else:
-            self.logger.info(f"[PASS] {message}", stacklevel=2)
-        sys.stdout.flush()
-        sys.stderr.flush()
+            self.logger.info(f"[PASS] {message}", stacklevel=2, extra=self.PASS)
 
     def assert_false(self, condition, message=""):
         message = message or "Expected condition to be False"
         try:
             assert not condition, message
-            self.logger.info(f"[PASS] {message}", stacklevel=2)
+            self.logger.info(f"[PASS] {message}", stacklevel=2, extra=self.PASS)
         except AssertionError as e:
             path = self._capture_screenshot("assert_false_fail")
             error_msg = f"[ASSERT_FALSE FAIL] {str(e)}"
-            self.logger.error(error_msg, stacklevel=2)
+            self.logger.error(error_msg, stacklevel=2, extra=self.FAIL)
             self._errors.append((error_msg, path))
 
     def assert_equal(self, actual, expected, message=""):
         message = message or f"Expected '{actual}' to equal '{expected}'"
         try:
             assert actual == expected, message
-            self.logger.info(f"[PASS] {message}", stacklevel=2)
+            self.logger.info(f"[PASS] {message}", stacklevel=2, extra=self.PASS)
         except AssertionError as e:
             path = self._capture_screenshot("assert_equal_fail")
             error_msg = f"[ASSERT_EQUAL FAIL] {str(e)}"
-            self.logger.error(error_msg, stacklevel=2)
+            self.logger.error(error_msg, stacklevel=2, extra=self.FAIL)
             self._errors.append((error_msg, path))
 
     def assert_in(self, member, container, message=""):
         message = message or f"Expected '{member}' to be in '{container}'"
         try:
             assert member in container, message
-            self.logger.info(f"[PASS] {message}", stacklevel=2)
+            self.logger.info(f"[PASS] {message}", stacklevel=2, extra=self.PASS)
         except AssertionError as e:
             path = self._capture_screenshot("assert_in_fail")
             error_msg = f"[ASSERT_IN FAIL] {str(e)}"
-            self.logger.error(error_msg, stacklevel=2)
+            self.logger.error(error_msg, stacklevel=2, extra=self.FAIL)
             self._errors.append((error_msg, path))
 
     def assert_info(self, *args):
@@ -87,7 +107,7 @@ class SoftAssert:
 
         if condition:
             info_msg = f"[PASS] {message}"
-            self.logger.info(info_msg, stacklevel=2)
+            self.logger.info(info_msg, stacklevel=2, extra=self.PASS)
             self._infos.append((info_msg, None))
 
     def assert_all(self):
@@ -102,3 +122,88 @@ class SoftAssert:
             assert unexpected not in actual, message or f"Did not expect '{unexpected}' in '{actual}'"
         except AssertionError as e:
             self._errors.append(f"[ASSERT_NOT_IN FAIL] {message or str(e)}")
+
+
+class DomAssertions:
+    """Soft assertions against one DomSnapshot; failures attach the DOM fragment instead of a screenshot.
+
+    A locator the snapshot cannot evaluate fails its assertion instead of raising.
+    """
+
+    _UNSUPPORTED = object()
+
+    def __init__(self, soft, dom):
+        self.soft = soft
+        self.dom = dom
+
+    def _find(self, locator, kind, many=False):
+        """find()/find_all() result, or _UNSUPPORTED after recording the locator as a failed assertion."""
+        try:
+            return self.dom.find_all(locator) if many else self.dom.find(locator)
+        except ValueError as e:
+            self._check(False, str(e), kind, locator, stacklevel=4)
+            return self._UNSUPPORTED
+
+    def _check(self, passed, message, kind, locator, element=None, stacklevel=3):
+        if passed:
+            self.soft.logger.info(f"[PASS] {message}", stacklevel=stacklevel, extra=self.soft.PASS)
+            return
+        error_msg = f"[DOM_{kind} FAIL] {message} ({locator[0]}={locator[1]})"
+        self.soft.logger.error(error_msg, stacklevel=stacklevel, extra=self.soft.FAIL)
+        fragment = self.dom.outer_html(element if element is not None else self.dom.root)
+        self.soft._attach_dom(f"DOM {kind.lower()} {locator[1]}", fragment)
+        self.soft._errors.append((error_msg, None))
+
+    def assert_present(self, locator, message=""):
+        element = self._find(locator, "PRESENT")
+        if element is self._UNSUPPORTED:
+            return
+        self._check(element is not None, message or f"Expected {locator[1]} in the DOM",
+                    "PRESENT", locator)
+
+    def assert_absent(self, locator, message=""):
+        element = self._find(locator, "ABSENT")
+        if element is self._UNSUPPORTED:
+            return
+        self._check(element is None, message or f"Did not expect {locator[1]} in the DOM",
+                    "ABSENT", locator, element)
+
+    def assert_count(self, locator, expected, message=""):
+        found = self._find(locator, "COUNT", many=True)
+        if found is self._UNSUPPORTED:
+            return
+        count = len(found)
+        self._check(count == expected, message or f"Expected {expected} matches for {locator[1]}, got {count}",
+                    "COUNT", locator)
+
+    def assert_text(self, locator, expected, message=""):
+        element = self._find(locator, "TEXT")
+        if element is self._UNSUPPORTED:
+            return
+        actual = self.dom.text(element) if element is not None else None
+        self._check(actual == expected, message or f"Expected text '{expected}', got '{actual}'",
+                    "TEXT", locator, element)
+
+    def assert_text_contains(self, locator, expected, message=""):
+        element = self._find(locator, "TEXT_CONTAINS")
+        if element is self._UNSUPPORTED:
+            return
+        actual = self.dom.text(element) if element is not None else ""
+        self._check(element is not None and expected in actual,
+                    message or f"Expected '{expected}' in text '{actual}'", "TEXT_CONTAINS", locator, element)
+
+    def assert_value(self, locator, expected, message=""):
+        element = self._find(locator, "VALUE")
+        if element is self._UNSUPPORTED:
+            return
+        actual = self.dom.value(element) if element is not None else None
+        self._check(actual == expected, message or f"Expected value '{expected}', got '{actual}'",
+                    "VALUE", locator, element)
+
+    def assert_attribute(self, locator, name, expected, message=""):
+        element = self._find(locator, "ATTRIBUTE")
+        if element is self._UNSUPPORTED:
+            return
+        actual = element.get(name) if element is not None else None
+        self._check(actual == expected, message or f"Expected {name}='{expected}', got '{actual}'",
+                    "ATTRIBUTE", locator, element)
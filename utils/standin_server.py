@@ -0,0 +1,577 @@
+import copy
+import html
+import json
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+
+# -------------------------
+# Seed data
+# -------------------------
+SEED_PRODUCTS = [
+    ("Apple Cinema 30\"", "Product 15", "110.00", 990),
+    ("Canon EOS 5D", "Product 3", "80.00", 7),
+    ("HP LP3065", "Product 21", "100.00", 1000),
+    ("HTC Touch HD", "Product 1", "100.00", 939),
+    ("iMac", "Product 14", "100.00", 977),
+    ("iPhone", "product 11", "101.00", 970),
+    ("iPod Classic", "product 20", "100.00", 995),
+    ("iPod Nano", "Product 9", "100.00", 994),
+    ("MacBook", "Product 16", "500.00", 929),
+    ("MacBook Air", "Product 17", "1000.00", 1000),
+    ("Nikon D300", "Product 4", "80.00", 1000),
+    ("Palm Treo Pro", "Product 2", "279.99", 1000),
+    ("Samsung Galaxy Tab 10.1", "SAM1", "199.99", 0),
+    ("Sony VAIO", "Product 19", "1000.00", 1000),
+]
+
+SEED_ORDERS = [
+    (1, "John Doe", "Cash On Delivery", "Pending", "106.00"),
+    (2, "John Doe", "Cash On Delivery", "Pending", "1,202.00"),
+    (3, "John Doe", "Cash On Delivery", "Processing", "80.00"),
+]
+
+ORDER_STATUSES = ["Canceled", "Complete", "Denied", "Pending", "Processing", "Shipped"]
+# stock_status_id -> name, as installed by OpenCart
+STOCK_STATUSES = {5: "Out Of Stock", 6: "2-3 Days", 7: "In Stock", 8: "Pre-Order"}
+PAGE_SIZE = 10
+
+
+# -------------------------
+# Page templates
+# -------------------------
+_STYLE = """
+.collapse, .tab-pane { display: none; }
+.collapse.show, .tab-pane.active { display: block; }
+.alert { padding: 8px; margin: 4px; border: 1px solid #ccc; }
+"""
+
+# Minimal client behaviour of the OpenCart 4 admin: AJAX forms (data-oc-toggle="ajax"),
+# list loading/paging, tabs, menu collapse, dismissible alerts and a CKEditor stand-in.
+_SCRIPT = """
+function request(method, url, body, done) {
+    const xhr = new XMLHttpRequest();
+    xhr.open(method, url);
+    if (body) xhr.setRequestHeader("Content-Type", "application/x-www-form-urlencoded");
+    xhr.onload = () => done(xhr.responseText);
+    xhr.send(body);
+}
+function load(target, url) {
+    request("GET", url, null, text => { document.querySelector(target).innerHTML = text; });
+}
+function showAlert(type, message) {
+    document.getElementById("alert").insertAdjacentHTML("afterbegin",
+        '<div class="alert alert-' + type + ' alert-dismissible">' + message +
+        ' <button type="button" class="btn-close" data-bs-dismiss="alert">x</button></div>');
+}
+function handleJson(text, form) {
+    const json = JSON.parse(text);
+    if (json.redirect) { location = json.redirect; return; }
+    if (json.error) showAlert("danger", typeof json.error === "string" ? json.error : json.error.warning);
+    if (json.success) {
+        showAlert("success", json.success);
+        if (json.product_id && form) form.querySelector("input[name='product_id']").value = json.product_id;
+        if (form && form.dataset.ocTarget) load(form.dataset.ocTarget, form.dataset.ocLoad);
+    }
+}
+document.addEventListener("click", e => {
+    const close = e.target.closest(".btn-close");
+    if (close) { close.closest(".alert").remove(); return; }
+
+    const tab = e.target.closest("[data-bs-toggle='tab']");
+    if (tab) {
+        e.preventDefault();
+        document.querySelectorAll(".tab-pane").forEach(p => p.classList.remove("active"));
+        document.querySelector(tab.getAttribute("href")).classList.add("active");
+        return;
+    }
+    const menu = e.target.closest("[data-bs-toggle='collapse']");
+    if (menu) {
+        e.preventDefault();
+        document.querySelector(menu.getAttribute("href")).classList.toggle("show");
+        return;
+    }
+    const page = e.target.closest(".pagination a");
+    if (page) {
+        e.preventDefault();
+        load("#" + page.closest("[data-list]").id, page.href);
+    }
+});
+document.addEventListener("submit", e => {
+    const form = e.target;
+    if (form.dataset.ocToggle !== "ajax") return;
+    e.preventDefault();
+    const action = (e.submitter && e.submitter.getAttribute("formaction")) || form.getAttribute("action");
+    request("POST", action, new URLSearchParams(new FormData(form)).toString(), text => handleJson(text, form));
+});
+window.CKEDITOR = {instances: {}};
+document.querySelectorAll("textarea[data-oc-toggle='ckeditor']").forEach(area => {
+    CKEDITOR.instances[area.id] = {setData: v => { area.value = v; }, getData: () => area.value};
+});
+"""
+
+
+def _page(title: str, body: str, token: str = "", base: str = "") -> str:
+    """Full admin page: menu (when logged in), alert container, content and shared script."""
+    menu = ""
+    if token:
+        products = _url(base, "catalog/product", token)
+        orders = _url(base, "sale/order", token)
+        menu = f"""
+<nav id="column-left"><ul id="menu">
+  <li><a id="menu-catalog" href="#collapse-catalog" data-bs-toggle="collapse">Catalog</a>
+    <ul id="collapse-catalog" class="collapse"><li><a href="{products}">Products</a></li></ul></li>
+  <li><a id="menu-sale" href="#collapse-sale" data-bs-toggle="collapse">Sales</a>
+    <ul id="collapse-sale" class="collapse"><li><a href="{orders}">Orders</a></li></ul></li>
+</ul></nav>"""
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title><style>{_STYLE}</style></head>
+<body>{menu}
+<div id="alert"></div>
+<div id="content"><h1>{html.escape(title)}</h1>{body}</div>
+<script>{_SCRIPT}</script>
+</body></html>"""
+
+
+def _url(base: str, route: str, token: str, separator: str = ".", **params) -> str:
+    """Admin URL for a route (with user_token); the route's "." becomes the method separator."""
+    query = {"route": route.replace(".", separator), "user_token": token}
+    query.update({k: v for k, v in params.items() if v not in (None, "")})
+    return f"{base}index.php?{urlencode(query, safe='/|')}"
+
+
+# -------------------------
+# State
+# -------------------------
+class StandInState:
+    """In-memory catalog, orders and admin sessions."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.sessions: dict[str, str] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Restores the seed products/orders (admin sessions are kept)."""
+        with self.lock:
+            self.products = {}
+            for i, (name, model, price, quantity) in enumerate(SEED_PRODUCTS, start=28):
+                self.products[i] = {
+                    "product_id": i, "name": name, "meta_title": name, "description": "",
+                    "meta_description": "", "meta_keyword": "", "tag": "", "model": model,
+                    "price": price, "quantity": quantity, "location": "", "date_available": "2009-02-03",
+                    "stock_status": "In Stock", "status": True, "category": "", "keyword": "",
+                }
+            self.orders = {
+                order_id: {"order_id": order_id, "customer": customer, "payment_method": payment,
+                           "status": status, "total": total, "history": []}
+                for order_id, customer, payment, status, total in SEED_ORDERS
+            }
+            self.next_product_id = max(self.products) + 1
+
+    def snapshot(self) -> dict:
+        """Deep copy of products and orders (for assertions or benchmarks)."""
+        with self.lock:
+            return {"products": copy.deepcopy(self.products), "orders": copy.deepcopy(self.orders)}
+
+
+# -------------------------
+# Request handling
+# -------------------------
+class _Handler(BaseHTTPRequestHandler):
+    """Serves the subset of admin routes the page objects use."""
+
+    server: "_StandInHTTPServer"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    # -- plumbing --
+    def do_GET(self) -> None:
+        self._dispatch({})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        self._dispatch({k: v if k.endswith("[]") else v[-1] for k, v in form.items()})
+
+    def _dispatch(self, form: dict) -> None:
+        parsed = urlparse(self.path)
+        if not parsed.path.startswith(self.server.admin_path):
+            return self._send(404, "Not found")
+
+        self.query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        # Like OpenCart, only the configured method separator is understood
+        route = self.query.get("route", "common/login")
+        other = "|" if self.server.separator == "." else "."
+        route = "" if other in route else route.replace(self.server.separator, ".")
+        self.base = f"http://{self.headers.get('Host')}{self.server.admin_path}"
+
+        if route == "common/login":
+            return self._send(200, self._login_page())
+        if route == "common/login.login":
+            return self._login(form)
+
+        self.token = self._session_token()
+        if not self.token or self.query.get("user_token") != self.token:
+            return self._redirect(f"{self.base}index.php?route=common/login")
+
+        handler = self.ROUTES.get(route)
+        if not handler:
+            return self._send(404, _page("Not found", "<p>Unknown route</p>", self.token, self.base))
+        with self.server.state.lock:
+            handler(self, form)
+
+    def _send(self, status: int, body, content_type: str = "text/html; charset=utf-8", headers=None) -> None:
+        data = (json.dumps(body) if content_type == "application/json" else body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _json(self, body: dict) -> None:
+        self._send(200, body, "application/json")
+
+    def _redirect(self, location: str, headers=None) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _session_token(self) -> str | None:
+        cookie = SimpleCookie(self.headers.get("Cookie") or "")
+        session = cookie.get("OCSESSID")
+        return self.server.state.sessions.get(session.value) if session else None
+
+    def _url(self, route: str, **params) -> str:
+        return _url(self.base, route, self.token, self.server.separator, **params)
+
+    # -- login / dashboard --
+    def _login_page(self, error: str = "") -> str:
+        alert = f'<div class="alert alert-danger alert-dismissible">{error}</div>' if error else ""
+        return _page("Administration", f"""{alert}
+<form id="form-login" method="post" action="{self.base}index.php?route=common/login{self.server.separator}login">
+  <label for="input-username">Username</label><input type="text" name="username" id="input-username">
+  <label for="input-password">Password</label><input type="password" name="password" id="input-password">
+  <button type="submit" class="btn btn-primary">Login</button>
+</form>""")
+
+    def _login(self, form: dict) -> None:
+        if (form.get("username"), form.get("password")) != self.server.credentials:
+            return self._send(200, self._login_page("No match for Username and/or Password."))
+        session, token = secrets.token_hex(13), secrets.token_hex(16)
+        self.server.state.sessions[session] = token
+        self._redirect(
+            _url(self.base, "common/dashboard", token),
+            {"Set-Cookie": f"OCSESSID={session}; Path=/; HttpOnly; SameSite=Lax"},
+        )
+
+    def dashboard(self, form: dict) -> None:
+        self._send(200, _page("Dashboard", "<p>Welcome to the stand-in admin.</p>", self.token, self.base))
+
+    # -- products --
+    def product_list_page(self, form: dict) -> None:
+        list_url = self._url("catalog/product.list")
+        body = f"""
+<div class="float-end">
+  <a href="{self._url('catalog/product.form')}" title="Add New" class="btn btn-primary">+</a>
+  <button type="submit" form="form-product" formaction="{self._url('catalog/product.delete')}"
+          title="Delete" class="btn btn-danger" onclick="return confirm('Are you sure?');">Delete</button>
+</div>
+<div id="filter-product">
+  <label for="input-name">Product Name</label><input type="text" name="filter_name" id="input-name">
+  <button type="button" id="button-filter" class="btn btn-light">Filter</button>
+</div>
+<form id="form-product" method="post" data-oc-toggle="ajax" data-oc-target="#product" data-oc-load="{list_url}">
+  <div id="product" data-list="1">{self._product_list()}</div>
+</form>
+<script>
+document.getElementById("button-filter").addEventListener("click", () => {{
+    const name = document.getElementById("input-name").value;
+    const url = "{list_url}" + (name ? "&filter_name=" + encodeURIComponent(name) : "");
+    document.getElementById("form-product").dataset.ocLoad = url;
+    load("#product", url);
+}});
+</script>"""
+        self._send(200, _page("Products", body, self.token, self.base))
+
+    def product_list(self, form: dict) -> None:
+        self._send(200, self._product_list())
+
+    def _product_list(self) -> str:
+        name_filter = (self.query.get("filter_name") or "").lower()
+        model_filter = (self.query.get("filter_model") or "").lower()
+        page = max(int(self.query.get("page") or 1), 1)
+        products = sorted(
+            (p for p in self.server.state.products.values()
+             if p["name"].lower().startswith(name_filter) and p["model"].lower().startswith(model_filter)),
+            key=lambda p: p["name"].lower(),
+        )
+        shown = products[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+
+        rows = "".join(f"""
+<tr>
+  <td><input type="checkbox" name="selected[]" value="{p['product_id']}" class="form-check-input"></td>
+  <td><img src="" alt=""></td>
+  <td>{html.escape(p['name'])}</td>
+  <td>{html.escape(p['model'])}</td>
+  <td>${float(p['price'] or 0):.2f}</td>
+  <td>{p['quantity']}</td>
+  <td>{'Enabled' if p['status'] else 'Disabled'}</td>
+  <td><a href="{self._url('catalog/product.form', product_id=p['product_id'])}" title="Edit" class="btn btn-primary">Edit</a></td>
+</tr>""" for p in shown) or '<tr><td class="text-center" colspan="8">No results!</td></tr>'
+
+        pagination = ""
+        pages = (len(products) + PAGE_SIZE - 1) // PAGE_SIZE
+        if pages > 1:
+            links = "".join(
+                f'<li class="page-item"><a class="page-link" '
+                f'href="{self._url("catalog/product.list", filter_name=name_filter, page=n)}">{n}</a></li>'
+                for n in range(1, pages + 1)
+            )
+            pagination = f'<ul class="pagination">{links}</ul>'
+
+        return f"""<table class="table">
+<thead><tr><th></th><th>Image</th><th>Product Name</th><th>Model</th><th>Price</th><th>Quantity</th>
+<th>Status</th><th>Action</th></tr></thead>
+<tbody>{rows}</tbody></table>{pagination}"""
+
+    def product_form(self, form: dict) -> None:
+        product_id = int(self.query.get("product_id") or 0)
+        p = self.server.state.products.get(product_id) or {
+            "product_id": 0, "name": "", "meta_title": "", "description": "", "meta_description": "",
+            "meta_keyword": "", "tag": "", "model": "", "price": "", "quantity": 1, "location": "",
+            "date_available": "", "stock_status": "In Stock", "status": False, "category": "", "keyword": "",
+        }
+        esc = {k: html.escape(str(v)) for k, v in p.items()}
+        stock = "".join(
+            f'<option value="{i}"{" selected" if s == p["stock_status"] else ""}>{s}</option>'
+            for i, s in STOCK_STATUSES.items()
+        )
+        body = f"""
+<div class="float-end"><button type="submit" form="form-product" title="Save" class="btn btn-primary">Save</button></div>
+<ul class="nav nav-tabs">
+  <li><a href="#tab-general" data-bs-toggle="tab">General</a></li>
+  <li><a href="#tab-data" data-bs-toggle="tab">Data</a></li>
+  <li><a href="#tab-links" data-bs-toggle="tab">Links</a></li>
+  <li><a href="#tab-seo" data-bs-toggle="tab">SEO</a></li>
+</ul>
+<form id="form-product" method="post" data-oc-toggle="ajax" action="{self._url('catalog/product.save')}">
+  <input type="hidden" name="product_id" value="{p['product_id']}">
+  <div id="tab-general" class="tab-pane active">
+    <input type="text" name="product_description[1][name]" id="input-name-1" value="{esc['name']}">
+    <textarea name="product_description[1][description]" id="input-description-1" data-oc-toggle="ckeditor">{esc['description']}</textarea>
+    <input type="text" name="product_description[1][meta_title]" id="input-meta-title-1" value="{esc['meta_title']}">
+    <textarea name="product_description[1][meta_description]" id="input-meta-description-1">{esc['meta_description']}</textarea>
+    <textarea name="product_description[1][meta_keyword]" id="input-meta-keyword-1">{esc['meta_keyword']}</textarea>
+    <input type="text" name="product_description[1][tag]" id="input-tag-1" value="{esc['tag']}">
+    <input type="hidden" name="status" value="0">
+    <input type="checkbox" name="status" value="1" id="input-status"{" checked" if p['status'] else ""}>
+  </div>
+  <div id="tab-data" class="tab-pane">
+    <input type="text" name="model" id="input-model" value="{esc['model']}">
+    <input type="text" name="price" id="input-price" value="{esc['price']}">
+    <input type="text" name="quantity" id="input-quantity" value="{esc['quantity']}">
+    <input type="text" name="location" id="input-location" value="{esc['location']}">
+    <input type="text" name="date_available" id="input-date-available" value="{esc['date_available']}">
+    <select name="stock_status_id" id="input-stock-status">{stock}</select>
+  </div>
+  <div id="tab-links" class="tab-pane">
+    <input type="text" name="category" id="input-category" value="{esc['category']}" autocomplete="off">
+  </div>
+  <div id="tab-seo" class="tab-pane">
+    <input type="text" name="product_seo_url[0][1]" id="input-keyword-0-1" value="{esc['keyword']}">
+  </div>
+</form>"""
+        self._send(200, _page("Products", body, self.token, self.base))
+
+    def product_save(self, form: dict) -> None:
+        state = self.server.state
+        product_id = int(form.get("product_id") or 0)
+        desc = {k: form.get(f"product_description[1][{k}]", "") for k in
+                ("name", "description", "meta_title", "meta_description", "meta_keyword", "tag")}
+        model, keyword = form.get("model", ""), form.get("product_seo_url[0][1]", "")
+
+        # Same shape as OpenCart 4: field errors keyed by input, plus a general warning
+        errors = {}
+        if not 1 <= len(desc["name"]) <= 255:
+            errors["name_1"] = "Product Name must be between 1 and 255 characters!"
+        if not 1 <= len(desc["meta_title"]) <= 255:
+            errors["meta_title_1"] = "Meta Tag Title must be between 1 and 255 characters!"
+        if not 1 <= len(model) <= 64:
+            errors["model"] = "Product Model must be between 1 and 64 characters!"
+        if keyword and any(p["keyword"] == keyword and p["product_id"] != product_id for p in state.products.values()):
+            errors["keyword_0_1"] = "SEO URL keyword already in use!"
+        if errors:
+            errors["warning"] = "Warning: Please check the form carefully for errors!"
+            return self._json({"error": errors})
+
+        json_body = {"success": "Success: You have modified products!"}
+        if product_id not in state.products:
+            product_id = json_body["product_id"] = state.next_product_id
+            state.next_product_id += 1
+        state.products[product_id] = {
+            "product_id": product_id, **desc, "model": model,
+            "price": form.get("price", ""), "quantity": int(form.get("quantity") or 0),
+            "location": form.get("location", ""), "date_available": form.get("date_available", ""),
+            "stock_status": STOCK_STATUSES.get(int(form.get("stock_status_id") or 0), ""),
+            "status": form.get("status") == "1", "category": form.get("category", ""), "keyword": keyword,
+        }
+        self._json(json_body)
+
+    def product_delete(self, form: dict) -> None:
+        selected = [int(v) for v in form.get("selected[]", [])]
+        for product_id in selected:
+            self.server.state.products.pop(product_id, None)
+        self._json({"success": "Success: You have modified products!"})
+
+    # -- orders --
+    def order_list_page(self, form: dict) -> None:
+        list_url = self._url("sale/order.list")
+        body = f"""
+<div id="order" data-list="1">{self._order_list()}</div>
+<div id="filter-order">
+  <label for="input-order-id">Order ID</label><input type="text" name="filter_order_id" id="input-order-id">
+  <button type="button" id="button-filter" class="btn btn-light">Filter</button>
+</div>
+<script>
+document.getElementById("button-filter").addEventListener("click", () => {{
+    const id = document.getElementById("input-order-id").value;
+    load("#order", "{list_url}" + (id ? "&filter_order_id=" + encodeURIComponent(id) : ""));
+}});
+</script>"""
+        self._send(200, _page("Orders", body, self.token, self.base))
+
+    def order_list(self, form: dict) -> None:
+        self._send(200, self._order_list())
+
+    def _order_list(self) -> str:
+        order_filter = self.query.get("filter_order_id")
+        orders = sorted(self.server.state.orders.values(), key=lambda o: -o["order_id"])
+        if order_filter:
+            orders = [o for o in orders if str(o["order_id"]) == order_filter]
+
+        rows = "".join(f"""
+<tr>
+  <td><input type="checkbox" name="selected[]" value="{o['order_id']}"></td>
+  <td>{o['order_id']}</td>
+  <td>Default</td>
+  <td>{html.escape(o['customer'])}</td>
+  <td>{html.escape(o['status'])}</td>
+  <td>${o['total']}</td>
+  <td>21/01/2026</td>
+  <td>21/01/2026</td>
+  <td><a href="{self._url('sale/order.info', order_id=o['order_id'])}" title="View" class="btn btn-info">View</a></td>
+</tr>""" for o in orders) or '<tr><td class="text-center" colspan="9">No results!</td></tr>'
+
+        return f"""<table class="table">
+<thead><tr><th></th><th>Order ID</th><th>Store</th><th>Customer</th><th>Status</th><th>Total</th>
+<th>Date Added</th><th>Date Modified</th><th>Action</th></tr></thead>
+<tbody>{rows}</tbody></table>"""
+
+    def order_info(self, form: dict) -> None:
+        order = self.server.state.orders.get(int(self.query.get("order_id") or 0))
+        if not order:
+            return self._send(404, _page("Orders", "<p>Order not found</p>", self.token, self.base))
+
+        payments = "".join(
+            f'<option{" selected" if m == order["payment_method"] else ""}>{m}</option>'
+            for m in ("Bank Transfer", "Cash On Delivery")
+        )
+        statuses = "".join(
+            f'<option value="{s}"{" selected" if s == order["status"] else ""}>{s}</option>'
+            for s in ORDER_STATUSES
+        )
+        history_url = self._url("sale/order.history", order_id=order["order_id"])
+        body = f"""
+<div id="customer-value">{html.escape(order['customer'])}</div>
+<select name="payment_method" id="input-payment-method">{payments}</select>
+<fieldset id="history">
+  <select name="order_status" id="input-order-status">{statuses}</select>
+  <button type="button" id="button-history" class="btn btn-primary">Add History</button>
+</fieldset>
+<script>
+document.getElementById("button-history").addEventListener("click", () => {{
+    const status = document.getElementById("input-order-status").value;
+    request("POST", "{history_url}", "order_status=" + encodeURIComponent(status), text => handleJson(text, null));
+}});
+</script>"""
+        self._send(200, _page(f"Order #{order['order_id']}", body, self.token, self.base))
+
+    def order_history(self, form: dict) -> None:
+        order = self.server.state.orders.get(int(self.query.get("order_id") or 0))
+        if not order or form.get("order_status") not in ORDER_STATUSES:
+            return self._json({"error": {"warning": "Warning: Order status could not be updated!"}})
+        order["status"] = form["order_status"]
+        order["history"].append(form["order_status"])
+        self._json({"success": "Success: You have modified orders!"})
+
+    ROUTES = {
+        "common/dashboard": dashboard,
+        "catalog/product": product_list_page,
+        "catalog/product.list": product_list,
+        "catalog/product.form": product_form,
+        "catalog/product.save": product_save,
+        "catalog/product.delete": product_delete,
+        "sale/order": order_list_page,
+        "sale/order.list": order_list,
+        "sale/order.info": order_info,
+        "sale/order.history": order_history,
+    }
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, state: StandInState, admin_path: str, credentials: tuple[str, str],
+                 separator: str):
+        super().__init__(address, _Handler)
+        self.state = state
+        self.admin_path = admin_path
+        self.credentials = credentials
+        self.separator = separator
+
+
+class StandInServer:
+    """Local stand-in for the OpenCart 4 admin panel (login, menu, products, orders).
+
+    Serves the same element ids/classes and AJAX endpoints the page objects use, with
+    in-memory state, so the suite can run offline and deterministically. `separator` is
+    the route method separator it serves ("|" like OpenCart 4.0.0/4.0.1, "." like 4.0.2+).
+    """
+
+    ADMIN_PATH = "/admin/"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, username: str = "admin", password: str = "admin",
+                 separator: str = "|"):
+        self.state = StandInState()
+        self._server = _StandInHTTPServer((host, port), self.state, self.ADMIN_PATH, (username, password), separator)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="standin-server", daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Admin base URL (ending with /admin/)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.ADMIN_PATH}"
+
+    def start(self) -> "StandInServer":
+        """Starts serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the server and closes its socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self) -> None:
+        """Restores the seed catalog and orders."""
+        self.state.reset()
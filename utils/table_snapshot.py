@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+
+from selenium.webdriver.remote.webelement import WebElement
+
+
+# Reads a whole admin list table in one round trip: cell texts plus the handles
+# tests act on (row checkbox and titled action links/buttons such as Edit/View).
+_SNAPSHOT_SCRIPT = """
+const table = document.querySelector(arguments[0]);
+if (!table) return null;
+return Array.from(table.querySelectorAll("tbody tr")).map(tr => ({
+    cells: Array.from(tr.cells).map(td => td.innerText.trim()),
+    text: tr.innerText.trim(),
+    checkbox: tr.querySelector("input[type='checkbox']"),
+    actions: Array.from(tr.querySelectorAll("a[title], button[title]")).map(a => [a.getAttribute("title"), a]),
+}));
+"""
+
+
+@dataclass
+class TableRow:
+    """One row of a table snapshot."""
+
+    index: int
+    cells: list[str]
+    text: str
+    checkbox: WebElement | None = None
+    actions: dict[str, WebElement] = field(default_factory=dict)
+
+    def cell(self, column: int) -> str:
+        """Text of a cell (empty for rows without that column, e.g. "No results!")."""
+        return self.cells[column] if column < len(self.cells) else ""
+
+
+class TableSnapshot:
+    """Rows of an admin list table fetched in one execute_script, indexed by a key column."""
+
+    def __init__(self, rows: list[TableRow], key_column: int):
+        self.rows = rows
+        self.key_column = key_column
+        self._index: dict[str, TableRow] = {}
+        for row in rows:
+            key = self._normalize(row.cell(key_column).split("\n")[0])
+            if key:
+                self._index.setdefault(key, row)
+
+    @classmethod
+    def fetch(cls, driver, table_selector: str, key_column: int) -> "TableSnapshot":
+        """Reads the table matched by a CSS selector (empty snapshot when it is missing)."""
+        raw = driver.execute_script(_SNAPSHOT_SCRIPT, table_selector) or []
+        rows = [
+            TableRow(
+                index=i,
+                cells=item["cells"],
+                text=item["text"],
+                checkbox=item["checkbox"],
+                actions=dict(item["actions"]),
+            )
+            for i, item in enumerate(raw)
+        ]
+        return cls(rows, key_column)
+
+    # -------------------------
+    # Lookups
+    # -------------------------
+    def get(self, key) -> TableRow | None:
+        """Row whose key column equals `key` (case-insensitive)."""
+        return self._index.get(self._normalize(str(key)))
+
+    def find(self, needle) -> TableRow | None:
+        """Row keyed by `needle`, else the first row whose text contains it (case-insensitive)."""
+        row = self.get(needle)
+        if row:
+            return row
+
+        needle = self._normalize(str(needle))
+        if not needle:
+            return None
+        return next((r for r in self.rows if needle in r.text.lower()), None)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @staticmethod
+    def _normalize(value: str) -> str:
+        """Lookup form of a key or needle."""
+        return (value or "").strip().lower()
@@ -0,0 +1,73 @@
+import re
+import uuid
+from datetime import datetime, timedelta
+
+
+class DataNamespace:
+    """Unique test-data values for one run and one xdist worker.
+
+    Every value carries a tag like "AUTO-20260121T1407-df6b-gw0" (run start time, run id,
+    worker id), so parallel workers never collide on names, models or OpenCart's unique
+    SEO keywords, and rows left behind by crashed runs can be recognised and purged.
+    """
+
+    PREFIX = "AUTO"
+    TIME_FORMAT = "%Y%m%dT%H%M"
+    TAG_RE = re.compile(rf"{PREFIX}-(\d{{8}}T\d{{4}})-([0-9a-f]{{4}})-(\w+)", re.IGNORECASE)
+
+    def __init__(self, run_id: str | None = None, worker_id: str = "master", started_at: datetime | None = None):
+        self.started_at = started_at or datetime.now()
+        self.run_id = (run_id or uuid.uuid4().hex)[:4]
+        self.worker_id = worker_id
+        self.tag = f"{self.PREFIX}-{self.started_at.strftime(self.TIME_FORMAT)}-{self.run_id}-{self.worker_id}"
+
+    # -------------------------
+    # Value builders
+    # -------------------------
+    def name(self, base: str) -> str:
+        """Product/entity name; the tag leads so OpenCart's starts-with name filter finds it."""
+        return f"{self.tag} {base}"
+
+    def model(self, base: str) -> str:
+        """Product model code."""
+        return f"{base}-{self.tag}"
+
+    def seo_keyword(self, base: str) -> str:
+        """SEO keyword (lowercase, URL-safe, unique per store)."""
+        return re.sub(r"[^a-z0-9-]+", "-", f"{base}-{self.tag}".lower()).strip("-")
+
+    # -------------------------
+    # Leftover detection
+    # -------------------------
+    def is_disposable(self, text: str, max_age: timedelta = timedelta(hours=6)) -> bool:
+        """True for data from this namespace, or from another run old enough to be a crash leftover."""
+        match = self.TAG_RE.search(text or "")
+        if not match:
+            return False
+        if match.group(0).lower() == self.tag.lower():
+            return True
+
+        started = datetime.strptime(match.group(1).upper(), self.TIME_FORMAT)
+        return self.started_at - started > max_age
+
+
+def purge_leftover_products(products, namespace: DataNamespace) -> int:
+    """Deletes products created by this namespace or by crashed earlier runs; returns how many.
+
+    Pages through the "AUTO-" filtered list before giving up: rows of runs still in progress
+    (other workers, other machines) are kept and can fill whole pages.
+    """
+    deleted = 0
+    while True:
+        products.search_by_name(f"{DataNamespace.PREFIX}-")
+        page, selected = 1, products.select_rows_where(namespace.is_disposable)
+        while not selected and products.go_to_page(page + 1):
+            page += 1
+            selected = products.select_rows_where(namespace.is_disposable)
+        if not selected:
+            return deleted
+
+        products.delete_selected()
+        products.accept_delete_confirm()
+        products.wait_success_message()
+        deleted += selected
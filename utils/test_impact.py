@@ -0,0 +1,252 @@
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+from filelock import FileLock
+
+
+# Changes to these files can affect any test, so they select the whole suite
+RUN_ALL_FILES = ("conftest.py", "pytest.ini", "requirements.txt")
+TRACKED_DIRS = ("pages", "utils")
+
+# Calls that only run their body on a cache miss (the first caller in a session pays for the
+# login or browser launch). What runs under them is recorded as a shared dependency of the
+# call, so every test making the call depends on it whether it hit the cache or not.
+CACHED_CALLS = (
+    "utils/auth_cache.py::AdminAuthCache.login",
+    "utils/browser_pool.py::BrowserPool.acquire",
+    "utils/browser_prewarm.py::BrowserPrewarmer.acquire",
+)
+
+_HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def fixture_scope(name: str) -> str:
+    """Shared-dependency key of a (session/module/class scoped) fixture."""
+    return f"@fixture:{name}"
+
+
+class ImpactRecorder:
+    """Records which functions in pages/ and utils/ run while a test executes ("path::Qual.name").
+
+    Calls made under a CACHED_CALLS function or inside a scope opened with `enter()` (a
+    shared fixture's setup/teardown) go to `shared[<call or scope>]` instead of the test.
+    """
+
+    def __init__(self, root: str, tracked_dirs: tuple[str, ...] = TRACKED_DIRS):
+        self.root = os.path.abspath(root)
+        self.prefixes = tuple(os.path.join(self.root, d) + os.sep for d in tracked_dirs)
+        self._files: dict[str, str | None] = {}
+        self._calls: set[str] = set()
+        self.shared: dict[str, set[str]] = {}
+        self._scopes: list[tuple[str, object]] = []
+
+    def start(self) -> None:
+        self._calls = set()
+        self.shared = {}
+        self._scopes = []
+        sys.setprofile(self._profile)
+
+    def stop(self) -> list[str]:
+        """Stops recording and returns the sorted functions called since start()."""
+        sys.setprofile(None)
+        return sorted(self._calls)
+
+    def enter(self, scope: str) -> None:
+        """Records the following calls as shared dependencies of `scope` until exit(scope)."""
+        self.shared.setdefault(scope, set())
+        self._scopes.append((scope, None))
+
+    def exit(self, scope: str) -> None:
+        for i in range(len(self._scopes) - 1, -1, -1):
+            if self._scopes[i][0] == scope:
+                del self._scopes[i:]
+                return
+
+    def _profile(self, frame, event, arg):
+        if event == "return":
+            if self._scopes and self._scopes[-1][1] is frame:
+                self._scopes.pop()
+            return
+        if event != "call":
+            return
+        code = frame.f_code
+        path = self._files.get(code.co_filename, False)
+        if path is False:
+            filename = os.path.abspath(code.co_filename)
+            path = os.path.relpath(filename, self.root).replace(os.sep, "/") if filename.startswith(self.prefixes) else None
+            self._files[code.co_filename] = path
+        if not path:
+            return
+        function = f"{path}::{code.co_qualname}"
+        (self.shared[self._scopes[-1][0]] if self._scopes else self._calls).add(function)
+        if function in CACHED_CALLS:
+            self.shared.setdefault(function, set())
+            self._scopes.append((function, frame))
+
+
+class ImpactMap:
+    """Test -> page-object functions map, merged into a JSON file under a file lock (xdist-safe).
+
+    `shared` maps cached calls and shared fixtures to what ran under them; it is the union
+    over all recorded runs, since a cache hit records nothing.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tests, self.shared = self._load()
+        self._new: dict[str, list[str]] = {}
+        self._new_shared: dict[str, set[str]] = {}
+
+    def _load(self) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data["tests"], data["shared"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}, {}
+
+    def record(self, nodeid: str, functions: list[str], shared: dict[str, set[str]] | None = None,
+               fixtures: list[str] | None = None) -> None:
+        """Stores a test's calls plus references to the shared fixtures (of `fixtures`) it used."""
+        for scope, calls in (shared or {}).items():
+            self._new_shared.setdefault(scope, set()).update(calls)
+        known = self._new_shared.keys() | self.shared.keys()
+        refs = [fixture_scope(name) for name in fixtures or () if fixture_scope(name) in known]
+        self._new[nodeid] = sorted(set(functions) | set(refs))
+
+    def save(self) -> None:
+        """Merges this process's recordings into the shared file."""
+        if not self._new and not self._new_shared:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with FileLock(self.path + ".lock", timeout=60):
+            tests, shared = self._load()
+            tests.update(self._new)
+            for scope, calls in self._new_shared.items():
+                shared[scope] = sorted(calls.union(shared.get(scope, ())))
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"tests": tests, "shared": shared}, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        self.tests, self.shared = tests, shared
+        self._new, self._new_shared = {}, {}
+
+
+impact_map_key = pytest.StashKey[ImpactMap]()
+impact_recorder_key = pytest.StashKey[ImpactRecorder]()
+
+
+# -------------------------
+# Change detection
+# -------------------------
+def changed_lines(base: str, root: str = ".") -> dict[str, set[int]]:
+    """Changed line numbers (in the working tree version) per file, from `git diff <base>`."""
+    diff = subprocess.run(
+        ["git", "diff", "-U0", "--no-color", "--no-ext-diff", base],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+
+    changes: dict[str, set[int]] = {}
+    current = old = None
+    in_header = False
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            current, old, in_header = None, None, True
+        elif in_header and line.startswith("--- "):
+            old = line[6:] if line.startswith("--- a/") else None
+        elif in_header and line.startswith("+++ "):
+            current = line[6:] if line.startswith("+++ b/") else None
+            if current:
+                changes.setdefault(current, set())
+            elif old:
+                # Deleted file (+++ /dev/null): recorded under its old path
+                changes.setdefault(old, set())
+        elif line.startswith("@@"):
+            in_header = False
+            hunk = _HUNK_RE.match(line)
+            if current and hunk:
+                start, count = int(hunk.group(1)), int(hunk.group(2) or 1)
+                # Pure deletions (count 0) touch the lines around the removal point
+                changes[current].update(range(start, start + count) if count else (start, start + 1))
+    return changes
+
+
+def _definitions(path: str) -> list[tuple[str, int, int, bool]]:
+    """(qualname, first line, last line, is_class) for every class/function in a Python file."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    found = []
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                qualname = f"{prefix}{child.name}"
+                first = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                is_class = isinstance(child, ast.ClassDef)
+                found.append((qualname, first, child.end_lineno, is_class))
+                visit(child, qualname + ("." if is_class else ".<locals>."))
+
+    visit(tree, "")
+    return found
+
+
+def changed_units(changes: dict[str, set[int]], root: str = ".") -> set[str]:
+    """Changed code units: "path::Qual.name" for functions, "path::Class" for class bodies, "path::" for module code."""
+    units = set()
+    for path, lines in changes.items():
+        full = os.path.join(root, path)
+        if not path.endswith(".py") or not os.path.exists(full):
+            units.add(f"{path}::")
+            continue
+        definitions = _definitions(full)
+        for line in lines:
+            enclosing = [d for d in definitions if d[1] <= line <= d[2]]
+            if not enclosing:
+                units.add(f"{path}::")
+                continue
+            # Innermost definition; a change in a class body (e.g. a locator constant) marks the whole class
+            qualname = max(enclosing, key=lambda d: d[1])[0]
+            units.add(f"{path}::{qualname}")
+    return units
+
+
+def _touches(function: str, unit: str) -> bool:
+    return function == unit or function.startswith(unit if unit.endswith("::") else unit + ".")
+
+
+def _with_shared(functions: list[str], shared: dict[str, list[str]]) -> set[str]:
+    """A test's functions plus everything recorded under its cached calls and shared fixtures (transitively)."""
+    found = set(functions)
+    pending = list(found)
+    while pending:
+        for callee in shared.get(pending.pop(), ()):
+            if callee not in found:
+                found.add(callee)
+                pending.append(callee)
+    return found
+
+
+def select_tests(nodeids: list[str], impact: dict[str, list[str]], changes: dict[str, set[int]],
+                 root: str = ".", shared: dict[str, list[str]] | None = None) -> tuple[list[str], str]:
+    """Node ids to run for a change set, with the reason for the decision."""
+    if any(path in RUN_ALL_FILES for path in changes):
+        return list(nodeids), "framework configuration changed"
+
+    units = changed_units({p: l for p, l in changes.items() if p.startswith(TRACKED_DIRS)}, root)
+    changed_files = set(changes)
+
+    selected = []
+    for nodeid in nodeids:
+        test_file = nodeid.split("::", 1)[0]
+        functions = impact.get(nodeid)
+        if functions is None or test_file in changed_files:
+            selected.append(nodeid)
+        elif any(_touches(f, u) for f in _with_shared(functions, shared or {}) for u in units):
+            selected.append(nodeid)
+    return selected, f"{len(units)} changed page-object/utils unit(s)"
@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+
+from filelock import FileLock
+
+
+class TimeoutHistory:
+    """Records how long each locator took to satisfy a wait and derives timeouts from that history.
+
+    Samples are merged into a JSON file at session end (under a file lock, so xdist workers
+    do not lose each other's samples). With `adaptive` on, a wait's timeout becomes
+    p99 * safety_factor of its history, clamped to [min_timeout, max_timeout].
+    """
+
+    def __init__(
+        self,
+        path: str,
+        adaptive: bool = False,
+        safety_factor: float = 3.0,
+        min_timeout: float = 0.5,
+        max_timeout: float = 30.0,
+        min_samples: int = 5,
+        max_samples: int = 200,
+    ):
+        self.path = path
+        self.adaptive = adaptive
+        self.safety_factor = safety_factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self._history = self._load()
+        self._new: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    # -------------------------
+    # Recording / lookup
+    # -------------------------
+    @staticmethod
+    def key(condition: str, locator) -> str:
+        """History key for a condition on a locator."""
+        by, value = locator
+        return f"{condition}|{by}|{value}"
+
+    def record(self, condition: str, locator, seconds: float) -> None:
+        """Stores the time a satisfied wait took."""
+        with self._lock:
+            self._new.setdefault(self.key(condition, locator), []).append(round(seconds, 4))
+
+    def timeout_for(self, condition: str, locator, default: float) -> float:
+        """Returns the learned timeout, or `default` when adaptive mode is off or history is thin."""
+        if not self.adaptive or not default:
+            return default
+
+        samples = self._samples(self.key(condition, locator))
+        if len(samples) < self.min_samples:
+            return default
+
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return min(max(p99 * self.safety_factor, self.min_timeout), self.max_timeout)
+
+    def _samples(self, key: str) -> list[float]:
+        """Sorted historical + current-session samples for a key."""
+        with self._lock:
+            return sorted(self._history.get(key, []) + self._new.get(key, []))
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def save(self) -> None:
+        """Merges this session's samples into the history file (keeps the newest max_samples per key)."""
+        with self._lock:
+            new, self._new = self._new, {}
+        if not new:
+            return
+
+        with FileLock(self.path + ".lock", timeout=60):
+            merged = self._load()
+            for key, samples in new.items():
+                merged[key] = (merged.get(key, []) + samples)[-self.max_samples:]
+
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(merged, f)
+            os.replace(tmp_path, self.path)
+        self._history = merged
+
+    def _load(self) -> dict[str, list[float]]:
+        """Reads the history file (empty when missing or unreadable)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}